@@ -0,0 +1,57 @@
+"""Benchmark startup and page load of the fast launch profile against default options
+
+Run with a local Chrome and/or Firefox installed:
+
+    python -m benchmarks.bench_fast_profile --browser chrome --runs 5
+"""
+
+import argparse
+import pathlib
+import statistics
+import time
+
+from webserpent.driver_management.browser_options import BrowserChoice, BrowserOptions
+from webserpent.driver_management.driver_factory import get_local
+
+FIXTURE = (pathlib.Path(__file__).parent / "fixtures" / "article.html").resolve().as_uri()
+
+
+def _build_options(browser_choice: BrowserChoice, fast: bool):
+    builder = BrowserOptions(browser_choice)
+    builder.make_headless()
+    if fast:
+        builder.apply_fast_profile()
+    return builder.get()
+
+
+def _measure(browser_choice: BrowserChoice, fast: bool, runs: int):
+    startups = []
+    loads = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        driver = get_local(_build_options(browser_choice, fast))
+        startups.append(time.perf_counter() - start)
+        try:
+            start = time.perf_counter()
+            driver.get(FIXTURE)
+            loads.append(time.perf_counter() - start)
+        finally:
+            driver.quit()
+    return statistics.median(startups), statistics.median(loads)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--browser", choices=["chrome", "firefox"], default="chrome")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    browser_choice = BrowserChoice(args.browser)
+
+    print(f"{'profile':<10}{'startup (s)':>14}{'page load (s)':>16}")
+    for label, fast in (("default", False), ("fast", True)):
+        startup, load = _measure(browser_choice, fast, args.runs)
+        print(f"{label:<10}{startup:>14.3f}{load:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark click latency of the default click against the smart click
+
+Run with a local Chrome and/or Firefox installed:
+
+    python -m benchmarks.bench_smart_click --browser chrome --clicks 50
+"""
+
+import argparse
+import pathlib
+import statistics
+import time
+
+from selenium.webdriver.common.by import By
+
+from webserpent.driver_management.browser_options import BrowserChoice, BrowserOptions
+from webserpent.driver_management.driver_factory import get_local
+from webserpent.pom.page import page
+
+FIXTURE = (pathlib.Path(__file__).parent / "fixtures" / "buttons.html").resolve().as_uri()
+
+
+def _measure(driver, button_id: str, smart: bool, clicks: int) -> float:
+    driver.get(FIXTURE)
+    element = page(driver).find_element((By.ID, button_id), button_id)
+    timings = []
+    for _ in range(clicks):
+        # put the below-the-fold button out of view again before every click
+        driver.execute_script("window.scrollTo(0, 0);")
+        start = time.perf_counter()
+        element.click(smart=smart)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--browser", choices=["chrome", "firefox"], default="chrome")
+    parser.add_argument("--clicks", type=int, default=50)
+    args = parser.parse_args()
+
+    builder = BrowserOptions(BrowserChoice(args.browser))
+    builder.make_headless()
+    driver = get_local(builder.get())
+    try:
+        print(f"{'button':<12}{'default (ms)':>14}{'smart (ms)':>12}")
+        for button_id in ("visible", "below-fold"):
+            default = _measure(driver, button_id, False, args.clicks)
+            smart = _measure(driver, button_id, True, args.clicks)
+            print(f"{button_id:<12}{default * 1000:>14.1f}{smart * 1000:>12.1f}")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
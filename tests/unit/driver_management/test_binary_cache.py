@@ -0,0 +1,91 @@
+import json
+
+import pytest
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.safari.options import Options as SafariOptions
+
+from webserpent.driver_management.binary_cache import BinaryCache
+
+
+@pytest.fixture
+def binaries(tmp_path):
+    driver_path = tmp_path / 'chromedriver'
+    browser_path = tmp_path / 'chrome'
+    driver_path.write_text('driver')
+    browser_path.write_text('browser')
+    return str(driver_path), str(browser_path)
+
+
+@pytest.fixture
+def mock_finder(mocker, binaries):
+    finder = mocker.patch('webserpent.driver_management.binary_cache.DriverFinder')
+    finder.return_value.get_driver_path.return_value = binaries[0]
+    finder.return_value.get_browser_path.return_value = binaries[1]
+    return finder
+
+
+def test_resolve_persists_and_reuses_paths(tmp_path, binaries, mock_finder):
+    cache_path = tmp_path / 'cache' / 'binaries.json'
+
+    assert BinaryCache(str(cache_path)).resolve(ChromeOptions()) == binaries
+    assert BinaryCache(str(cache_path)).resolve(ChromeOptions()) == binaries
+
+    mock_finder.assert_called_once()
+    assert 'chrome:stable:' in json.loads(cache_path.read_text())
+
+
+def test_resolve_refreshes_when_binary_changes(tmp_path, binaries, mock_finder):
+    cache = BinaryCache(str(tmp_path / 'binaries.json'))
+    cache.resolve(ChromeOptions())
+
+    with open(binaries[0], 'a', encoding='utf-8') as driver_file:
+        driver_file.write('updated driver')
+    cache.resolve(ChromeOptions())
+
+    assert mock_finder.call_count == 2
+
+
+def test_entries_are_keyed_by_version(tmp_path, mock_finder):
+    cache = BinaryCache(str(tmp_path / 'binaries.json'))
+    pinned = ChromeOptions()
+    pinned.browser_version = '120'
+
+    cache.resolve(ChromeOptions())
+    cache.resolve(pinned)
+
+    assert mock_finder.call_count == 2
+
+
+@pytest.mark.parametrize('browser_options, service_class', [
+    (ChromeOptions(), ChromeService),
+    (FirefoxOptions(), FirefoxService),
+])
+def test_prepare_builds_service_without_touching_options(
+    tmp_path, binaries, mock_finder, browser_options, service_class
+):
+    cache = BinaryCache(str(tmp_path / 'binaries.json'))
+
+    options, service = cache.prepare(browser_options)
+
+    assert isinstance(service, service_class)
+    assert service.path == binaries[0]
+    assert options.binary_location == binaries[1]
+    assert options is not browser_options
+    assert not browser_options.binary_location
+
+
+def test_prepare_rejects_safari(tmp_path):
+    with pytest.raises(TypeError):
+        BinaryCache(str(tmp_path / 'binaries.json')).prepare(SafariOptions())
+
+
+def test_clear_forgets_entries(tmp_path, mock_finder):
+    cache = BinaryCache(str(tmp_path / 'binaries.json'))
+    cache.resolve(ChromeOptions())
+    cache.clear()
+    cache.resolve(ChromeOptions())
+
+    assert mock_finder.call_count == 2
@@ -1,5 +1,7 @@
 import pytest
-from webserpent.driver_management.browser_options import BrowserOptions, BrowserChoice, UnhandledAlertChoice
+from webserpent.driver_management.browser_options import (
+    BrowserOptions, BrowserChoice, UnhandledAlertChoice, ResourceType, blocked_urls, profile_snapshot
+)
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.safari.options import Options as SafariOptions
@@ -230,4 +232,150 @@ def test_enable_experimental_webdriver_features(browser_options, option):
 def test_get(browser_options, option_type):
     result = browser_options.get()
 
-    assert isinstance(result, option_type)
\ No newline at end of file
+    assert isinstance(result, option_type)
+
+@pytest.mark.parametrize("browser_options", [
+    BrowserChoice.CHROME,
+    BrowserChoice.FIREFOX,
+    BrowserChoice.SAFARI,
+], indirect=["browser_options"])
+def test_apply_fast_profile(browser_options):
+    browser_options.apply_fast_profile()
+    options = browser_options._options
+
+    if isinstance(options, ChromeOptions):
+        assert '--disable-background-networking' in options.arguments
+        assert '--disable-renderer-backgrounding' in options.arguments
+        assert '--no-first-run' in options.arguments
+        assert options.experimental_options['prefs']['translate'] == {'enabled': False}
+    elif isinstance(options, FirefoxOptions):
+        assert options.preferences['app.update.auto'] is False
+        assert options.preferences['browser.shell.checkDefaultBrowser'] is False
+    else:
+        options.add_argument.assert_not_called()
+
+
+@pytest.mark.parametrize("browser_options", [BrowserChoice.CHROME], indirect=["browser_options"])
+def test_chrome_prefs_are_merged(browser_options):
+    browser_options.set_disabling_notifications()
+    browser_options.apply_fast_profile()
+    browser_options.apply_fast_profile()
+    prefs = browser_options._options.experimental_options['prefs']
+
+    assert prefs['profile.default_content_setting_values.notifications'] == 2
+    assert prefs['credentials_enable_service'] is False
+    assert browser_options._options.arguments.count('--no-first-run') == 1
+
+
+@pytest.mark.parametrize("browser_options", [
+    BrowserChoice.CHROME,
+    BrowserChoice.FIREFOX,
+    BrowserChoice.SAFARI,
+], indirect=["browser_options"])
+def test_block_resources(browser_options):
+    browser_options.block_resources(ResourceType.IMAGES, ResourceType.FONTS)
+    options = browser_options._options
+
+    if isinstance(options, ChromeOptions):
+        prefs = options.experimental_options['prefs']
+        assert prefs['profile.managed_default_content_settings.images'] == 2
+        assert '*.woff2' in blocked_urls(options)
+    elif isinstance(options, FirefoxOptions):
+        assert options.preferences['permissions.default.image'] == 2
+        assert options.preferences['gfx.downloadable_fonts.enabled'] is False
+    else:
+        assert blocked_urls(options) == []
+
+
+@pytest.mark.parametrize("browser_options", [BrowserChoice.CHROME], indirect=True)
+def test_block_urls(browser_options):
+    browser_options.block_urls(['*analytics*'])
+    browser_options.block_urls(['*analytics*', '*.png'])
+
+    assert blocked_urls(browser_options._options) == ['*analytics*', '*.png']
+    assert not any('blocked' in key for key in browser_options._options.to_capabilities())
+
+
+@pytest.mark.parametrize("browser_options", [
+    BrowserChoice.FIREFOX,
+    BrowserChoice.SAFARI,
+], indirect=True)
+def test_block_urls_warns_on_other_browsers(browser_options):
+    with pytest.warns(UserWarning, match='not supported'):
+        browser_options.block_urls(['*analytics*'])
+
+    assert blocked_urls(browser_options._options) == []
+
+
+@pytest.mark.parametrize("browser_choice", [
+    BrowserChoice.CHROME,
+    BrowserChoice.FIREFOX,
+    BrowserChoice.SAFARI,
+])
+def test_to_dict_and_from_dict_round_trip(browser_choice):
+    builder = BrowserOptions(browser_choice)
+    builder.make_headless()
+    builder.set_window_size({'width': 800, 'height': 600})
+    builder.set_unhandled_alerts(UnhandledAlertChoice.DISMISS)
+    builder.set_ignore_ssl_errors()
+    builder.set_disabling_notifications()
+    if browser_choice is BrowserChoice.CHROME:
+        builder.block_urls(['*analytics*'])
+    if browser_choice is not BrowserChoice.SAFARI:
+        builder.use_profile_snapshot('/tmp/golden')
+
+    restored = BrowserOptions.from_dict(builder.to_dict())
+
+    assert restored.to_dict() == builder.to_dict()
+    assert type(restored.get()) is type(builder.get())
+    assert blocked_urls(restored.get()) == blocked_urls(builder.get())
+    assert profile_snapshot(restored.get()) == profile_snapshot(builder.get())
+
+
+@pytest.mark.parametrize("browser_options", [
+    BrowserChoice.CHROME,
+    BrowserChoice.FIREFOX,
+], indirect=True)
+def test_use_profile_snapshot_stays_off_capabilities(browser_options):
+    browser_options.use_profile_snapshot('/tmp/golden')
+
+    assert profile_snapshot(browser_options._options) == '/tmp/golden'
+    assert '/tmp/golden' not in str(browser_options._options.to_capabilities())
+
+
+def test_to_json_and_from_json_round_trip(tmp_path):
+    builder = BrowserOptions(BrowserChoice.CHROME)
+    builder.apply_fast_profile()
+    path = tmp_path / 'options.json'
+
+    content = builder.to_json(str(path))
+
+    assert BrowserOptions.from_json(content).to_dict() == builder.to_dict()
+    assert BrowserOptions.from_json(str(path)).to_dict() == builder.to_dict()
+
+
+def test_to_dict_is_detached_from_builder():
+    builder = BrowserOptions(BrowserChoice.CHROME)
+    exported = builder.to_dict()
+    builder.make_headless()
+
+    assert exported['capabilities']['goog:chromeOptions']['args'] == []
+
+
+def test_from_dict_rejects_unknown_firefox_options():
+    data = BrowserOptions(BrowserChoice.FIREFOX).to_dict()
+    data['capabilities']['moz:firefoxOptions']['profile'] = 'encoded profile'
+
+    with pytest.raises(ValueError):
+        BrowserOptions.from_dict(data)
+
+
+@pytest.mark.parametrize("browser_options, expected", [
+    (BrowserChoice.CHROME, ['--user-data-dir=/profiles/golden']),
+    (BrowserChoice.FIREFOX, ['-profile', '/profiles/golden']),
+    (BrowserChoice.SAFARI, []),
+], indirect=["browser_options"])
+def test_use_profile(browser_options, expected):
+    browser_options.use_profile('/profiles/golden')
+
+    assert browser_options._options.arguments == expected
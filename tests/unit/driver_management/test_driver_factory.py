@@ -1,7 +1,9 @@
 import pytest
 from unittest.mock import MagicMock, patch
 
-from webserpent.driver_management.driver_factory import get_local
+from webserpent.driver_management.driver_factory import get_local, get_local_many
+from webserpent.driver_management.browser_options import BrowserChoice, BrowserOptions
+from selenium.common.exceptions import SessionNotCreatedException, WebDriverException
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.safari.options import Options as SafariOptions
@@ -38,3 +40,126 @@ def test_get_local_returns_proper_driver(browser_options):
             assert result == mock_safari_driver.return_value
         else:
             pytest.fail("Unsupported browser option provided")
+
+
+def test_get_local_many_launches_n_drivers(mocker):
+    mock_get_local = mocker.patch('webserpent.driver_management.driver_factory.get_local')
+    options = ChromeOptions()
+
+    drivers, failures = get_local_many(options, 4, max_workers=2)
+
+    assert mock_get_local.call_count == 4
+    mock_get_local.assert_called_with(options, None)
+    assert len(drivers) == 4
+    assert failures == []
+
+
+def test_get_local_many_reports_failures(mocker):
+    error = SessionNotCreatedException('no session')
+    mock_driver = MagicMock(name="MockChromeDriver")
+    mocker.patch(
+        'webserpent.driver_management.driver_factory.get_local',
+        side_effect=[mock_driver, error, mock_driver],
+    )
+
+    drivers, failures = get_local_many(ChromeOptions(), 3, max_workers=1)
+
+    assert drivers == [mock_driver, mock_driver]
+    assert failures == [error]
+
+
+def test_get_local_many_with_zero_drivers(mocker):
+    mock_get_local = mocker.patch('webserpent.driver_management.driver_factory.get_local')
+
+    assert get_local_many(ChromeOptions(), 0) == ([], [])
+    mock_get_local.assert_not_called()
+
+
+@pytest.mark.parametrize('browser_options, driver_name', [
+    (ChromeOptions(), 'Chrome'),
+    (FirefoxOptions(), 'Firefox'),
+])
+def test_get_local_uses_binary_cache(mocker, browser_options, driver_name):
+    mock_driver = mocker.patch(f'selenium.webdriver.{driver_name}')
+    cache = mocker.Mock()
+    cache.prepare.return_value = ('prepared options', 'service')
+
+    result = get_local(browser_options, binary_cache=cache)
+
+    cache.prepare.assert_called_once_with(browser_options)
+    mock_driver.assert_called_once_with(options='prepared options', service='service')
+    assert result == mock_driver.return_value
+
+
+def test_get_local_applies_blocked_urls(mocker):
+    mock_chrome = mocker.patch('selenium.webdriver.Chrome')
+    builder = BrowserOptions(BrowserChoice.CHROME)
+    builder.block_urls(['*analytics*'])
+
+    driver = get_local(builder.get())
+
+    driver.execute_cdp_cmd.assert_has_calls([
+        mocker.call('Network.enable', {}),
+        mocker.call('Network.setBlockedURLs', {'urls': ['*analytics*']}),
+    ])
+    assert driver == mock_chrome.return_value
+
+
+def test_get_local_without_block_list_skips_cdp(mocker):
+    mocker.patch('selenium.webdriver.Chrome')
+
+    driver = get_local(ChromeOptions())
+
+    driver.execute_cdp_cmd.assert_not_called()
+
+
+@pytest.mark.parametrize('browser_choice, driver_name, expected_arguments', [
+    (BrowserChoice.CHROME, 'Chrome', ['--user-data-dir=/tmp/clone']),
+    (BrowserChoice.FIREFOX, 'Firefox', ['-profile', '/tmp/clone']),
+])
+def test_get_local_clones_profile_snapshot(mocker, browser_choice, driver_name, expected_arguments):
+    mock_driver = mocker.patch(f'selenium.webdriver.{driver_name}')
+    mock_clone = mocker.patch(
+        'webserpent.driver_management.driver_factory.clone_profile', return_value='/tmp/clone'
+    )
+    builder = BrowserOptions(browser_choice)
+    builder.use_profile_snapshot('/tmp/golden')
+    options = builder.get()
+
+    get_local(options)
+
+    mock_clone.assert_called_once_with('/tmp/golden')
+    launched = mock_driver.call_args.kwargs['options']
+    assert launched.arguments == expected_arguments
+    assert options.arguments == []
+
+
+def test_get_local_removes_profile_clone_on_quit(mocker, tmp_path):
+    mock_chrome = mocker.patch('selenium.webdriver.Chrome')
+    original_quit = mock_chrome.return_value.quit
+    clone = tmp_path / 'clone'
+    clone.mkdir()
+    mocker.patch(
+        'webserpent.driver_management.driver_factory.clone_profile', return_value=str(clone)
+    )
+    builder = BrowserOptions(BrowserChoice.CHROME)
+    builder.use_profile_snapshot(str(tmp_path / 'golden'))
+
+    driver = get_local(builder.get())
+    assert clone.exists()
+    driver.quit()
+
+    original_quit.assert_called_once()
+    assert not clone.exists()
+
+
+def test_get_local_quits_driver_when_blocking_fails(mocker):
+    mock_chrome = mocker.patch('selenium.webdriver.Chrome')
+    mock_chrome.return_value.execute_cdp_cmd.side_effect = WebDriverException('no cdp')
+    builder = BrowserOptions(BrowserChoice.CHROME)
+    builder.block_urls(['*analytics*'])
+
+    with pytest.raises(WebDriverException):
+        get_local(builder.get())
+
+    mock_chrome.return_value.quit.assert_called_once()
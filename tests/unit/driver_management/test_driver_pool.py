@@ -0,0 +1,237 @@
+import threading
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from webserpent.driver_management.browser_options import BrowserChoice, BrowserOptions
+from webserpent.driver_management.driver_pool import DriverPool, _default_reset, options_key
+from webserpent.driver_management.recycle_policy import RecyclePolicy
+
+
+@pytest.fixture
+def factory(mocker):
+    return mocker.Mock(side_effect=lambda _: mocker.Mock(spec=WebDriver))
+
+
+@pytest.fixture
+def reset(mocker):
+    return mocker.Mock()
+
+
+def test_options_key_matches_equal_configurations():
+    first = ChromeOptions()
+    first.add_argument('--headless')
+    second = ChromeOptions()
+    second.add_argument('--headless')
+
+    assert options_key(first) == options_key(second)
+    assert options_key(first) != options_key(ChromeOptions())
+    assert options_key(ChromeOptions()) != options_key(FirefoxOptions())
+
+
+def blocking_options(patterns):
+    builder = BrowserOptions(BrowserChoice.CHROME)
+    builder.block_urls(patterns)
+    return builder.get()
+
+
+def test_options_key_tells_blocked_urls_apart():
+    assert options_key(blocking_options(['*ads*'])) != options_key(blocking_options([]))
+    assert options_key(blocking_options(['*ads*'])) == options_key(blocking_options(['*ads*']))
+
+
+def test_options_key_tells_profile_snapshots_apart():
+    builder = BrowserOptions(BrowserChoice.CHROME)
+    builder.use_profile_snapshot('/tmp/golden')
+
+    assert options_key(builder.get()) != options_key(blocking_options([]))
+
+
+def test_pool_keeps_blocked_urls_configurations_apart(factory, reset):
+    plain = blocking_options([])
+    blocking = blocking_options(['*ads*'])
+    with DriverPool(size=1, factory=factory, reset=reset) as pool:
+        with pool.lease(plain, timeout=5) as plain_driver:
+            pass
+        with pool.lease(blocking, timeout=5) as blocking_driver:
+            pass
+
+    assert blocking_driver is not plain_driver
+    assert [call.args[0] for call in factory.call_args_list] == [plain, blocking]
+
+
+def test_pool_size_must_be_positive(factory):
+    with pytest.raises(ValueError):
+        DriverPool(size=0, factory=factory)
+
+
+def test_acquire_returns_launched_driver_and_refills(factory, reset):
+    options = ChromeOptions()
+    with DriverPool(size=2, factory=factory, reset=reset) as pool:
+        driver = pool.acquire(options, timeout=5)
+        pool.warm(options)
+        pool.release(driver)
+
+    assert factory.call_count == 2
+    factory.assert_called_with(options)
+    reset.assert_called_once_with(driver)
+
+
+def test_released_driver_is_leased_again(factory, reset):
+    options = ChromeOptions()
+    with DriverPool(size=1, factory=factory, reset=reset) as pool:
+        driver = pool.acquire(options, timeout=5)
+        pool.release(driver)
+
+        assert pool.acquire(options, timeout=5) is driver
+        assert factory.call_count == 1
+        driver.quit.assert_not_called()
+
+
+def test_sequential_leases_reuse_pooled_drivers(factory, reset):
+    options = ChromeOptions()
+    with DriverPool(size=2, factory=factory, reset=reset) as pool:
+        drivers = set()
+        for _ in range(5):
+            with pool.lease(options, timeout=5) as driver:
+                drivers.add(driver)
+
+        assert factory.call_count == 2
+        assert reset.call_count == 5
+        assert all(not driver.quit.called for driver in drivers)
+
+
+def test_lease_releases_driver(factory, reset):
+    options = ChromeOptions()
+    with DriverPool(size=1, factory=factory, reset=reset) as pool:
+        with pool.lease(options, timeout=5) as driver:
+            reset.assert_not_called()
+
+        reset.assert_called_once_with(driver)
+        with pytest.raises(ValueError):
+            pool.release(driver)
+
+
+def test_release_discards_driver_when_reset_fails(factory, reset):
+    reset.side_effect = WebDriverException
+    options = ChromeOptions()
+    with DriverPool(size=1, factory=factory, reset=reset) as pool:
+        driver = pool.acquire(options, timeout=5)
+        pool.release(driver)
+        replacement = pool.acquire(options, timeout=5)
+
+        assert replacement is not driver
+        driver.quit.assert_called_once()
+
+
+def test_release_unknown_driver_raises(factory, mocker):
+    with DriverPool(size=1, factory=factory) as pool:
+        with pytest.raises(ValueError):
+            pool.release(mocker.Mock(spec=WebDriver))
+
+
+def test_acquire_raises_launch_error(mocker):
+    factory = mocker.Mock(side_effect=WebDriverException('no browser'))
+    with DriverPool(size=1, factory=factory) as pool:
+        with pytest.raises(WebDriverException, match='no browser'):
+            pool.acquire(ChromeOptions(), timeout=5)
+
+
+def test_acquire_times_out(mocker):
+    gate = threading.Event()
+    factory = mocker.Mock(side_effect=lambda _: gate.wait())
+    pool = DriverPool(size=1, factory=factory)
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(ChromeOptions(), timeout=0.05)
+
+    gate.set()
+    pool.close()
+
+
+def test_close_quits_idle_drivers(factory, reset):
+    options = ChromeOptions()
+    pool = DriverPool(size=1, factory=factory, reset=reset)
+    driver = pool.acquire(options, timeout=5)
+    pool.release(driver)
+    pool.close()
+
+    driver.quit.assert_called_once()
+    with pytest.raises(RuntimeError):
+        pool.acquire(options)
+
+
+def test_default_reset_uses_session_reset(mocker):
+    mock_reset = mocker.patch('webserpent.driver_management.driver_pool.reset_session')
+    driver = mocker.Mock(spec=WebDriver)
+
+    _default_reset(driver)
+
+    mock_reset.assert_called_once_with(driver)
+
+
+def test_driver_retired_after_max_uses(factory, reset):
+    options = ChromeOptions()
+    policy = RecyclePolicy(max_uses=1)
+    with DriverPool(size=1, factory=factory, reset=reset, recycle_policy=policy) as pool:
+        driver = pool.acquire(options, timeout=5)
+        # the replacement is launched while the final lease is still running
+        replacement = pool.acquire(options, timeout=5)
+        pool.release(driver)
+        pool.release(replacement)
+
+    assert replacement is not driver
+    driver.quit.assert_called_once()
+    reset.assert_not_called()
+
+
+def test_driver_retired_when_over_memory(mocker, factory, reset):
+    policy = RecyclePolicy(max_rss_mb=1)
+    mocker.patch.object(policy, 'rss_ratio', return_value=1.5)
+    with DriverPool(size=1, factory=factory, reset=reset, recycle_policy=policy) as pool:
+        driver = pool.acquire(ChromeOptions(), timeout=5)
+        pool.release(driver)
+
+    driver.quit.assert_called_once()
+    reset.assert_not_called()
+
+
+def test_replacement_launched_past_soft_memory_limit(mocker, reset):
+    options = ChromeOptions()
+    first = mocker.Mock(spec=WebDriver)
+    gate = threading.Event()
+    launches = iter([first])
+    factory = mocker.Mock(side_effect=lambda _: next(launches, None) or (
+        gate.wait(5) and mocker.Mock(spec=WebDriver)
+    ))
+    policy = RecyclePolicy(max_rss_mb=1)
+    mocker.patch.object(policy, 'rss_ratio', return_value=0.9)
+    with DriverPool(size=1, factory=factory, reset=reset, recycle_policy=policy) as pool:
+        assert pool.acquire(options, timeout=5) is first
+        pool.release(first)
+        gate.set()
+        # the driver gets one more lease, a replacement launches meanwhile
+        assert pool.acquire(options, timeout=5) is first
+        pool.release(first)
+        replacement = pool.acquire(options, timeout=5)
+
+        assert replacement is not first
+        reset.assert_called_once_with(first)
+    first.quit.assert_called_once()
+    assert factory.call_count == 2
+
+
+def test_release_quits_driver_when_reset_breaks(factory, reset):
+    reset.side_effect = RuntimeError('bug in reset')
+    options = ChromeOptions()
+    with DriverPool(size=1, factory=factory, reset=reset) as pool:
+        driver = pool.acquire(options, timeout=5)
+        with pytest.raises(RuntimeError):
+            pool.release(driver)
+        replacement = pool.acquire(options, timeout=5)
+
+        assert replacement is not driver
+    driver.quit.assert_called_once()
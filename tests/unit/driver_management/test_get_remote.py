@@ -0,0 +1,130 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+from webserpent.driver_management.browser_options import BrowserChoice, BrowserOptions
+from webserpent.driver_management.driver_factory import close_remote_connections, get_remote
+
+
+class _StandInDriverHandler(BaseHTTPRequestHandler):
+    """Answers the few W3C WebDriver commands the tests send"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, value):
+        body = json.dumps({'value': value}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _record(self):
+        self.server.connections.add(self.client_address)
+        length = int(self.headers.get('Content-Length', 0))
+        return json.loads(self.rfile.read(length) or b'{}')
+
+    def do_POST(self):
+        payload = self._record()
+        if self.path.endswith('/cdp/execute'):
+            self.server.cdp_commands.append((payload['cmd'], payload['params']))
+            self._reply({})
+            return
+        self.server.session_count += 1
+        browser = payload['capabilities']['alwaysMatch']['browserName']
+        self._reply({
+            'sessionId': f'session-{self.server.session_count}',
+            'capabilities': {'browserName': browser},
+        })
+
+    def do_GET(self):
+        self._record()
+        self._reply('about:blank')
+
+    def do_DELETE(self):
+        self._record()
+        self._reply(None)
+
+
+@pytest.fixture
+def stand_in_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _StandInDriverHandler)
+    server.connections = set()
+    server.session_count = 0
+    server.cdp_commands = []
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    close_remote_connections()
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server):
+    return f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def test_get_remote_starts_session(stand_in_server):
+    driver = get_remote(_url(stand_in_server), ChromeOptions())
+
+    assert driver.session_id == 'session-1'
+    assert driver.current_url == 'about:blank'
+    driver.quit()
+
+
+def test_sessions_share_one_keep_alive_connection(stand_in_server):
+    url = _url(stand_in_server)
+
+    first = get_remote(url, ChromeOptions(), pool_size=2, timeout=5)
+    first.quit()
+    second = get_remote(url, FirefoxOptions(), pool_size=2, timeout=5)
+    _ = second.current_url
+    second.quit()
+
+    assert first.command_executor is second.command_executor
+    assert len(stand_in_server.connections) == 1
+
+
+def test_different_settings_use_separate_connections(stand_in_server):
+    url = _url(stand_in_server)
+
+    first = get_remote(url, ChromeOptions(), pool_size=2)
+    second = get_remote(url, ChromeOptions(), pool_size=4)
+
+    assert first.command_executor is not second.command_executor
+
+
+def test_get_remote_rejects_unknown_options():
+    with pytest.raises(TypeError):
+        get_remote('http://127.0.0.1:1', object())
+
+
+def test_get_remote_warns_about_profile_snapshot(stand_in_server):
+    builder = BrowserOptions(BrowserChoice.CHROME)
+    builder.use_profile_snapshot('/tmp/golden')
+
+    with pytest.warns(UserWarning, match='profile snapshot'):
+        driver = get_remote(_url(stand_in_server), builder.get())
+
+    assert stand_in_server.session_count == 1
+    driver.quit()
+
+
+def test_get_remote_applies_blocked_urls(stand_in_server):
+    builder = BrowserOptions(BrowserChoice.CHROME)
+    builder.block_urls(['*analytics*'])
+
+    driver = get_remote(_url(stand_in_server), builder.get())
+
+    assert stand_in_server.cdp_commands == [
+        ('Network.enable', {}),
+        ('Network.setBlockedURLs', {'urls': ['*analytics*']}),
+    ]
+    driver.quit()
@@ -0,0 +1,65 @@
+import pytest
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+from webserpent.driver_management.browser_options import BrowserChoice, BrowserOptions
+from webserpent.driver_management.presets import (
+    clear_presets,
+    export_presets,
+    get_preset,
+    list_presets,
+    load_presets,
+    register_preset,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    clear_presets()
+    yield
+    clear_presets()
+
+
+@pytest.fixture
+def headless_chrome():
+    builder = BrowserOptions(BrowserChoice.CHROME)
+    builder.make_headless()
+    return builder
+
+
+def test_get_preset_builds_once(headless_chrome):
+    register_preset('ci', headless_chrome)
+
+    options = get_preset('ci')
+
+    assert isinstance(options, ChromeOptions)
+    assert '--headless' in options.arguments
+    assert get_preset('ci') is options
+
+
+def test_register_replaces_cached_preset(headless_chrome):
+    register_preset('ci', headless_chrome)
+    first = get_preset('ci')
+
+    register_preset('ci', BrowserOptions(BrowserChoice.FIREFOX))
+
+    assert isinstance(get_preset('ci'), FirefoxOptions)
+    assert get_preset('ci') is not first
+
+
+def test_unknown_preset_raises():
+    with pytest.raises(KeyError):
+        get_preset('missing')
+
+
+def test_export_and_load_presets(tmp_path, headless_chrome):
+    path = str(tmp_path / 'presets.json')
+    register_preset('ci', headless_chrome)
+    register_preset('firefox', BrowserOptions(BrowserChoice.FIREFOX).to_dict())
+    export_presets(path)
+    clear_presets()
+
+    load_presets(path)
+
+    assert list_presets() == ['ci', 'firefox']
+    assert get_preset('ci').arguments == ['--headless']
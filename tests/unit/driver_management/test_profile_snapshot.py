@@ -0,0 +1,70 @@
+import os
+
+import pytest
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from webserpent.driver_management.browser_options import BrowserChoice, BrowserOptions
+from webserpent.driver_management.profile_snapshot import clone_profile, warm_profile
+
+
+@pytest.fixture
+def golden_dir(tmp_path):
+    golden = tmp_path / 'golden'
+    (golden / 'Default' / 'Cache').mkdir(parents=True)
+    (golden / 'Default' / 'Cache' / 'entry').write_text('cached response')
+    (golden / 'Local State').write_text('{}')
+    os.symlink('host-1234', golden / 'SingletonLock')
+    return golden
+
+
+def test_clone_profile_copies_everything_but_locks(golden_dir, tmp_path):
+    dest = clone_profile(str(golden_dir), str(tmp_path / 'clone'))
+
+    assert (tmp_path / 'clone' / 'Default' / 'Cache' / 'entry').read_text() == 'cached response'
+    assert (tmp_path / 'clone' / 'Local State').exists()
+    assert not os.path.lexists(os.path.join(dest, 'SingletonLock'))
+    assert os.path.lexists(golden_dir / 'SingletonLock')
+
+
+def test_clone_profile_defaults_to_temporary_directory(golden_dir):
+    dest = clone_profile(str(golden_dir))
+
+    assert os.path.basename(dest).startswith('webserpent-profile-')
+    assert os.path.exists(os.path.join(dest, 'Local State'))
+
+
+def test_clone_profile_fallback_drops_partial_reflink(mocker, golden_dir, tmp_path):
+    dest = tmp_path / 'clone'
+
+    def partial_reflink(source, target):
+        (tmp_path / 'clone' / 'half-written').write_text('partial')
+        return False
+
+    mocker.patch(
+        'webserpent.driver_management.profile_snapshot._reflink_copy', side_effect=partial_reflink
+    )
+
+    clone_profile(str(golden_dir), str(dest))
+
+    assert not (dest / 'half-written').exists()
+    assert (dest / 'Local State').exists()
+
+
+def test_clone_profile_without_golden_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        clone_profile(str(tmp_path / 'missing'))
+
+
+def test_warm_profile_visits_urls_with_golden_profile(mocker, tmp_path):
+    driver = mocker.Mock(spec=WebDriver)
+    factory = mocker.Mock(return_value=driver)
+    builder = BrowserOptions(BrowserChoice.CHROME)
+    golden = str(tmp_path / 'golden')
+
+    warm_profile(builder, golden, ['https://a.test', 'https://b.test'], factory=factory)
+
+    options = factory.call_args.args[0]
+    assert f'--user-data-dir={golden}' in options.arguments
+    assert builder.get().arguments == []
+    driver.get.assert_has_calls([mocker.call('https://a.test'), mocker.call('https://b.test')])
+    driver.quit.assert_called_once()
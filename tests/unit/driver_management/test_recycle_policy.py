@@ -0,0 +1,65 @@
+import pytest
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from webserpent.driver_management.recycle_policy import RecyclePolicy, browser_rss_bytes
+
+
+def _write_process(proc_root, pid, ppid, rss_kb, name='chrome'):
+    process_dir = proc_root / str(pid)
+    process_dir.mkdir()
+    (process_dir / 'stat').write_text(f'{pid} ({name}) S {ppid} 1 1 0')
+    (process_dir / 'status').write_text(f'Name:\t{name}\nVmRSS:\t{rss_kb} kB\n')
+
+
+@pytest.fixture
+def proc_root(tmp_path):
+    _write_process(tmp_path, 100, 1, 1000, 'chromedriver')
+    _write_process(tmp_path, 101, 100, 2000, 'chrome')
+    _write_process(tmp_path, 102, 101, 3000, 'chrome (renderer)')
+    _write_process(tmp_path, 200, 1, 50000, 'unrelated')
+    return tmp_path
+
+
+@pytest.fixture
+def driver(mocker):
+    mock_driver = mocker.Mock(spec=WebDriver)
+    mock_driver.service = mocker.Mock()
+    mock_driver.service.process.pid = 100
+    return mock_driver
+
+
+@pytest.mark.parametrize('policy, uses, age, expected', [
+    (RecyclePolicy(), 1000, 100000, False),
+    (RecyclePolicy(max_uses=3), 2, 0, False),
+    (RecyclePolicy(max_uses=3), 3, 0, True),
+    (RecyclePolicy(max_age_minutes=1), 1, 59, False),
+    (RecyclePolicy(max_age_minutes=1), 1, 60, True),
+])
+def test_due(policy, uses, age, expected):
+    assert policy.due(uses, age) is expected
+
+
+def test_browser_rss_sums_process_tree(proc_root, driver):
+    assert browser_rss_bytes(driver, str(proc_root)) == 6000 * 1024
+
+
+def test_browser_rss_without_service(proc_root, mocker):
+    assert browser_rss_bytes(mocker.Mock(spec=WebDriver), str(proc_root)) is None
+
+
+@pytest.mark.parametrize('max_rss_mb, expected', [
+    (None, False),
+    (5, True),
+    (10, False),
+])
+def test_over_memory(proc_root, driver, max_rss_mb, expected):
+    policy = RecyclePolicy(max_rss_mb=max_rss_mb, proc_root=str(proc_root))
+
+    assert policy.over_memory(driver) is expected
+
+
+def test_rss_ratio(proc_root, driver):
+    policy = RecyclePolicy(max_rss_mb=12, proc_root=str(proc_root))
+
+    assert policy.rss_ratio(driver) == pytest.approx(0.48828125)
+    assert RecyclePolicy(proc_root=str(proc_root)).rss_ratio(driver) is None
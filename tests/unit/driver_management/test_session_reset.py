@@ -0,0 +1,70 @@
+import pytest
+from selenium.webdriver.chromium.webdriver import ChromiumDriver
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from webserpent.driver_management.session_reset import reset_session
+
+
+@pytest.fixture
+def chromium_driver(mocker):
+    driver = mocker.MagicMock(spec=ChromiumDriver)
+    driver.window_handles = ['main', 'popup']
+    return driver
+
+
+def test_chromium_reset_clears_every_origin_through_cdp(mocker, chromium_driver):
+    type(chromium_driver).current_url = mocker.PropertyMock(side_effect=[
+        'https://popup.example.com/path', 'https://app.example.com/login?next=1',
+    ])
+
+    reset_session(chromium_driver)
+
+    assert chromium_driver.execute_cdp_cmd.call_args_list == [
+        mocker.call('Network.clearBrowserCookies', {}),
+        mocker.call(
+            'Storage.clearDataForOrigin',
+            {'origin': 'https://popup.example.com', 'storageTypes': 'all'},
+        ),
+        mocker.call(
+            'Storage.clearDataForOrigin',
+            {'origin': 'https://app.example.com', 'storageTypes': 'all'},
+        ),
+    ]
+    chromium_driver.close.assert_called_once()
+    chromium_driver.execute_async_script.assert_not_called()
+    chromium_driver.get.assert_called_once_with('about:blank')
+
+
+def test_chromium_reset_clears_session_storage_of_kept_window(mocker, chromium_driver):
+    order = []
+    chromium_driver.switch_to.window.side_effect = lambda handle: order.append(handle)
+    chromium_driver.execute_script.side_effect = lambda script: order.append('clear')
+    chromium_driver.get.side_effect = lambda url: order.append(url)
+    type(chromium_driver).current_url = mocker.PropertyMock(side_effect=[
+        'https://popup.example.com/', 'https://app.example.com/',
+    ])
+
+    reset_session(chromium_driver)
+
+    assert order == ['popup', 'main', 'clear', 'about:blank']
+    assert 'sessionStorage.clear()' in chromium_driver.execute_script.call_args.args[0]
+
+
+def test_chromium_reset_skips_pages_without_origin(mocker, chromium_driver):
+    chromium_driver.window_handles = ['main']
+    chromium_driver.current_url = 'about:blank'
+
+    reset_session(chromium_driver)
+
+    chromium_driver.execute_cdp_cmd.assert_called_once_with('Network.clearBrowserCookies', {})
+
+
+def test_other_browsers_clear_each_open_window(mocker):
+    driver = mocker.MagicMock(spec=WebDriver)
+    driver.window_handles = ['main', 'popup']
+
+    reset_session(driver)
+
+    assert driver.execute_async_script.call_count == 2
+    assert driver.delete_all_cookies.call_count == 2
+    driver.switch_to.window.assert_called_with('main')
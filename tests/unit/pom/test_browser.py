@@ -0,0 +1,40 @@
+import pytest
+from selenium.common.exceptions import JavascriptException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from webserpent.pom.browser import Browser
+
+
+@pytest.fixture
+def driver(mocker):
+    mock_driver = mocker.MagicMock(spec=WebDriver)
+    mock_driver.window_handles = ['main']
+    return mock_driver
+
+
+def test_reset_clears_state_and_goes_blank(driver):
+    elapsed = Browser(driver).reset()
+
+    driver.execute_async_script.assert_called_once()
+    driver.delete_all_cookies.assert_called_once()
+    driver.get.assert_called_once_with('about:blank')
+    driver.close.assert_not_called()
+    assert elapsed >= 0
+
+
+def test_reset_closes_extra_windows(driver):
+    driver.window_handles = ['main', 'popup', 'other']
+
+    Browser(driver).reset()
+
+    assert driver.close.call_count == 2
+    driver.switch_to.window.assert_called_with('main')
+
+
+def test_reset_ignores_pages_without_storage(driver):
+    driver.execute_async_script.side_effect = JavascriptException
+
+    Browser(driver).reset()
+
+    driver.delete_all_cookies.assert_called_once()
+    driver.get.assert_called_once_with('about:blank')
@@ -0,0 +1,204 @@
+import copy
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from webserpent.pom.fields import (
+    CollectionProxy,
+    Component,
+    ComponentField,
+    ElementField,
+    ElementProxy,
+    ElementsField,
+    _Field,
+)
+from webserpent.pom.page import page
+from webserpent.selenium.element import Element
+from webserpent.selenium.element_collection import ElementCollection
+
+
+class Header(Component):
+    search = ElementField((By.NAME, 'q'))
+
+
+class LoginPage(page):
+    login = ElementField((By.ID, 'login'), timeout=2)
+    rows = ElementsField((By.CSS_SELECTOR, 'tr'))
+    header = ComponentField(Header, (By.TAG_NAME, 'header'))
+    footer = ComponentField(Header)
+
+
+@pytest.fixture
+def driver(mocker):
+    return mocker.Mock(spec=WebDriver)
+
+
+@pytest.fixture
+def login_page(mocker, driver):
+    instance = LoginPage(driver, cache_elements=False)
+    mocker.patch.object(instance, 'find_element', side_effect=lambda locator, name, timeout=5: (
+        Element(mocker.Mock(spec=WebElement), name, locator=locator)
+    ))
+    mocker.patch.object(instance, 'find_elements', side_effect=lambda locator, name, timeout=5: (
+        ElementCollection([mocker.Mock(spec=WebElement)] * 3, name)
+    ))
+    return instance
+
+
+def test_element_field_resolves_lazily_once(login_page):
+    proxy = login_page.login
+
+    assert isinstance(proxy, ElementProxy)
+    login_page.find_element.assert_not_called()
+    assert login_page.login is proxy
+
+    assert proxy.name == 'login'
+    proxy.web_element.click()
+    login_page.find_element.assert_called_once_with((By.ID, 'login'), 'login', 2)
+
+
+def test_proxy_forwards_attribute_writes(login_page):
+    login_page.login.smart_click = True
+
+    assert login_page.login.resolve().smart_click is True
+
+
+def test_proxies_have_no_instance_dict(login_page):
+    assert type(login_page.login).__dictoffset__ == 0
+    assert type(login_page.rows).__dictoffset__ == 0
+
+
+def test_elements_field_proxies_collection(login_page):
+    assert isinstance(login_page.rows, CollectionProxy)
+    assert len(login_page.rows) == 3
+    assert [row.name for row in login_page.rows] == ['rows[0]', 'rows[1]', 'rows[2]']
+    assert login_page.rows[1].name == 'rows[1]'
+    login_page.find_elements.assert_called_once()
+
+
+def test_descriptor_on_class_returns_field():
+    assert isinstance(LoginPage.login, ElementField)
+    assert LoginPage.login.locator == (By.ID, 'login')
+
+
+def test_component_searches_below_its_root(mocker, login_page):
+    wait = mocker.patch('webserpent.pom.fields.wait_for_element_to_exist')
+
+    header = login_page.header
+    assert login_page.header is header
+    search = header.search.resolve()
+
+    root = login_page.find_element.call_args.args
+    assert root[:2] == ((By.TAG_NAME, 'header'), 'header')
+    assert wait.call_args.args[0] is header.root.web_element
+    assert search.web_element is wait.return_value
+    assert search.name == 'search'
+
+
+def test_component_without_root_uses_parent(mocker, login_page):
+    wait = mocker.patch('webserpent.pom.fields.wait_for_element_to_exist')
+
+    login_page.footer.search.resolve()
+
+    login_page.find_element.assert_called_once_with((By.NAME, 'q'), 'search', 5)
+    wait.assert_not_called()
+
+
+def test_invalidate_cache_resets_fields(login_page):
+    login_page.login.resolve()
+    login_page.header.search.resolve()
+
+    login_page.invalidate_cache()
+
+    assert 'unresolved' in repr(login_page.login)
+    assert login_page.header._root is None
+    assert 'unresolved' in repr(login_page.header.search)
+
+
+def test_component_field_threads_timeout_to_root(login_page):
+    class SlowPage(LoginPage):
+        panel = ComponentField(Header, (By.ID, 'panel'), timeout=20)
+
+    slow_page = SlowPage(login_page._driver)
+    slow_page.find_element = login_page.find_element
+
+    slow_page.panel.root
+
+    login_page.find_element.assert_called_once_with((By.ID, 'panel'), 'panel', 20)
+
+
+def test_component_refinds_stale_root(mocker, login_page):
+    wait = mocker.patch('webserpent.pom.fields.wait_for_element_to_exist')
+    wait.side_effect = [StaleElementReferenceException(), 'search']
+    header = login_page.header
+    stale_root = header.root
+
+    search = header.search.resolve()
+
+    assert search.web_element == 'search'
+    assert header.root is not stale_root
+    assert wait.call_args.args[0] is header.root.web_element
+    assert login_page.find_element.call_count == 2
+
+
+def test_component_refinds_stale_root_cached_by_page(mocker, driver):
+    wait = mocker.patch('webserpent.pom.fields.wait_for_element_to_exist')
+    wait.side_effect = [StaleElementReferenceException(), 'search']
+    mocker.patch('webserpent.pom.page.wait_for_element_to_exist')
+    login_page = LoginPage(driver)
+    header = login_page.header
+    root = header.root
+
+    header.search.resolve()
+
+    assert header.root is root
+    driver.find_element.assert_called_once_with(By.TAG_NAME, 'header')
+    assert wait.call_args.args[0] is driver.find_element.return_value
+
+
+def test_component_children_refind_below_current_root(mocker, login_page):
+    mocker.patch('webserpent.pom.fields.wait_for_element_to_exist')
+    header = login_page.header
+    search = header.search.resolve()
+    search.web_element.click.side_effect = [StaleElementReferenceException(), None]
+    header.root.web_element.find_element.side_effect = StaleElementReferenceException()
+    mocker.patch('webserpent.selenium.element.wait_for_element_to_be_clickable')
+
+    search.click()
+
+    new_root = header.root.web_element
+    new_root.find_element.assert_called_once_with(By.NAME, 'q')
+    assert search.web_element is new_root.find_element.return_value
+
+
+def test_component_find_elements_is_empty_on_timeout(mocker, login_page):
+    mocker.patch(
+        'webserpent.pom.fields.wait_for_elements_to_exist', side_effect=TimeoutException()
+    )
+
+    rows = login_page.header.find_elements((By.CSS_SELECTOR, 'a'), 'links')
+
+    assert len(rows) == 0
+    login_page.header.root.web_element.find_elements.assert_not_called()
+
+
+def test_proxy_can_be_copied(login_page):
+    proxy = login_page.login
+    target = proxy.resolve()
+
+    copied = copy.copy(proxy)
+
+    assert copied is not proxy
+    assert copied.resolve() is target
+    assert 'unresolved' in repr(copy.copy(login_page.rows))
+
+
+def test_field_requires_find():
+    class Incomplete(_Field):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete((By.ID, 'x'))
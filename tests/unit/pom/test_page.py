@@ -0,0 +1,168 @@
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from webserpent.exceptions.exceptions import SelectFailureException, SendTextFailureException
+from webserpent.pom.page import page
+
+
+@pytest.fixture
+def driver(mocker):
+    return mocker.Mock(spec=WebDriver)
+
+
+@pytest.fixture
+def call_script(mocker):
+    return mocker.patch('webserpent.pom.page.call_script')
+
+
+def test_fill_form_sets_all_fields_in_one_call(driver, call_script):
+    call_script.return_value = [{'status': 'ok'}] * 3
+
+    page(driver).fill_form({
+        'email': 'user@example.com',
+        (By.ID, 'terms'): True,
+        (By.CSS_SELECTOR, 'select.country'): ['NL'],
+    })
+
+    call_script.assert_called_once_with(driver, 'fillForm', [
+        ['name', 'email', 'user@example.com', False],
+        ['id', 'terms', True, False],
+        ['css selector', 'select.country', ['NL'], False],
+    ])
+
+
+def test_fill_form_types_native_fields(mocker, driver, call_script):
+    web_element = mocker.Mock(spec=WebElement)
+    call_script.return_value = [{'status': 'ok'}, {'status': 'native', 'element': web_element}]
+    mock_element = mocker.patch('webserpent.pom.page.Element')
+
+    page(driver).fill_form({'email': 'a@b.c', 'code': '1234'}, native_keys=['code'])
+
+    assert call_script.call_args.args[2][1] == ['name', 'code', '1234', True]
+    mock_element.assert_called_once_with(
+        web_element, 'code', locator=(By.NAME, 'code'), search_context=driver
+    )
+    mock_element.return_value.clear.assert_called_once()
+    mock_element.return_value.send_text.assert_called_once_with('1234', 5, native_keys=True)
+
+
+def test_fill_form_waits_for_missing_fields(mocker, driver, call_script):
+    call_script.side_effect = [[{'status': 'ok'}, {'status': 'missing'}], [{'status': 'ok'}]]
+    mock_wait = mocker.patch('webserpent.pom.page.wait_for_element_to_exist')
+
+    page(driver).fill_form({'email': 'a@b.c', 'late': 'x'}, timeout=3)
+
+    mock_wait.assert_called_once_with(driver, (By.NAME, 'late'), 3)
+    assert call_script.call_args.args[2] == [['name', 'late', 'x', False]]
+
+
+@pytest.mark.parametrize('status', ['disabled', 'unsupported'])
+def test_fill_form_raises_for_unfillable_field(driver, call_script, status):
+    call_script.return_value = [{'status': status, 'control': 'text'}]
+
+    with pytest.raises(SendTextFailureException, match=status):
+        page(driver).fill_form({'email': 'a@b.c'})
+
+
+@pytest.mark.parametrize('control, status', [
+    ('select', 'no option'),
+    ('select', 'disabled'),
+    ('radio', 'no option'),
+    ('radio', 'disabled'),
+])
+def test_fill_form_raises_select_failure_for_choices(driver, call_script, control, status):
+    call_script.return_value = [{'status': status, 'control': control}]
+
+    with pytest.raises(SelectFailureException, match=status):
+        page(driver).fill_form({'country': 'zz'})
+
+
+def test_fill_form_rejects_non_bool_checkbox_value(driver, call_script):
+    call_script.return_value = [{'status': 'not a bool', 'control': 'checkbox'}]
+
+    with pytest.raises(TypeError, match='terms'):
+        page(driver).fill_form({'terms': 'yes'})
+
+
+def test_batch_records_for_page_driver(driver):
+    with page(driver).batch() as batch:
+        assert batch.driver is driver
+
+
+@pytest.fixture
+def wait_for_element(mocker):
+    return mocker.patch('webserpent.pom.page.wait_for_element_to_exist')
+
+
+def test_find_element_uses_the_waited_element(driver, wait_for_element, call_script):
+    element = page(driver).find_element((By.ID, 'login'), 'login')
+
+    assert element.web_element is wait_for_element.return_value
+    driver.find_element.assert_not_called()
+
+
+def test_find_element_serves_cached_element_without_round_trip(
+    driver, wait_for_element, call_script
+):
+    login_page = page(driver)
+
+    first = login_page.find_element((By.ID, 'login'), 'login')
+    second = login_page.find_element((By.ID, 'login'), 'login')
+
+    assert second is first
+    wait_for_element.assert_called_once()
+    call_script.assert_not_called()
+    driver.execute_script.assert_not_called()
+
+
+def test_cached_element_refinds_itself_when_stale(mocker, driver, wait_for_element):
+    mocker.patch('webserpent.selenium.element.wait_for_element_to_be_clickable')
+    login_page = page(driver)
+    login = login_page.find_element((By.ID, 'login'), 'login')
+    login.web_element.click.side_effect = StaleElementReferenceException()
+
+    login_page.find_element((By.ID, 'login'), 'login').click()
+
+    driver.find_element.assert_called_once_with(By.ID, 'login')
+    assert login.web_element is driver.find_element.return_value
+
+
+def test_invalidate_cache_finds_element_again(driver, wait_for_element):
+    login_page = page(driver)
+
+    first = login_page.find_element((By.ID, 'login'), 'login')
+    login_page.invalidate_cache()
+
+    assert login_page.find_element((By.ID, 'login'), 'login') is not first
+    assert wait_for_element.call_count == 2
+
+
+def test_find_element_without_cache(driver, wait_for_element, call_script):
+    login_page = page(driver, cache_elements=False)
+
+    login_page.find_element((By.ID, 'login'), 'login')
+    login_page.find_element((By.ID, 'login'), 'login')
+
+    assert wait_for_element.call_count == 2
+    call_script.assert_not_called()
+
+
+def test_find_elements_uses_the_waited_elements(mocker, driver):
+    wait = mocker.patch('webserpent.pom.page.wait_for_elements_to_exist', return_value=['a', 'b'])
+
+    rows = page(driver).find_elements((By.CSS_SELECTOR, 'tr'), 'rows')
+
+    wait.assert_called_once_with(driver, (By.CSS_SELECTOR, 'tr'), 5)
+    assert [row.web_element for row in rows] == ['a', 'b']
+    driver.find_elements.assert_not_called()
+
+
+def test_find_elements_returns_empty_collection_on_timeout(mocker, driver):
+    mocker.patch(
+        'webserpent.pom.page.wait_for_elements_to_exist', side_effect=TimeoutException()
+    )
+
+    assert len(page(driver).find_elements((By.CSS_SELECTOR, 'tr'), 'rows', 1)) == 0
@@ -0,0 +1,181 @@
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from webserpent.exceptions.exceptions import SelectFailureException, SendTextFailureException
+from webserpent.selenium.batch import ActionBatch, current_batch
+from webserpent.selenium.element import Element, SelectBy
+
+
+@pytest.fixture
+def driver(mocker):
+    return mocker.Mock(spec=WebDriver)
+
+
+@pytest.fixture
+def action_chains(mocker):
+    return mocker.patch('webserpent.selenium.batch.ActionChains')
+
+
+@pytest.fixture
+def call_script(mocker):
+    return mocker.patch('webserpent.selenium.batch.call_script')
+
+
+def _element(mocker, driver, name):
+    web_element = mocker.Mock(spec=WebElement)
+    web_element.parent = driver
+    return Element(web_element, name)
+
+
+def test_element_calls_are_recorded_and_flushed_in_groups(
+    mocker, driver, action_chains, call_script
+):
+    user = _element(mocker, driver, 'user')
+    password = _element(mocker, driver, 'password')
+    country = _element(mocker, driver, 'country')
+    banner = _element(mocker, driver, 'banner')
+    call_script.return_value = [None, None, 'Welcome']
+
+    with ActionBatch(driver) as batch:
+        user.send_text('name')
+        password.send_text('secret')
+        country.clear()
+        country.select_options(SelectBy.VALUE, ['NL'])
+        text = batch.get_text(banner)
+        assert not text.done()
+
+    chain = action_chains.return_value
+    chain.send_keys_to_element.assert_any_call(user.web_element, 'name')
+    chain.send_keys_to_element.assert_any_call(password.web_element, 'secret')
+    chain.perform.assert_called_once()
+    call_script.assert_called_once_with(driver, 'batch', [
+        ['clearValue', [country.web_element]],
+        ['selectOptions', [country.web_element, 'value', ['NL'], True, False]],
+        ['readText', [banner.web_element]],
+    ], ['clearValue', 'selectOptions'])
+    assert text.result() == 'Welcome'
+    user.web_element.send_keys.assert_not_called()
+
+
+def test_each_run_of_commands_is_one_call(mocker, driver, action_chains, call_script):
+    button = _element(mocker, driver, 'button')
+    field = _element(mocker, driver, 'field')
+    call_script.return_value = ['value']
+
+    with ActionBatch(driver) as batch:
+        button.click()
+        value = batch.get_property(field, 'value')
+        button.click()
+
+    assert action_chains.return_value.perform.call_count == 2
+    assert value.result() == 'value'
+
+
+def test_batch_only_records_its_own_driver(mocker, driver):
+    other = _element(mocker, mocker.Mock(spec=WebDriver), 'other')
+
+    with ActionBatch(driver):
+        assert current_batch(driver) is not None
+        assert current_batch(other.web_element.parent) is None
+    assert current_batch(driver) is None
+
+
+def test_failure_cancels_later_commands(mocker, driver, action_chains, call_script):
+    button = _element(mocker, driver, 'button')
+    action_chains.return_value.perform.side_effect = WebDriverException('intercepted')
+
+    with pytest.raises(WebDriverException):
+        with ActionBatch(driver) as batch:
+            click = batch.click(button)
+            text = batch.get_text(button)
+
+    assert isinstance(click.exception(), WebDriverException)
+    assert text.cancelled()
+    call_script.assert_not_called()
+
+
+def test_select_failure_raises_on_flush_and_cancels_later_commands(
+    mocker, driver, action_chains, call_script
+):
+    select = _element(mocker, driver, 'select')
+    submit = _element(mocker, driver, 'submit')
+    # the in-page loop stops at the failing select
+    call_script.return_value = [None, 'no option with value zz']
+
+    with pytest.raises(SelectFailureException):
+        with ActionBatch(driver) as batch:
+            scrolled = batch.scroll_to(select)
+            selected = batch.select(select, SelectBy.VALUE, ['zz'])
+            clicked = batch.js_click(submit)
+            typed = batch.send_text(submit, 'text')
+
+    assert scrolled.result() is None
+    assert isinstance(selected.exception(), SelectFailureException)
+    assert clicked.cancelled()
+    assert typed.cancelled()
+    action_chains.assert_not_called()
+
+
+def test_exception_in_block_discards_commands(mocker, driver, action_chains, call_script):
+    button = _element(mocker, driver, 'button')
+
+    with pytest.raises(ValueError):
+        with ActionBatch(driver) as batch:
+            attribute = batch.get_attribute(button, 'href')
+            raise ValueError
+
+    assert attribute.cancelled()
+    action_chains.assert_not_called()
+    call_script.assert_not_called()
+
+
+def test_script_actions_are_recorded(mocker, driver, call_script):
+    link = _element(mocker, driver, 'link')
+    field = _element(mocker, driver, 'field')
+    country = _element(mocker, driver, 'country')
+    call_script.return_value = [None] * 5
+
+    with ActionBatch(driver):
+        link.scroll_to()
+        link.js_click()
+        field.js_send_text('text')
+        country.select_from_dropdown_by(SelectBy.INDEX, 2)
+        country.deselect_all()
+
+    call_script.assert_called_once_with(driver, 'batch', [
+        ['scrollTo', [link.web_element]],
+        ['jsClick', [link.web_element]],
+        ['jsSendText', [field.web_element, 'text']],
+        ['selectOptions', [country.web_element, 'index', [2], True, False]],
+        ['selectOptions', [country.web_element, 'value', [], False, True]],
+    ], ['clearValue', 'selectOptions'])
+
+
+@pytest.mark.parametrize('read', [
+    lambda element: element.text,
+    lambda element: element.displayed,
+    lambda element: element.in_viewport,
+    lambda element: element.get_attribute('href'),
+    lambda element: element.snapshot(),
+    lambda element: element.read_options(),
+])
+def test_element_reads_raise_inside_batch(mocker, driver, call_script, read):
+    element = _element(mocker, driver, 'element')
+
+    with ActionBatch(driver):
+        with pytest.raises(RuntimeError, match='ActionBatch'):
+            read(element)
+
+    element.web_element.get_attribute.assert_not_called()
+    call_script.assert_not_called()
+
+
+def test_clear_failure_raises_on_flush(mocker, driver, call_script):
+    div = _element(mocker, driver, 'div')
+    call_script.return_value = ['not a text field']
+
+    with pytest.raises(SendTextFailureException, match='not a text field'):
+        with ActionBatch(driver):
+            div.clear()
@@ -2,6 +2,11 @@
 from unittest.mock import Mock
 
 import pytest
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support.select import Select
@@ -16,8 +21,11 @@ from webserpent.selenium.element import (
     InvalidElementStateException,
     SendTextFailureException,
     UnexpectedClickException,
-    SelectBy
+    SelectBy,
+    SelectFailureException,
+    SelectOption,
 )
+from webserpent.selenium.scripts import _registry
 
 @pytest.fixture
 def element(mocker):
@@ -394,4 +402,327 @@ def test_get_property(mocker):
     result = element.get_property('name')
 
     assert result == expected, f'wanted {expected} but got {result}'
-    mock_web_element.get_property.assert_called_once_with('name')
\ No newline at end of file
+    mock_web_element.get_property.assert_called_once_with('name')
+
+SNAPSHOT_STATE = {
+    'tag_name': 'input',
+    'text': '',
+    'rect': {'x': 10.4, 'y': 20.6, 'width': 100, 'height': 30},
+    'enabled': True,
+    'displayed': True,
+    'selected': False,
+    'attributes': {'type': 'checkbox'},
+    'properties': {'value': 'on'},
+}
+
+
+def test_snapshot_reads_state_in_one_call(mocker):
+    mock_web_element = mocker.Mock(spec=WebElement)
+    mock_web_element.parent.execute_script.return_value = SNAPSHOT_STATE
+    element = Element(mock_web_element, 'test element')
+
+    snapshot = element.snapshot(attributes=['type'], properties=['value'])
+
+    assert snapshot.tag_name == 'input'
+    assert snapshot.rect['width'] == 100
+    assert snapshot.attributes == {'type': 'checkbox'}
+    assert snapshot.properties['value'] == 'on'
+    args = mock_web_element.parent.execute_script.call_args.args
+    assert args[2:] == ('snapshot', mock_web_element, ['type'], ['value'])
+    with pytest.raises(TypeError):
+        snapshot.attributes['type'] = 'text'
+
+
+def test_properties_read_snapshot_within_ttl(mocker):
+    mock_web_element = mocker.Mock(spec=WebElement)
+    mock_web_element.parent.execute_script.return_value = SNAPSHOT_STATE
+    element = Element(mock_web_element, 'test element', snapshot_ttl=60)
+
+    assert element.tag_name == 'input'
+    assert element.enabled is True
+    assert element.displayed is True
+    assert element.selected is False
+    assert element.size == {'height': 30, 'width': 100}
+    assert element.location == {'x': 10, 'y': 21}
+
+    mock_web_element.parent.execute_script.assert_called_once()
+    mock_web_element.is_enabled.assert_not_called()
+
+
+def test_actions_invalidate_snapshot(mocker):
+    mock_web_element = mocker.Mock(spec=WebElement)
+    mock_web_element.parent.execute_script.return_value = SNAPSHOT_STATE
+    element = Element(mock_web_element, 'test element', snapshot_ttl=60)
+
+    _ = element.tag_name
+    element.clear()
+    _ = element.tag_name
+
+    assert mock_web_element.parent.execute_script.call_count == 2
+
+
+def test_properties_skip_snapshot_without_ttl(mocker):
+    mock_web_element = mocker.Mock(spec=WebElement)
+    mock_web_element.is_displayed.return_value = True
+    element = Element(mock_web_element, 'test element')
+
+    assert element.displayed is True
+    mock_web_element.parent.execute_script.assert_not_called()
+
+
+def test_click_refinds_stale_element(mocker):
+    mocker.patch('webserpent.selenium.element.wait_for_element_to_be_clickable')
+    stale = mocker.Mock(spec=WebElement)
+    stale.click.side_effect = StaleElementReferenceException
+    fresh = mocker.Mock(spec=WebElement)
+    driver = mocker.Mock()
+    driver.find_element.return_value = fresh
+    element = Element(stale, 'test element', locator=('id', 'submit'), search_context=driver)
+
+    element.click()
+
+    driver.find_element.assert_called_once_with('id', 'submit')
+    fresh.click.assert_called_once()
+    assert element.web_element is fresh
+    assert element.stale_recoveries == 1
+
+
+def test_wait_refinds_stale_element(mocker):
+    stale = mocker.Mock(spec=WebElement)
+    fresh = mocker.Mock(spec=WebElement)
+    mock_wait = mocker.patch(
+        'webserpent.selenium.element.wait_for_element_to_be_clickable',
+        side_effect=[StaleElementReferenceException, None],
+    )
+    driver = mocker.Mock()
+    driver.find_element.return_value = fresh
+    element = Element(stale, 'test element', locator=('id', 'name'), search_context=driver)
+
+    element.send_text('text')
+
+    assert mock_wait.call_args_list[1].args[0] is fresh
+    assert mock_wait.call_args.kwargs == {'raise_on_stale': True}
+    fresh.send_keys.assert_called_once_with('text')
+    assert element.stale_recoveries == 1
+
+
+def test_stale_recovery_is_bounded(mocker):
+    mocker.patch('webserpent.selenium.element.wait_for_element_to_be_clickable')
+    stale = mocker.Mock(spec=WebElement)
+    stale.click.side_effect = StaleElementReferenceException
+    driver = mocker.Mock()
+    driver.find_element.return_value = stale
+    element = Element(
+        stale, 'test element', locator=('id', 'submit'), search_context=driver, max_reresolve=2
+    )
+
+    with pytest.raises(StaleElementReferenceException):
+        element.click()
+
+    assert driver.find_element.call_count == 2
+    assert element.stale_recoveries == 2
+
+
+def test_stale_raised_when_element_is_gone(mocker):
+    mocker.patch('webserpent.selenium.element.wait_for_element_to_be_clickable')
+    stale = mocker.Mock(spec=WebElement)
+    stale.clear.side_effect = StaleElementReferenceException
+    driver = mocker.Mock()
+    driver.find_element.side_effect = NoSuchElementException
+    element = Element(stale, 'test element', locator=('id', 'name'), search_context=driver)
+
+    with pytest.raises(StaleElementReferenceException):
+        element.clear()
+
+    assert element.stale_recoveries == 0
+
+
+def test_stale_raised_without_locator(element):
+    element._element.click.side_effect = StaleElementReferenceException
+
+    with pytest.raises(StaleElementReferenceException):
+        element.click()
+
+
+def test_smart_click_clicks_after_one_script(mocker):
+    mock_wait = mocker.patch('webserpent.selenium.element.wait_for_element_to_be_clickable')
+    mock_web_element = mocker.Mock(spec=WebElement)
+    mock_web_element.parent.execute_script.return_value = 'ready'
+    element = Element(mock_web_element, 'test element', smart_click=True)
+
+    element.click()
+
+    mock_web_element.parent.execute_script.assert_called_once()
+    mock_web_element.click.assert_called_once()
+    mock_wait.assert_not_called()
+
+
+@pytest.mark.parametrize('status', ['hidden', 'disabled', 'obscured'])
+def test_smart_click_falls_back_when_not_ready(mocker, status):
+    mock_wait = mocker.patch('webserpent.selenium.element.wait_for_element_to_be_clickable')
+    mock_web_element = mocker.Mock(spec=WebElement)
+    mock_web_element.parent.execute_script.return_value = status
+    element = Element(mock_web_element, 'test element')
+
+    element.click(smart=True)
+
+    mock_wait.assert_called_once()
+    mock_web_element.click.assert_called_once()
+
+
+def test_smart_click_falls_back_when_intercepted(mocker):
+    mocker.patch('webserpent.selenium.element.wait_for_element_to_be_clickable')
+    mock_web_element = mocker.Mock(spec=WebElement)
+    mock_web_element.parent.execute_script.return_value = 'ready'
+    mock_web_element.click.side_effect = [ElementClickInterceptedException, None]
+    mock_scroll_to = mocker.patch('webserpent.selenium.element.Element.scroll_to')
+    element = Element(mock_web_element, 'test element', smart_click=True)
+
+    element.click()
+
+    mock_scroll_to.assert_not_called()
+    assert mock_web_element.click.call_count == 2
+
+
+def test_select_options_uses_one_script_call(mocker):
+    mock_web_element = mocker.Mock(spec=WebElement)
+    mock_web_element.parent.execute_script.return_value = None
+    element = Element(mock_web_element, 'test element')
+
+    element.select_options(SelectBy.VISIBLE_TEXT, ['Apple', 'Banana'], exclusive=True)
+
+    args = mock_web_element.parent.execute_script.call_args.args
+    assert args[2:] == ('selectOptions', mock_web_element, 'visible_text', ['Apple', 'Banana'], True, True)
+    mock_web_element.parent.execute_script.assert_called_once()
+
+
+def test_deselect_options(mocker):
+    mock_web_element = mocker.Mock(spec=WebElement)
+    mock_web_element.parent.execute_script.return_value = None
+    element = Element(mock_web_element, 'test element')
+
+    element.deselect_options(SelectBy.INDEX, [0, 2])
+
+    args = mock_web_element.parent.execute_script.call_args.args
+    assert args[4:] == ('index', [0, 2], False, False)
+
+
+def test_select_options_raises_on_script_error(mocker):
+    mock_web_element = mocker.Mock(spec=WebElement)
+    mock_web_element.parent.execute_script.return_value = 'no option with value zz'
+    element = Element(mock_web_element, 'test element')
+
+    with pytest.raises(SelectFailureException, match='no option with value zz'):
+        element.select_options(SelectBy.VALUE, ['zz'])
+
+
+def test_read_options(mocker):
+    mock_web_element = mocker.Mock(spec=WebElement)
+    mock_web_element.parent.execute_script.return_value = {
+        'multiple': True,
+        'options': [[0, 'a', 'Apple', True, False], [1, 'b', 'Banana', False, True]],
+    }
+    element = Element(mock_web_element, 'test element')
+
+    state = element.read_options()
+
+    assert state.multiple is True
+    assert state.options[1] == SelectOption(1, 'b', 'Banana', False, True)
+    assert state.selected == [SelectOption(0, 'a', 'Apple', True, False)]
+
+
+def test_send_text_inserts_large_text_in_chunks(mocker):
+    mocker.patch('webserpent.selenium.element.wait_for_element_to_be_clickable')
+    mocker.patch('webserpent.selenium.element._TEXT_CHUNK_SIZE', 4096)
+    mock_web_element = mocker.Mock(spec=WebElement)
+    text = 'x' * 10000
+    mock_web_element.parent.execute_script.side_effect = [
+        None, None, {'editable': False, 'value': 'prefix' + text},
+    ]
+    element = Element(mock_web_element, 'test element')
+
+    element.send_text(text)
+
+    calls = mock_web_element.parent.execute_script.call_args_list
+    assert [len(call.args[4]) for call in calls] == [4096, 4096, 1808]
+    assert [call.args[5] for call in calls] == [False, False, True]
+    mock_web_element.send_keys.assert_not_called()
+
+
+def test_send_text_raises_when_large_text_did_not_take(mocker):
+    mocker.patch('webserpent.selenium.element.wait_for_element_to_be_clickable')
+    mock_web_element = mocker.Mock(spec=WebElement)
+    mock_web_element.parent.execute_script.return_value = {'editable': False, 'value': 'x' * 100}
+    element = Element(mock_web_element, 'test element')
+
+    with pytest.raises(SendTextFailureException):
+        element.send_text('x' * 5000)
+
+
+def test_send_text_ignores_layout_whitespace_of_editable_elements(mocker):
+    mocker.patch('webserpent.selenium.element.wait_for_element_to_be_clickable')
+    mock_web_element = mocker.Mock(spec=WebElement)
+    text = 'line\r\n' * 1000
+    mock_web_element.parent.execute_script.return_value = {
+        'editable': True, 'value': 'line\n\n' * 1000,
+    }
+    element = Element(mock_web_element, 'test element')
+
+    element.send_text(text)
+
+
+def test_send_text_appends_large_text_to_prefilled_editable_element(mocker):
+    mocker.patch('webserpent.selenium.element.wait_for_element_to_be_clickable')
+    mock_web_element = mocker.Mock(spec=WebElement)
+    text = 'x' * 5000
+    mock_web_element.parent.execute_script.return_value = {
+        'editable': True, 'value': 'existing note\n' + text,
+    }
+    element = Element(mock_web_element, 'test element')
+
+    element.send_text(text)
+
+    # the caret is moved behind the existing content before inserting
+    assert 'range.collapse(false)' in _registry['insertText']
+
+
+def test_send_text_types_large_text_with_native_keys(element):
+    element.send_text('x' * 5000, native_keys=True)
+
+    element._element.send_keys.assert_called_once_with('x' * 5000)
+    element._element.parent.execute_script.assert_not_called()
+
+
+def test_send_text_large_text_rejects_non_text_field(mocker):
+    mocker.patch('webserpent.selenium.element.wait_for_element_to_be_clickable')
+    mock_web_element = mocker.Mock(spec=WebElement)
+    mock_web_element.parent.execute_script.return_value = {'error': 'not a text field'}
+    element = Element(mock_web_element, 'test element')
+
+    with pytest.raises(SendTextFailureException, match='not a text field'):
+        element.send_text('x' * 5000)
+
+    mock_web_element.parent.execute_script.assert_called_once()
+
+
+def test_smart_click_does_not_click_twice_after_other_errors(mocker):
+    mock_wait = mocker.patch('webserpent.selenium.element.wait_for_element_to_be_clickable')
+    mock_web_element = mocker.Mock(spec=WebElement)
+    mock_web_element.parent.execute_script.return_value = 'ready'
+    mock_web_element.click.side_effect = TimeoutException('page load')
+    element = Element(mock_web_element, 'test element', smart_click=True)
+
+    with pytest.raises(UnexpectedClickException):
+        element.click()
+
+    mock_web_element.click.assert_called_once()
+    mock_wait.assert_not_called()
+
+
+@pytest.mark.parametrize('inside', [True, False])
+def test_in_viewport_returns_the_script_result(mocker, inside):
+    mock_web_element = mocker.Mock(spec=WebElement)
+    mock_web_element.parent.execute_script.return_value = inside
+
+    assert Element(mock_web_element, 'banner').in_viewport is inside
+    assert mock_web_element.parent.execute_script.call_args.args[2] == 'inViewport'
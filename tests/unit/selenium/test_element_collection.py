@@ -0,0 +1,79 @@
+import pytest
+from selenium.webdriver.remote.webelement import WebElement
+
+from webserpent.selenium.element import Element
+from webserpent.selenium.element_collection import ElementCollection
+
+
+@pytest.fixture
+def web_elements(mocker):
+    parent = mocker.Mock()
+    elements = [mocker.Mock(spec=WebElement) for _ in range(4)]
+    for element in elements:
+        element.parent = parent
+    return elements
+
+
+@pytest.fixture
+def execute_script(web_elements):
+    return web_elements[0].parent.execute_script
+
+
+def test_len_and_iteration_build_elements_on_demand(web_elements):
+    collection = ElementCollection(web_elements, 'rows')
+
+    items = list(collection)
+
+    assert len(collection) == 4
+    assert all(isinstance(item, Element) for item in items)
+    assert [item._element for item in items] == web_elements
+    assert items[2]._name == 'rows[2]'
+
+
+def test_indexing_and_slicing(web_elements):
+    collection = ElementCollection(web_elements, 'rows')
+
+    assert collection[-1]._element is web_elements[3]
+    assert collection[-1]._name == 'rows[3]'
+    sliced = collection[1:3]
+    assert isinstance(sliced, ElementCollection)
+    assert [item._element for item in sliced] == web_elements[1:3]
+    assert sliced[0]._name == 'rows[1]'
+    assert sliced[::-1][0]._name == 'rows[2]'
+    assert collection[1:][-1]._name == 'rows[3]'
+
+
+def test_texts_use_one_script_call(web_elements, execute_script):
+    execute_script.return_value = ['a', 'b', 'c', 'd']
+
+    assert ElementCollection(web_elements, 'rows').texts() == ['a', 'b', 'c', 'd']
+    execute_script.assert_called_once()
+    assert execute_script.call_args.args[2:] == ('texts', web_elements)
+
+
+@pytest.mark.parametrize('method, args', [
+    ('attributes', ('href',)),
+    ('properties', ('value',)),
+    ('rects', ()),
+    ('visible_mask', ()),
+])
+def test_vectorized_reads_pass_arguments(web_elements, execute_script, method, args):
+    execute_script.return_value = ['result'] * 4
+
+    result = getattr(ElementCollection(web_elements, 'rows'), method)(*args)
+
+    assert result == ['result'] * 4
+    assert execute_script.call_args.args[3:] == (web_elements, *args)
+
+
+def test_sliced_reads_only_send_the_slice(web_elements, execute_script):
+    ElementCollection(web_elements, 'rows')[:2].visible_mask()
+
+    assert execute_script.call_args.args[3] == web_elements[:2]
+
+
+def test_empty_collection_skips_driver():
+    collection = ElementCollection([], 'rows')
+
+    assert collection.texts() == []
+    assert list(collection) == []
@@ -0,0 +1,96 @@
+import pytest
+from selenium.webdriver.chrome.webdriver import WebDriver as ChromeDriver
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# helpers are registered by the modules of the commands that use them
+import webserpent.pom.page  # pylint: disable=unused-import
+import webserpent.selenium.table  # pylint: disable=unused-import
+from webserpent.selenium import scripts
+from webserpent.selenium.scripts import (
+    bundle,
+    call_async_script,
+    call_script,
+    install_on_new_document,
+    register_script,
+)
+
+
+@pytest.fixture
+def driver(mocker):
+    return mocker.Mock(spec=WebDriver)
+
+
+def test_call_sends_only_the_helper_name(driver):
+    driver.execute_script.return_value = True
+
+    assert call_script(driver, 'inViewport', 'element') is True
+
+    driver.execute_script.assert_called_once()
+    script, version, name, element = driver.execute_script.call_args.args
+    assert 'getBoundingClientRect' not in script
+    assert version == scripts._version
+    assert (name, element) == ('inViewport', 'element')
+
+
+def test_call_installs_bundle_when_missing(driver):
+    driver.execute_script.side_effect = [scripts._MISSING, 'done']
+
+    assert call_script(driver, 'jsClick', 'element') == 'done'
+
+    assert driver.execute_script.call_count == 2
+    install = driver.execute_script.call_args.args[0]
+    assert install.startswith(bundle())
+    assert driver.execute_script.call_args.args[1:] == (scripts._version, 'jsClick', 'element')
+
+
+def test_async_call_installs_bundle_when_missing(driver):
+    driver.execute_async_script.side_effect = [scripts._MISSING, 'element']
+
+    assert call_async_script(driver, 'observeElement', 'id', 'login', 100) == 'element'
+
+    assert driver.execute_async_script.call_args.args[0].startswith(bundle())
+
+
+def test_register_script_changes_version():
+    bundle()
+    before = scripts._version
+    register_script('testHelper', 'function () { return 1; }')
+    try:
+        assert "ws['testHelper'] = function () { return 1; };" in bundle()
+        assert scripts._version != before
+    finally:
+        del scripts._registry['testHelper']
+        scripts._bundle = None
+        bundle()
+    assert scripts._version == before
+
+
+def test_install_on_new_document(mocker):
+    driver = mocker.Mock(spec=ChromeDriver)
+    driver.execute_cdp_cmd.return_value = {'identifier': '1'}
+
+    assert install_on_new_document(driver) == '1'
+    driver.execute_cdp_cmd.assert_called_once_with(
+        'Page.addScriptToEvaluateOnNewDocument', {'source': bundle()}
+    )
+
+
+def test_install_on_new_document_without_cdp(driver):
+    assert install_on_new_document(driver) is None
+
+
+@pytest.mark.parametrize('helper, shared', [
+    ('fillForm', 'ws.setNativeValue('),
+    ('fillForm', 'ws.textOf('),
+    ('insertText', 'ws.setNativeValue('),
+    ('clearValue', 'ws.setNativeValue('),
+    ('selectOptions', 'ws.textOf('),
+    ('readOptions', 'ws.textOf('),
+    ('readTableChunk', 'ws.textOf'),
+])
+def test_helpers_share_value_and_text_helpers(helper, shared):
+    source = scripts._registry[helper]
+
+    assert shared in source
+    assert 'getOwnPropertyDescriptor' not in source
+    assert '\\s+' not in source
@@ -0,0 +1,127 @@
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from webserpent.selenium.element import Element
+from webserpent.selenium.table import TableData, TableReader
+from webserpent.selenium.wait import FixedPoll
+
+
+def _chunk(rows, total, fingerprint='page-1'):
+    return {'headers': ['Name', 'Score'], 'total': total, 'fingerprint': fingerprint, 'rows': rows}
+
+
+@pytest.fixture
+def table(mocker):
+    web_element = mocker.Mock(spec=WebElement)
+    web_element.parent = mocker.Mock()
+    return Element(web_element, 'report')
+
+
+@pytest.fixture
+def execute_script(table):
+    return table.web_element.parent.execute_script
+
+
+def test_read_returns_headers_and_rows_in_batches(table, execute_script):
+    execute_script.side_effect = [
+        _chunk([['a', '1'], ['b', '2']], 3),
+        _chunk([['c', '3']], 3),
+    ]
+
+    data = TableReader(table, batch_size=2).read()
+
+    assert data == TableData(['Name', 'Score'], [['a', '1'], ['b', '2'], ['c', '3']])
+    starts = [c.args[4:] for c in execute_script.call_args_list]
+    assert starts == [(0, 2), (2, 2)]
+
+
+def test_iter_rows_streams_batches(table, execute_script):
+    execute_script.side_effect = [_chunk([['a', '1']], 2), _chunk([['b', '2']], 2)]
+
+    batches = TableReader(table).iter_rows(batch_size=1)
+
+    assert next(batches) == [['a', '1']]
+    assert execute_script.call_count == 1
+    assert list(batches) == [[['b', '2']]]
+
+
+def test_empty_table(table, execute_script):
+    execute_script.return_value = _chunk([], 0)
+
+    reader = TableReader(table)
+
+    assert reader.read().rows == []
+    assert reader.headers == ['Name', 'Score']
+
+
+def test_iter_pages_follows_next_control(mocker, table, execute_script):
+    driver = table.web_element.parent
+    next_button = mocker.Mock(spec=WebElement)
+    driver.find_elements.return_value = [next_button]
+    execute_script.side_effect = [
+        _chunk([['a', '1']], 1, 'page-1'),
+        True,
+        'page-2',
+        _chunk([['b', '2']], 1, 'page-2'),
+        False,
+    ]
+
+    batches = list(TableReader(table).iter_pages((By.CSS_SELECTOR, '.next')))
+
+    assert batches == [[['a', '1']], [['b', '2']]]
+    driver.find_elements.assert_called_with(By.CSS_SELECTOR, '.next')
+
+
+def test_iter_pages_stops_at_max_pages(mocker, table, execute_script):
+    execute_script.return_value = _chunk([['a', '1']], 1)
+
+    batches = list(TableReader(table).iter_pages((By.CSS_SELECTOR, '.next'), max_pages=1))
+
+    assert batches == [[['a', '1']]]
+    table.web_element.parent.find_elements.assert_not_called()
+
+
+def test_iter_pages_times_out_when_page_does_not_change(mocker, table, execute_script):
+    table.web_element.parent.find_elements.return_value = [mocker.Mock(spec=WebElement)]
+    execute_script.side_effect = [_chunk([['a', '1']], 1, 'page-1'), True] + ['page-1'] * 50
+
+    with pytest.raises(TimeoutException):
+        list(TableReader(table).iter_pages(
+            (By.CSS_SELECTOR, '.next'), timeout=0.05, poll=FixedPoll(0.01)
+        ))
+
+
+def test_iter_pages_refinds_replaced_table_with_its_locator(mocker, execute_script):
+    driver = mocker.Mock()
+    old_table = mocker.Mock(spec=WebElement)
+    old_table.parent = driver
+    new_table = mocker.Mock(spec=WebElement)
+    new_table.parent = driver
+    table = Element(old_table, 'report', locator=(By.ID, 'report'), search_context=driver)
+    driver.find_elements.side_effect = lambda by, value: (
+        [mocker.Mock(spec=WebElement)] if value == '.next' else [new_table]
+    )
+    driver.execute_script.side_effect = [
+        _chunk([['a', '1']], 1, 'page-1'),
+        True,
+        'page-2',
+        _chunk([['b', '2']], 1, 'page-2'),
+        False,
+    ]
+
+    batches = list(TableReader(table).iter_pages((By.CSS_SELECTOR, '.next'), max_pages=2))
+
+    assert batches == [[['a', '1']], [['b', '2']]]
+    assert driver.execute_script.call_args_list[2].args[3] is new_table
+
+
+def test_iter_pages_without_locator_explains_stale_table(mocker, table, execute_script):
+    table.web_element.parent.find_elements.return_value = [mocker.Mock(spec=WebElement)]
+    execute_script.side_effect = [
+        _chunk([['a', '1']], 1, 'page-1'), True, StaleElementReferenceException()
+    ]
+
+    with pytest.raises(StaleElementReferenceException, match='table_locator'):
+        list(TableReader(table).iter_pages((By.CSS_SELECTOR, '.next')))
@@ -1,14 +1,37 @@
 from unittest.mock import MagicMock
 
 import pytest
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    JavascriptException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 
+from webserpent.selenium.element import Element
 from webserpent.selenium.wait import (
+    Absent,
+    AdaptiveWait,
+    BudgetPoll,
+    ExponentialBackoffPoll,
+    FixedPoll,
+    PollStrategy,
+    WaitEngine,
+    get_default_poll_strategy,
+    set_default_ignored_exceptions,
+    set_default_poll_strategy,
+    set_default_wait_engine,
     wait_for_element_to_be_clickable,
     wait_for_element_to_be_in_viewport,
+    wait_for_element_to_exist,
+    wait_for_elements_to_exist,
+    wait_for_all,
+    wait_for_any,
 )
 
 @pytest.fixture
@@ -17,7 +40,7 @@ def mock_web_element():
 
 @pytest.fixture
 def mock_wait(mocker):
-    return mocker.patch("webserpent.selenium.wait.WebDriverWait")
+    return mocker.patch("webserpent.selenium.wait.AdaptiveWait")
 
 def test_wait_for_element_to_be_clickable(mock_wait, mock_web_element, mocker):
     # Arrange
@@ -29,7 +52,7 @@ def test_wait_for_element_to_be_clickable(mock_wait, mock_web_element, mocker):
     wait_for_element_to_be_clickable(mock_web_element, timeout=5)
 
     # Assert
-    mock_wait.assert_called_once_with(mock_web_element, 5)
+    mock_wait.assert_called_once_with(mock_web_element, 5, None, None)
     mock_ec.assert_called_once_with(mock_web_element)
     mock_wait_instance.until.assert_called_once_with(mock_ec.return_value)
 
@@ -43,6 +66,14 @@ def test_wait_for_element_to_be_clickable_timeout(mock_wait, mock_web_element, m
     with pytest.raises(TimeoutException):
         wait_for_element_to_be_clickable(mock_web_element, timeout=5)
 
+def test_wait_for_element_to_be_clickable_raises_on_stale(mock_web_element):
+    mock_web_element.is_displayed.side_effect = StaleElementReferenceException()
+
+    with pytest.raises(StaleElementReferenceException):
+        wait_for_element_to_be_clickable(mock_web_element, timeout=5, raise_on_stale=True)
+
+    mock_web_element.is_displayed.assert_called_once()
+
 def test_wait_for_element_to_be_in_viewport(mock_wait, mock_web_element, mocker):
     # Arrange
     mock_in_viewport = mocker.patch("webserpent.selenium.wait._in_viewport")
@@ -54,7 +85,7 @@ def test_wait_for_element_to_be_in_viewport(mock_wait, mock_web_element, mocker)
     wait_for_element_to_be_in_viewport(mock_web_element, timeout=5)
 
     # Assert
-    mock_wait.assert_called_once_with(mock_web_element, 5)
+    mock_wait.assert_called_once_with(mock_web_element, 5, None, None)
     mock_wait_instance.until.assert_called_once_with(mock_in_viewport.return_value)
 
 def test_wait_for_element_to_be_in_viewport_timeout(mock_wait, mock_web_element, mocker):
@@ -67,3 +98,226 @@ def test_wait_for_element_to_be_in_viewport_timeout(mock_wait, mock_web_element,
     # Act & Assert
     with pytest.raises(TimeoutException):
         wait_for_element_to_be_in_viewport(mock_web_element, timeout=5)
+
+
+@pytest.fixture
+def restore_defaults():
+    poll = get_default_poll_strategy()
+    yield
+    set_default_poll_strategy(poll)
+    set_default_ignored_exceptions(None)
+
+
+def test_fixed_poll_interval():
+    assert FixedPoll(0.2).next_interval(7, 1.0, 5) == 0.2
+
+
+def test_exponential_backoff_poll_intervals():
+    poll = ExponentialBackoffPoll(initial=0.005, factor=2, maximum=0.03)
+
+    intervals = [poll.next_interval(attempt, 0, 5) for attempt in range(5)]
+
+    assert intervals == [0.005, 0.01, 0.02, 0.03, 0.03]
+
+
+def test_budget_poll_spreads_remaining_polls():
+    poll = BudgetPoll(max_polls=5, initial=0.005)
+
+    assert poll.next_interval(0, 0, 0.001) == 0.005
+    assert poll.next_interval(0, 0, 10) == pytest.approx(2.5)
+    assert poll.next_interval(3, 6, 10) == pytest.approx(4)
+
+
+def test_adaptive_wait_returns_value_after_retries(mocker):
+    sleep = mocker.patch("webserpent.selenium.wait.time.sleep")
+    method = mocker.Mock(side_effect=[False, False, "found"])
+    wait = AdaptiveWait(MagicMock(spec=WebElement), 5, ExponentialBackoffPoll(initial=0.005))
+
+    assert wait.until(method) == "found"
+    assert [c.args[0] for c in sleep.call_args_list] == [0.005, 0.01]
+
+
+def test_adaptive_wait_uses_global_strategy(mocker, restore_defaults):
+    sleep = mocker.patch("webserpent.selenium.wait.time.sleep")
+    set_default_poll_strategy(FixedPoll(0.001))
+    method = mocker.Mock(side_effect=[False, True])
+
+    AdaptiveWait(MagicMock(spec=WebElement), 5).until(method)
+
+    sleep.assert_called_once_with(0.001)
+
+
+def test_adaptive_wait_times_out():
+    wait = AdaptiveWait(MagicMock(spec=WebElement), 0.05, FixedPoll(0.01))
+
+    with pytest.raises(TimeoutException):
+        wait.until(lambda _: False)
+
+
+def test_adaptive_wait_ignores_exceptions(mocker, restore_defaults):
+    mocker.patch("webserpent.selenium.wait.time.sleep")
+    set_default_ignored_exceptions([KeyError])
+    method = mocker.Mock(side_effect=[KeyError, "found"])
+
+    assert AdaptiveWait(MagicMock(spec=WebElement), 5).until(method) == "found"
+
+    with pytest.raises(ValueError):
+        AdaptiveWait(MagicMock(spec=WebElement), 5).until(mocker.Mock(side_effect=ValueError))
+
+
+def test_adaptive_wait_until_not(mocker):
+    mocker.patch("webserpent.selenium.wait.time.sleep")
+    method = mocker.Mock(side_effect=[True, False])
+
+    assert AdaptiveWait(MagicMock(spec=WebElement), 5, FixedPoll(0.01)).until_not(method) is False
+
+
+@pytest.fixture
+def mock_driver():
+    return MagicMock(spec=WebDriver)
+
+
+def test_wait_for_element_to_exist_polling_returns_element(mock_wait, mock_driver):
+    mock_wait.return_value.until.return_value = 'element'
+
+    result = wait_for_element_to_exist(mock_driver, (By.ID, 'login'), 5)
+
+    assert result == 'element'
+    mock_driver.execute_async_script.assert_not_called()
+
+
+def test_wait_for_elements_to_exist_finds_all_in_each_poll(mock_driver):
+    mock_driver.find_elements.side_effect = [[], ['a', 'b']]
+
+    result = wait_for_elements_to_exist(mock_driver, (By.CSS_SELECTOR, 'tr'), 1, FixedPoll(0.01))
+
+    assert result == ['a', 'b']
+    assert mock_driver.find_elements.call_count == 2
+    mock_driver.find_element.assert_not_called()
+
+
+def test_wait_for_element_to_exist_with_mutation_observer(mock_wait, mock_driver):
+    mock_driver.execute_async_script.return_value = 'element'
+
+    result = wait_for_element_to_exist(
+        mock_driver, (By.CSS_SELECTOR, '#login'), 5, engine=WaitEngine.MUTATION_OBSERVER
+    )
+
+    assert result == 'element'
+    args = mock_driver.execute_async_script.call_args.args
+    assert args[2:5] == ('observeElement', 'css selector', '#login')
+    assert 4900 <= args[5] <= 5000
+    mock_wait.assert_not_called()
+
+
+def test_mutation_observer_retries_after_navigation(mock_driver):
+    mock_driver.execute_async_script.side_effect = [JavascriptException('document unloaded'), 'element']
+
+    result = wait_for_element_to_exist(
+        mock_driver, (By.ID, 'login'), 5, engine=WaitEngine.MUTATION_OBSERVER
+    )
+
+    assert result == 'element'
+    assert mock_driver.execute_async_script.call_count == 2
+
+
+@pytest.mark.parametrize('message', [
+    "Failed to execute 'querySelector' on 'Document': '##' is not a valid selector.",
+    'Unsupported locator strategy: foo',
+    "The string '//[' is not a valid XPath expression.",
+])
+def test_mutation_observer_raises_invalid_selector(mock_driver, message):
+    mock_driver.execute_async_script.side_effect = JavascriptException(message)
+
+    with pytest.raises(InvalidSelectorException):
+        wait_for_element_to_exist(
+            mock_driver, (By.CSS_SELECTOR, '##'), 5, engine=WaitEngine.MUTATION_OBSERVER
+        )
+
+    mock_driver.execute_async_script.assert_called_once()
+
+
+def test_mutation_observer_reraises_other_script_errors(mock_driver):
+    mock_driver.execute_async_script.side_effect = JavascriptException('CSS is not defined')
+
+    with pytest.raises(JavascriptException):
+        wait_for_element_to_exist(
+            mock_driver, (By.ID, 'login'), 5, engine=WaitEngine.MUTATION_OBSERVER
+        )
+
+
+def test_mutation_observer_times_out(mock_driver):
+    mock_driver.execute_async_script.return_value = None
+
+    with pytest.raises(TimeoutException):
+        wait_for_element_to_exist(
+            mock_driver, (By.ID, 'login'), 0, engine=WaitEngine.MUTATION_OBSERVER
+        )
+
+
+def test_default_wait_engine(mock_driver):
+    mock_driver.execute_async_script.return_value = 'element'
+    set_default_wait_engine(WaitEngine.MUTATION_OBSERVER)
+    try:
+        assert wait_for_element_to_exist(mock_driver, (By.ID, 'login'), 5) == 'element'
+    finally:
+        set_default_wait_engine(WaitEngine.POLLING)
+
+
+def test_wait_for_any_returns_first_match(mock_driver, mocker):
+    mocker.patch("webserpent.selenium.wait.time.sleep")
+    banner = MagicMock(spec=WebElement)
+    mock_driver.execute_script.side_effect = [None, [1, [banner]]]
+    locators = [(By.ID, 'success'), (By.ID, 'error')]
+
+    match = wait_for_any(mock_driver, locators, 5)
+
+    assert match.index == 1
+    assert match.locator == (By.ID, 'error')
+    assert isinstance(match.elements[0], Element)
+    assert match.elements[0]._element is banner
+    assert mock_driver.execute_script.call_count == 2
+    payload, mode = mock_driver.execute_script.call_args.args[3:]
+    assert payload == [['id', 'success', False], ['id', 'error', False]]
+    assert mode == 'any'
+
+
+def test_wait_for_all_with_absent_locator(mock_driver):
+    table = MagicMock(spec=WebElement)
+    mock_driver.execute_script.return_value = [[], [table]]
+    locators = [Absent((By.CLASS_NAME, 'spinner')), (By.TAG_NAME, 'table')]
+
+    matches = wait_for_all(mock_driver, locators, 5)
+
+    assert [match.index for match in matches] == [0, 1]
+    assert matches[0].elements == []
+    assert matches[1].elements[0]._element is table
+    payload, mode = mock_driver.execute_script.call_args.args[3:]
+    assert payload == [['class name', 'spinner', True], ['tag name', 'table', False]]
+    assert mode == 'all'
+
+
+def test_wait_for_all_times_out(mock_driver):
+    mock_driver.execute_script.return_value = None
+
+    with pytest.raises(TimeoutException):
+        wait_for_all(mock_driver, [(By.ID, 'table')], 0.05, FixedPoll(0.01))
+
+
+def test_poll_strategy_requires_next_interval():
+    class NoInterval(PollStrategy):
+        pass
+
+    with pytest.raises(TypeError):
+        NoInterval()
+
+
+def test_wait_for_all_without_locators_returns_at_once(mock_wait, mock_driver):
+    assert wait_for_all(mock_driver, [], 5) == []
+    mock_wait.assert_not_called()
+
+
+def test_wait_for_any_without_locators_raises(mock_wait, mock_driver):
+    with pytest.raises(ValueError):
+        wait_for_any(mock_driver, [], 5)
+    mock_wait.assert_not_called()
@@ -0,0 +1,151 @@
+"""Module for caching resolved driver and browser binary paths"""
+
+import copy
+import json
+import os
+import threading
+from typing import Dict, Optional, Tuple, Union
+
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.firefox.service import Service as FirefoxService
+
+from webserpent.driver_management.browser_options import ChromeOptions, FirefoxOptions
+
+
+def default_cache_path() -> str:
+    """Location of the on-disk cache, honouring XDG_CACHE_HOME
+
+    Returns:
+        str
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "webserpent", "binaries.json")
+
+
+class BinaryCache:
+    """Resolves chromedriver/geckodriver and browser binaries through Selenium
+    Manager once and keeps the result on disk, keyed by browser and version.
+    An entry is dropped as soon as either binary is missing or changed."""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path (Optional[str], optional): cache file. Defaults to default_cache_path().
+        """
+        self._path = path or default_cache_path()
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, dict]] = None
+
+    def resolve(self, browser_options: Union[ChromeOptions, FirefoxOptions]) -> Tuple[str, str]:
+        """Get the driver and browser paths for the given options
+
+        Args:
+            browser_options (Union[ChromeOptions, FirefoxOptions])
+
+        Raises:
+            TypeError: when non supported browser type passed
+            NoSuchDriverException: when Selenium Manager can not resolve the binaries
+
+        Returns:
+            Tuple[str, str]: driver path and browser path
+        """
+        service_class = _service_class(browser_options)
+        key = _cache_key(browser_options)
+        with self._lock:
+            entry = self._load().get(key)
+            if entry and _is_current(entry):
+                return entry["driver_path"], entry["browser_path"]
+
+        finder = DriverFinder(service_class(), browser_options)
+        driver_path = finder.get_driver_path()
+        browser_path = finder.get_browser_path()
+
+        with self._lock:
+            self._load()[key] = {
+                "driver_path": driver_path,
+                "browser_path": browser_path,
+                "driver_stamp": _stamp(driver_path),
+                "browser_stamp": _stamp(browser_path),
+            }
+            self._save()
+        return driver_path, browser_path
+
+    def prepare(
+        self, browser_options: Union[ChromeOptions, FirefoxOptions]
+    ) -> Tuple[Union[ChromeOptions, FirefoxOptions], Union[ChromeService, FirefoxService]]:
+        """Build a Service pointing at the cached driver, and options pointing at
+        the cached browser. The given options are copied, never modified.
+
+        Args:
+            browser_options (Union[ChromeOptions, FirefoxOptions])
+
+        Returns:
+            Tuple[Union[ChromeOptions, FirefoxOptions], Union[ChromeService, FirefoxService]]
+        """
+        driver_path, browser_path = self.resolve(browser_options)
+        if browser_path and not browser_options.binary_location:
+            browser_options = copy.deepcopy(browser_options)
+            browser_options.binary_location = browser_path
+        return browser_options, _service_class(browser_options)(executable_path=driver_path)
+
+    def clear(self):
+        """Forget every cached entry"""
+        with self._lock:
+            self._entries = {}
+            self._save()
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is None:
+            try:
+                with open(self._path, encoding="utf-8") as cache_file:
+                    self._entries = json.load(cache_file)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+        temp_path = f"{self._path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as cache_file:
+            json.dump(self._entries, cache_file, indent=2, sort_keys=True)
+        os.replace(temp_path, self._path)
+
+
+def _service_class(browser_options: Union[ChromeOptions, FirefoxOptions]):
+    if isinstance(browser_options, ChromeOptions):
+        return ChromeService
+    if isinstance(browser_options, FirefoxOptions):
+        return FirefoxService
+    raise TypeError("Binary caching supports Chrome and Firefox options only.")
+
+
+def _cache_key(browser_options: Union[ChromeOptions, FirefoxOptions]) -> str:
+    return ":".join(
+        [
+            browser_options.capabilities["browserName"],
+            str(browser_options.browser_version or "stable"),
+            browser_options.binary_location or "",
+        ]
+    )
+
+
+def _stamp(path: str) -> Optional[list]:
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _is_current(entry: dict) -> bool:
+    for name in ("driver", "browser"):
+        stamp = entry.get(f"{name}_stamp")
+        path = entry.get(f"{name}_path")
+        if path and (stamp is None or _stamp(path) != stamp):
+            return False
+    return bool(entry.get("driver_path"))
@@ -1,8 +1,10 @@
 """Module for handling browser options"""
 
+import json
+import warnings
 from enum import Enum
 
-from typing import Dict, Union
+from typing import Any, Dict, List, Optional, Union
 
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
@@ -10,6 +12,56 @@ from selenium.webdriver.safari.options import Options as SafariOptions
 
 # TODO: ADD system logging
 
+DriverOptions = Union[ChromeOptions, FirefoxOptions, SafariOptions]
+
+_FAST_CHROME_ARGUMENTS = [
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-client-side-phishing-detection",
+    "--disable-default-apps",
+    "--disable-hang-monitor",
+    "--disable-sync",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,InterestFeedContentSuggestions",
+    "--disable-dev-shm-usage",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--metrics-recording-only",
+    "--password-store=basic",
+    "--use-mock-keychain",
+]
+
+_FAST_CHROME_PREFS = {
+    "translate": {"enabled": False},
+    "credentials_enable_service": False,
+    "profile.password_manager_enabled": False,
+    "autofill.profile_enabled": False,
+    "browser.check_default_browser": False,
+}
+
+_FAST_FIREFOX_PREFS = {
+    "app.update.auto": False,
+    "app.normandy.enabled": False,
+    "browser.aboutwelcome.enabled": False,
+    "browser.newtabpage.enabled": False,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "browser.search.update": False,
+    "browser.shell.checkDefaultBrowser": False,
+    "browser.startup.homepage_override.mstone": "ignore",
+    "browser.startup.page": 0,
+    "browser.translations.enable": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "extensions.update.enabled": False,
+    "identity.fxaccounts.enabled": False,
+    "network.captive-portal-service.enabled": False,
+    "network.connectivity-service.enabled": False,
+    "toolkit.telemetry.enabled": False,
+}
+
 
 class BrowserChoice(Enum):
     """Browser choices enum"""
@@ -19,6 +71,14 @@ class BrowserChoice(Enum):
     SAFARI = "safari"
 
 
+class ResourceType(Enum):
+    """Resource types that can be blocked from loading"""
+
+    IMAGES = "images"
+    FONTS = "fonts"
+    MEDIA = "media"
+
+
 class UnhandledAlertChoice(Enum):
     """Unhandled prompt option choice enum"""
 
@@ -29,6 +89,33 @@ class UnhandledAlertChoice(Enum):
     ACCEPT_NOTIFY = "accept and notify"
 
 
+# kept on the options object, never sent to the driver as capabilities
+_BLOCKED_URLS_ATTRIBUTE = "_webserpent_blocked_urls"
+_PROFILE_SNAPSHOT_ATTRIBUTE = "_webserpent_profile_snapshot"
+
+_BLOCKED_URL_PATTERNS = {
+    ResourceType.IMAGES: [],
+    ResourceType.FONTS: ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    ResourceType.MEDIA: ["*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav", "*.m4a", "*.m3u8"],
+}
+
+_BLOCKING_CHROME_PREFS = {
+    ResourceType.IMAGES: {"profile.managed_default_content_settings.images": 2},
+}
+
+_BLOCKING_FIREFOX_PREFS = {
+    ResourceType.IMAGES: {"permissions.default.image": 2},
+    ResourceType.FONTS: {"gfx.downloadable_fonts.enabled": False},
+    ResourceType.MEDIA: {"media.autoplay.default": 5, "media.autoplay.blocking_policy": 2},
+}
+
+
+_VENDOR_KEYS = {
+    BrowserChoice.CHROME: "goog:chromeOptions",
+    BrowserChoice.FIREFOX: "moz:firefoxOptions",
+}
+
+
 class BrowserOptions:
     """Builder class for creating Selenium WebDriver Options"""
 
@@ -40,8 +127,99 @@ class BrowserOptions:
             browser_choice (BrowserChoice)
         """
         self._options = None
+        self._browser_choice = browser_choice
         self._set_options(browser_choice)
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BrowserOptions":
+        """Rebuild a BrowserOptions from the output of to_dict
+
+        Args:
+            data (Dict[str, Any])
+
+        Raises:
+            ValueError: for vendor options that can not be restored
+
+        Returns:
+            BrowserOptions
+        """
+        builder = cls(BrowserChoice(data["browser"]))
+        capabilities = dict(data["capabilities"])
+        vendor_key = _VENDOR_KEYS.get(builder._browser_choice)
+        vendor = dict(capabilities.pop(vendor_key, {})) if vendor_key else {}
+
+        for argument in vendor.pop("args", []):
+            builder._options.add_argument(argument)
+        if "binary" in vendor:
+            builder._options.binary_location = vendor.pop("binary")
+        if isinstance(builder._options, ChromeOptions):
+            for extension in vendor.pop("extensions", []):
+                builder._options.add_encoded_extension(extension)
+            for name, value in vendor.items():
+                builder._options.add_experimental_option(name, value)
+        elif isinstance(builder._options, FirefoxOptions):
+            for name, value in vendor.pop("prefs", {}).items():
+                builder._options.set_preference(name, value)
+            if "log" in vendor:
+                builder._options.log.level = vendor.pop("log").get("level")
+            if vendor:
+                raise ValueError(f"Unsupported firefox options: {sorted(vendor)}")
+
+        for name, value in capabilities.items():
+            builder._options.set_capability(name, value)
+        if data.get("blocked_urls"):
+            builder.block_urls(data["blocked_urls"])
+        if data.get("profile_snapshot"):
+            builder.use_profile_snapshot(data["profile_snapshot"])
+        return builder
+
+    @classmethod
+    def from_json(cls, source: str) -> "BrowserOptions":
+        """Rebuild a BrowserOptions from a JSON string or a path to a JSON file
+
+        Args:
+            source (str)
+
+        Returns:
+            BrowserOptions
+        """
+        if source.lstrip().startswith("{"):
+            return cls.from_dict(json.loads(source))
+        with open(source, encoding="utf-8") as json_file:
+            return cls.from_dict(json.load(json_file))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export the browser choice and the capabilities dict built so far
+
+        Returns:
+            Dict[str, Any]
+        """
+        data = {
+            "browser": self._browser_choice.value,
+            "capabilities": self._options.to_capabilities(),
+        }
+        if blocked_urls(self._options):
+            data["blocked_urls"] = blocked_urls(self._options)
+        if profile_snapshot(self._options):
+            data["profile_snapshot"] = profile_snapshot(self._options)
+        # round trip through json so the result shares no lists with the options
+        return json.loads(json.dumps(data))
+
+    def to_json(self, path: str = "") -> str:
+        """Export to JSON, also writing it to path when one is given
+
+        Args:
+            path (str, optional): Defaults to ''.
+
+        Returns:
+            str
+        """
+        content = json.dumps(self.to_dict(), indent=2, sort_keys=True)
+        if path:
+            with open(path, "w", encoding="utf-8") as json_file:
+                json_file.write(content)
+        return content
+
     def get(self) -> Union[ChromeOptions, FirefoxOptions, SafariOptions]:
         """return the webdriver options
 
@@ -122,8 +300,8 @@ class BrowserOptions:
             Chrome, Firefox
         """
         if isinstance(self._options, ChromeOptions):
-            self._options.add_experimental_option(
-                "prefs", {"profile.default_content_setting_values.notifications": 2}
+            self._add_chrome_prefs(
+                {"profile.default_content_setting_values.notifications": 2}
             )
         elif isinstance(self._options, FirefoxOptions):
             self._options.set_preference("dom.webnotifications.enabled", False)
@@ -180,6 +358,35 @@ class BrowserOptions:
         if isinstance(self._options, ChromeOptions):
             self._options.add_argument("--disable-infobars")
 
+    def use_profile(self, path: str):
+        """Runs the browser with the given user data dir (Chrome) or profile
+        directory (Firefox). Only one browser can use a directory at a time.
+
+        Args:
+            path (str)
+
+        Browsers:
+            Chrome, Firefox
+        """
+        if isinstance(self._options, (ChromeOptions, FirefoxOptions)):
+            for argument in profile_arguments(self._options, path):
+                self._options.add_argument(argument)
+
+    def use_profile_snapshot(self, golden_dir: str):
+        """Starts every session from its own clone of a golden profile warmed
+        with profile_snapshot.warm_profile. The path is kept on the options
+        object and get_local makes the clone, get_remote can not clone a local
+        directory and ignores it with a warning.
+
+        Args:
+            golden_dir (str)
+
+        Browsers:
+            Chrome, Firefox
+        """
+        if isinstance(self._options, (ChromeOptions, FirefoxOptions)):
+            setattr(self._options, _PROFILE_SNAPSHOT_ATTRIBUTE, golden_dir)
+
     def enable_experimental_webdriver_features(self):
         """Opt-in to new WebDriver capabilities or experimental browser features.
 
@@ -191,6 +398,74 @@ class BrowserOptions:
                 "excludeSwitches", ["enable-automation"]
             )
 
+    def block_resources(self, *resource_types: ResourceType):
+        """Stops images, web fonts or media from loading. Chrome blocks images
+        through a content setting and fonts and media through url patterns that
+        get_local applies over CDP; Firefox uses the matching prefs.
+
+        Args:
+            *resource_types (ResourceType)
+
+        Browsers:
+            Chrome, Firefox
+        """
+        for resource_type in resource_types:
+            if isinstance(self._options, ChromeOptions):
+                if resource_type in _BLOCKING_CHROME_PREFS:
+                    self._add_chrome_prefs(_BLOCKING_CHROME_PREFS[resource_type])
+                self.block_urls(_BLOCKED_URL_PATTERNS[resource_type])
+            elif isinstance(self._options, FirefoxOptions):
+                for name, value in _BLOCKING_FIREFOX_PREFS[resource_type].items():
+                    self._options.set_preference(name, value)
+
+    def block_urls(self, patterns: List[str]):
+        """Blocks requests to urls matching the given wildcard patterns, such as
+        "*google-analytics.com*" or "*.png". The patterns are kept on the options
+        object and applied over CDP when the driver comes out of get_local or
+        get_remote. Other browsers have no url blocking, they get a warning.
+
+        Args:
+            patterns (List[str])
+
+        Browsers:
+            Chrome
+        """
+        if not isinstance(self._options, ChromeOptions):
+            warnings.warn(
+                f"block_urls is not supported on {self._browser_choice.value}, "
+                "the patterns are ignored",
+                stacklevel=2,
+            )
+            return
+        if patterns:
+            blocked = blocked_urls(self._options)
+            blocked.extend(pattern for pattern in patterns if pattern not in blocked)
+            setattr(self._options, _BLOCKED_URLS_ATTRIBUTE, blocked)
+
+    def apply_fast_profile(self):
+        """Turns on a curated set of flags and prefs for fast headless CI runs.
+        Background networking, component and extension updates, renderer
+        backgrounding, first-run screens, translate, sync and telemetry are
+        switched off.
+
+        Browsers:
+            Chrome, Firefox
+        """
+        if isinstance(self._options, ChromeOptions):
+            for argument in _FAST_CHROME_ARGUMENTS:
+                if argument not in self._options.arguments:
+                    self._options.add_argument(argument)
+            self._add_chrome_prefs(_FAST_CHROME_PREFS)
+        elif isinstance(self._options, FirefoxOptions):
+            for name, value in _FAST_FIREFOX_PREFS.items():
+                self._options.set_preference(name, value)
+
+    def _add_chrome_prefs(self, prefs: Dict):
+        # chrome keeps all prefs under one experimental option, merge instead of replacing
+        merged = dict(self._options.experimental_options.get("prefs", {}))
+        merged.update(prefs)
+        self._options.add_experimental_option("prefs", merged)
+
     def _set_options(self, browser_choice: BrowserChoice):
         match browser_choice:
             case BrowserChoice.CHROME:
@@ -199,3 +474,46 @@ class BrowserOptions:
                 self._options = FirefoxOptions()
             case BrowserChoice.SAFARI:
                 self._options = SafariOptions()
+
+
+def blocked_urls(browser_options: Union[ChromeOptions, FirefoxOptions, SafariOptions]) -> List[str]:
+    """Url patterns block_urls stored on the options
+
+    Args:
+        browser_options (Union[ChromeOptions, FirefoxOptions, SafariOptions])
+
+    Returns:
+        List[str]
+    """
+    return list(getattr(browser_options, _BLOCKED_URLS_ATTRIBUTE, []))
+
+
+def profile_snapshot(
+    browser_options: Union[ChromeOptions, FirefoxOptions, SafariOptions]
+) -> Optional[str]:
+    """Golden profile directory use_profile_snapshot stored on the options
+
+    Args:
+        browser_options (Union[ChromeOptions, FirefoxOptions, SafariOptions])
+
+    Returns:
+        Optional[str]
+    """
+    return getattr(browser_options, _PROFILE_SNAPSHOT_ATTRIBUTE, None)
+
+
+def profile_arguments(
+    browser_options: Union[ChromeOptions, FirefoxOptions], path: str
+) -> List[str]:
+    """Command line arguments that point a browser at a profile directory
+
+    Args:
+        browser_options (Union[ChromeOptions, FirefoxOptions])
+        path (str)
+
+    Returns:
+        List[str]
+    """
+    if isinstance(browser_options, ChromeOptions):
+        return [f"--user-data-dir={path}"]
+    return ["-profile", path]
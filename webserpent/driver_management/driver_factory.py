@@ -1,24 +1,63 @@
 """Module for creating webdrivers"""
 
-from typing import Union
+import copy
+import shutil
+import threading
+import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple, Union
 
 from selenium import webdriver
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from webserpent.driver_management.binary_cache import BinaryCache
 from webserpent.driver_management.browser_options import (
     ChromeOptions,
     FirefoxOptions,
     SafariOptions,
+    blocked_urls,
+    profile_arguments,
+    profile_snapshot,
 )
+from webserpent.driver_management.profile_snapshot import clone_profile
 
 # TODO: ADD system logging
 
+_remote_connections: Dict[Tuple[str, int, float, bool], "_SharedRemoteConnection"] = {}
+_remote_lock = threading.Lock()
 
-def get_local(browser_options: Union[ChromeOptions, FirefoxOptions, SafariOptions]) -> WebDriver:
+
+class _SharedRemoteConnection(RemoteConnection):
+    """RemoteConnection shared by every session to one endpoint. quit() on a
+    driver would clear the connection pool, so close() is a no-op and the
+    pool is only torn down by close_remote_connections. The Chrome CDP command
+    is registered so block lists can be applied to remote Chrome sessions."""
+
+    def __init__(self, client_config: ClientConfig):
+        super().__init__(client_config=client_config)
+        self._commands["executeCdpCommand"] = ("POST", "/session/$sessionId/goog/cdp/execute")
+
+    def close(self):
+        pass
+
+    def shutdown(self):
+        super().close()
+
+
+def get_local(
+    browser_options: Union[ChromeOptions, FirefoxOptions, SafariOptions],
+    binary_cache: Optional[BinaryCache] = None,
+) -> WebDriver:
     """get a local driver based on browser options type
 
     Args:
         browser_options (Union[ChromeOptions, FirefoxOptions, SafariOptions])
+        binary_cache (Optional[BinaryCache], optional): when given, Chrome and
+            Firefox launch with the cached driver and browser binaries instead
+            of asking Selenium Manager every time. Defaults to None.
 
     Raises:
         TypeError: when non supported browser type passed
@@ -26,10 +65,169 @@ def get_local(browser_options: Union[ChromeOptions, FirefoxOptions, SafariOption
     Returns:
         WebDriver 
     """
-    if isinstance(browser_options, ChromeOptions):
-        return webdriver.Chrome(options=browser_options)
-    if isinstance(browser_options, FirefoxOptions):
-        return webdriver.Firefox(options=browser_options)
     if isinstance(browser_options, SafariOptions):
         return webdriver.Safari(options=browser_options)
-    raise TypeError("Unsupported browser options provided.")
+    if not isinstance(browser_options, (ChromeOptions, FirefoxOptions)):
+        raise TypeError("Unsupported browser options provided.")
+
+    profile_dir = None
+    golden_dir = profile_snapshot(browser_options)
+    if golden_dir:
+        profile_dir = clone_profile(golden_dir)
+        browser_options = copy.deepcopy(browser_options)
+        for argument in profile_arguments(browser_options, profile_dir):
+            browser_options.add_argument(argument)
+
+    if isinstance(browser_options, ChromeOptions):
+        driver_class = webdriver.Chrome
+    else:
+        driver_class = webdriver.Firefox
+    try:
+        if binary_cache:
+            options, service = binary_cache.prepare(browser_options)
+            driver = driver_class(options=options, service=service)
+        else:
+            driver = driver_class(options=browser_options)
+    except Exception:
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+        raise
+
+    if profile_dir:
+        _remove_on_quit(driver, profile_dir)
+    _block_urls(driver, browser_options)
+    return driver
+
+
+def _remove_on_quit(driver: WebDriver, profile_dir: str):
+    """delete the cloned profile when the driver quits, or when it is garbage
+    collected without quitting"""
+    cleanup = weakref.finalize(driver, shutil.rmtree, profile_dir, True)
+    quit_driver = driver.quit
+
+    def quit_and_remove():
+        try:
+            quit_driver()
+        finally:
+            cleanup()
+
+    driver.quit = quit_and_remove
+
+
+def _block_urls(driver: WebDriver, browser_options: Union[ChromeOptions, FirefoxOptions]):
+    """apply the url block list declared on the options through CDP, quitting
+    the driver when that fails"""
+    patterns = blocked_urls(browser_options)
+    if not patterns:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception:
+        driver.quit()
+        raise
+
+
+def get_remote(
+    url: str,
+    browser_options: Union[ChromeOptions, FirefoxOptions, SafariOptions],
+    pool_size: int = 10,
+    timeout: float = 120,
+    keep_alive: bool = True,
+) -> WebDriver:
+    """get a remote driver from a Selenium Grid or a standalone driver server.
+    Sessions to the same url with the same settings share one RemoteConnection,
+    so keep-alive sockets are reused across sessions and threads. Chrome url
+    block lists are applied over the CDP endpoint of the remote end. A profile
+    snapshot is local to this machine and is not used.
+
+    Args:
+        url (str): e.g. http://grid:4444
+        browser_options (Union[ChromeOptions, FirefoxOptions, SafariOptions])
+        pool_size (int, optional): connections kept open to the url. Defaults to 10.
+        timeout (float, optional): seconds per command. Defaults to 120.
+        keep_alive (bool, optional): Defaults to True.
+
+    Raises:
+        TypeError: when non supported browser type passed
+        WebDriverException: when the remote end can not apply the url block list
+
+    Returns:
+        WebDriver
+    """
+    if not isinstance(browser_options, (ChromeOptions, FirefoxOptions, SafariOptions)):
+        raise TypeError("Unsupported browser options provided.")
+    if profile_snapshot(browser_options):
+        warnings.warn(
+            "get_remote can not clone a local profile snapshot, the session starts "
+            "from a fresh profile",
+            stacklevel=2,
+        )
+    driver = webdriver.Remote(
+        command_executor=_remote_connection(url, pool_size, timeout, keep_alive),
+        options=browser_options,
+    )
+    _block_urls(driver, browser_options)
+    return driver
+
+
+def close_remote_connections():
+    """close the pooled connections opened by get_remote"""
+    with _remote_lock:
+        connections = list(_remote_connections.values())
+        _remote_connections.clear()
+    for connection in connections:
+        connection.shutdown()
+
+
+def _remote_connection(
+    url: str, pool_size: int, timeout: float, keep_alive: bool
+) -> "_SharedRemoteConnection":
+    key = (url.rstrip("/"), pool_size, timeout, keep_alive)
+    with _remote_lock:
+        if key not in _remote_connections:
+            client_config = ClientConfig(
+                remote_server_addr=key[0],
+                keep_alive=keep_alive,
+                timeout=timeout,
+                init_args_for_pool_manager={
+                    "init_args_for_pool_manager": {"maxsize": pool_size, "block": False}
+                },
+            )
+            _remote_connections[key] = _SharedRemoteConnection(client_config=client_config)
+        return _remote_connections[key]
+
+
+def get_local_many(
+    browser_options: Union[ChromeOptions, FirefoxOptions, SafariOptions],
+    n: int,
+    max_workers: Optional[int] = None,
+    binary_cache: Optional[BinaryCache] = None,
+) -> Tuple[List[WebDriver], List[Exception]]:
+    """launch several local drivers concurrently
+
+    Args:
+        browser_options (Union[ChromeOptions, FirefoxOptions, SafariOptions])
+        n (int): number of drivers to launch
+        max_workers (Optional[int], optional): cap on concurrent launches.
+            Defaults to n.
+        binary_cache (Optional[BinaryCache], optional): passed to get_local.
+            Defaults to None.
+
+    Returns:
+        Tuple[List[WebDriver], List[Exception]]: the drivers that started and
+            the errors of the launches that failed
+    """
+    drivers = []
+    failures = []
+    if n < 1:
+        return drivers, failures
+
+    with ThreadPoolExecutor(max_workers=max_workers or n) as executor:
+        futures = [executor.submit(get_local, browser_options, binary_cache) for _ in range(n)]
+        for future in as_completed(futures):
+            try:
+                drivers.append(future.result())
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                failures.append(e)
+    return drivers, failures
@@ -0,0 +1,295 @@
+"""Module for pooling pre-launched webdrivers"""
+
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, Optional, Union
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from webserpent.driver_management.browser_options import (
+    ChromeOptions,
+    FirefoxOptions,
+    SafariOptions,
+    blocked_urls,
+    profile_snapshot,
+)
+from webserpent.driver_management.driver_factory import get_local
+from webserpent.driver_management.recycle_policy import RecyclePolicy
+from webserpent.driver_management.session_reset import reset_session
+
+Options = Union[ChromeOptions, FirefoxOptions, SafariOptions]
+
+
+def _default_reset(driver: WebDriver):
+    """Bring a driver back to a blank state between leases"""
+    reset_session(driver)
+
+
+def options_key(browser_options: Options) -> str:
+    """Build a stable key for a browser options configuration, including the
+    settings webserpent keeps off the capabilities
+
+    Args:
+        browser_options (Union[ChromeOptions, FirefoxOptions, SafariOptions])
+
+    Returns:
+        str
+    """
+    return json.dumps(
+        [
+            type(browser_options).__name__,
+            browser_options.to_capabilities(),
+            blocked_urls(browser_options),
+            profile_snapshot(browser_options),
+        ],
+        sort_keys=True,
+        default=str,
+    )
+
+
+class _Slot:
+    """Idle drivers and launch bookkeeping for one options configuration"""
+
+    def __init__(self, browser_options: Options):
+        self.options = browser_options
+        self.idle: Deque["_Record"] = deque()
+        self.launching = 0
+        self.leased = 0
+        self.retiring = 0
+        self.error: Optional[BaseException] = None
+
+
+class _Record:
+    """A pooled driver with its launch time and lease count"""
+
+    def __init__(self, driver: WebDriver, slot: _Slot):
+        self.driver = driver
+        self.slot = slot
+        self.born = time.monotonic()
+        self.uses = 0
+        self.final = False
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.born
+
+
+class DriverPool:
+    """Keeps pre-launched webdrivers per browser options configuration and
+    hands them out with acquire/release. Drivers are reset between leases and
+    leased again, and the pool is refilled in the background when drivers
+    are retired. With a RecyclePolicy, drivers are
+    retired once they are due and a replacement is launched as soon as a lease
+    is known to be the last one of its driver: when the next use is due, or
+    when the memory measured on release passes the soft limit."""
+
+    def __init__(
+        self,
+        size: int = 2,
+        factory: Callable[[Options], WebDriver] = get_local,
+        reset: Callable[[WebDriver], None] = _default_reset,
+        recycle_policy: Optional[RecyclePolicy] = None,
+    ):
+        """
+        Args:
+            size (int, optional): drivers kept per configuration, leased ones
+                included. Defaults to 2.
+            factory (Callable, optional): launches a driver. Defaults to get_local.
+            reset (Callable, optional): cleans a driver between leases.
+            recycle_policy (Optional[RecyclePolicy], optional): Defaults to None.
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self._size = size
+        self._factory = factory
+        self._reset = reset
+        self._policy = recycle_policy
+        self._slots: Dict[str, _Slot] = {}
+        self._leased: Dict[int, _Record] = {}
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(thread_name_prefix="webserpent-pool")
+        self._closed = False
+
+    def warm(self, browser_options: Options):
+        """Start launching drivers for a configuration without acquiring one
+
+        Args:
+            browser_options (Union[ChromeOptions, FirefoxOptions, SafariOptions])
+        """
+        with self._condition:
+            self._refill(self._slot(browser_options))
+
+    def acquire(self, browser_options: Options, timeout: float = 60) -> WebDriver:
+        """Take a ready driver for the given configuration, waiting for a
+        launch to finish if none is idle.
+
+        Args:
+            browser_options (Union[ChromeOptions, FirefoxOptions, SafariOptions])
+            timeout (float, optional): Defaults to 60.
+
+        Raises:
+            TimeoutError: when no driver became ready in time
+            Exception: the launch error when launches for this configuration fail
+
+        Returns:
+            WebDriver
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Driver pool is closed")
+            slot = self._slot(browser_options)
+            slot.error = None
+            self._refill(slot)
+            ready = self._condition.wait_for(
+                lambda: slot.idle or (slot.error and not slot.launching), timeout
+            )
+            if not ready:
+                raise TimeoutError("Timed out waiting for a pooled driver")
+            if not slot.idle:
+                raise slot.error
+            record = slot.idle.popleft()
+            record.uses += 1
+            if not record.final and self._policy and self._policy.due(record.uses, record.age):
+                record.final = True
+                slot.retiring += 1
+            self._leased[id(record.driver)] = record
+            slot.leased += 1
+            self._refill(slot)
+            return record.driver
+
+    def release(self, driver: WebDriver, discard: bool = False):
+        """Return a driver to the pool. The driver is reset before it can be
+        leased again, and quit instead when reset fails or discard is True.
+
+        Args:
+            driver (WebDriver)
+            discard (bool, optional): Defaults to False.
+        """
+        with self._condition:
+            record = self._leased.pop(id(driver), None)
+        if record is None:
+            raise ValueError("Driver was not leased from this pool")
+
+        retire = discard or record.final
+        last_lease_next = False
+        if not retire and self._policy:
+            ratio = self._policy.rss_ratio(driver)
+            if ratio is not None and ratio > 1:
+                retire = True
+            elif ratio is not None and ratio >= self._policy.soft_rss_ratio:
+                last_lease_next = True
+        try:
+            if not retire:
+                self._reset(driver)
+        except WebDriverException:
+            retire = True
+        except BaseException:
+            # a broken reset callable must not leak the browser
+            self._return(record, retire=True)
+            raise
+        self._return(record, retire, last_lease_next)
+
+    def _return(self, record: "_Record", retire: bool, last_lease_next: bool = False):
+        """Put a released driver back in its slot, or quit it"""
+        driver = record.driver
+        with self._condition:
+            slot = record.slot
+            slot.leased -= 1
+            if record.final:
+                slot.retiring -= 1
+                record.final = False
+            keep = not (retire or self._closed or len(slot.idle) >= self._size)
+            if keep:
+                if last_lease_next:
+                    record.final = True
+                    slot.retiring += 1
+                slot.idle.append(record)
+                self._condition.notify_all()
+            self._refill(slot)
+            if not keep and not self._closed:
+                self._executor.submit(_quit, driver)
+                return
+        if not keep:
+            _quit(driver)
+
+    @contextmanager
+    def lease(self, browser_options: Options, timeout: float = 60) -> Iterator[WebDriver]:
+        """Context manager around acquire and release
+
+        Args:
+            browser_options (Union[ChromeOptions, FirefoxOptions, SafariOptions])
+            timeout (float, optional): Defaults to 60.
+
+        Yields:
+            WebDriver
+        """
+        driver = self.acquire(browser_options, timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self):
+        """Quit all idle drivers. Drivers still leased are quit on release."""
+        with self._condition:
+            self._closed = True
+            idle = [record.driver for slot in self._slots.values() for record in slot.idle]
+            for slot in self._slots.values():
+                slot.idle.clear()
+            self._condition.notify_all()
+        for driver in idle:
+            _quit(driver)
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "DriverPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _slot(self, browser_options: Options) -> _Slot:
+        key = options_key(browser_options)
+        if key not in self._slots:
+            self._slots[key] = _Slot(browser_options)
+        return self._slots[key]
+
+    def _refill(self, slot: _Slot):
+        # caller must hold self._condition
+        if self._closed or slot.error:
+            return
+        # leased drivers come back after a reset, only drivers on their final
+        # lease need a replacement on the way
+        while len(slot.idle) + slot.launching + slot.leased < self._size + slot.retiring:
+            slot.launching += 1
+            self._executor.submit(self._launch, slot)
+
+    def _launch(self, slot: _Slot):
+        try:
+            driver = self._factory(slot.options)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            with self._condition:
+                slot.launching -= 1
+                slot.error = e
+                self._condition.notify_all()
+            return
+
+        with self._condition:
+            slot.launching -= 1
+            closed = self._closed
+            if not closed:
+                slot.idle.append(_Record(driver, slot))
+                self._condition.notify_all()
+        if closed:
+            _quit(driver)
+
+
+def _quit(driver: WebDriver):
+    try:
+        driver.quit()
+    except WebDriverException:
+        pass
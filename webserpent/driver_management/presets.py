@@ -0,0 +1,94 @@
+"""Module for named, memoized browser options presets"""
+
+import json
+import threading
+from typing import Any, Dict, List, Union
+
+from webserpent.driver_management.browser_options import (
+    BrowserOptions,
+    ChromeOptions,
+    FirefoxOptions,
+    SafariOptions,
+)
+
+_definitions: Dict[str, Dict[str, Any]] = {}
+_built: Dict[str, Union[ChromeOptions, FirefoxOptions, SafariOptions]] = {}
+_lock = threading.Lock()
+
+
+def register_preset(name: str, browser_options: Union[BrowserOptions, Dict[str, Any]]):
+    """Register a preset from a BrowserOptions builder or its to_dict output.
+    Registering a name again replaces the preset.
+
+    Args:
+        name (str)
+        browser_options (Union[BrowserOptions, Dict[str, Any]])
+    """
+    if isinstance(browser_options, BrowserOptions):
+        browser_options = browser_options.to_dict()
+    with _lock:
+        _definitions[name] = browser_options
+        _built.pop(name, None)
+
+
+def get_preset(name: str) -> Union[ChromeOptions, FirefoxOptions, SafariOptions]:
+    """Get the options object for a preset. The object is built once and the
+    same instance is returned on every call, so it must not be modified.
+
+    Args:
+        name (str)
+
+    Raises:
+        KeyError: when no preset has that name
+
+    Returns:
+        Union[ChromeOptions, FirefoxOptions, SafariOptions]
+    """
+    with _lock:
+        if name not in _built:
+            if name not in _definitions:
+                raise KeyError(f"No browser options preset named '{name}'")
+            _built[name] = BrowserOptions.from_dict(_definitions[name]).get()
+        return _built[name]
+
+
+def list_presets() -> List[str]:
+    """Names of the registered presets
+
+    Returns:
+        List[str]
+    """
+    with _lock:
+        return sorted(_definitions)
+
+
+def export_presets(path: str):
+    """Write every registered preset to a JSON file, for load_presets in
+    worker processes
+
+    Args:
+        path (str)
+    """
+    with _lock:
+        content = json.dumps(_definitions, indent=2, sort_keys=True)
+    with open(path, "w", encoding="utf-8") as json_file:
+        json_file.write(content)
+
+
+def load_presets(path: str):
+    """Register every preset found in a file written by export_presets
+
+    Args:
+        path (str)
+    """
+    with open(path, encoding="utf-8") as json_file:
+        definitions = json.load(json_file)
+    for name, definition in definitions.items():
+        register_preset(name, definition)
+
+
+def clear_presets():
+    """Forget every registered preset"""
+    with _lock:
+        _definitions.clear()
+        _built.clear()
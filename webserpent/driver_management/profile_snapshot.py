@@ -0,0 +1,102 @@
+"""Module for warming a golden browser profile and cloning it per session"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from typing import Callable, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from webserpent.driver_management.browser_options import BrowserOptions, DriverOptions
+
+# lock files of a running browser, never copied into a clone
+_LOCK_FILES = {
+    "SingletonLock",
+    "SingletonSocket",
+    "SingletonCookie",
+    "lock",
+    ".parentlock",
+    "parent.lock",
+}
+
+
+def warm_profile(
+    browser_options: BrowserOptions,
+    golden_dir: str,
+    urls: List[str],
+    factory: Optional[Callable[[DriverOptions], WebDriver]] = None,
+):
+    """Fill a golden profile directory by visiting urls once, so its HTTP, DNS
+    and compiled code caches are populated before sessions clone it.
+
+    Args:
+        browser_options (BrowserOptions): builder used for the warming session
+        golden_dir (str)
+        urls (List[str])
+        factory (Callable, optional): launches the driver. Defaults to get_local.
+    """
+    if factory is None:
+        # imported here, driver_factory imports this module
+        # pylint: disable-next=import-outside-toplevel
+        from webserpent.driver_management.driver_factory import get_local
+
+        factory = get_local
+    os.makedirs(golden_dir, exist_ok=True)
+    warming_options = BrowserOptions.from_dict(browser_options.to_dict())
+    warming_options.use_profile(golden_dir)
+    driver = factory(warming_options.get())
+    try:
+        for url in urls:
+            driver.get(url)
+    finally:
+        # a clean quit lets the browser flush its caches to disk
+        driver.quit()
+
+
+def clone_profile(golden_dir: str, dest: Optional[str] = None) -> str:
+    """Copy a golden profile for one session. A copy-on-write reflink is used
+    when the filesystem supports it, otherwise a regular copy is made.
+
+    Args:
+        golden_dir (str)
+        dest (Optional[str], optional): Defaults to a new temporary directory.
+
+    Raises:
+        FileNotFoundError: when the golden profile does not exist
+
+    Returns:
+        str: path of the clone
+    """
+    if not os.path.isdir(golden_dir):
+        raise FileNotFoundError(f"No golden profile at {golden_dir}")
+    if dest is None:
+        dest = tempfile.mkdtemp(prefix="webserpent-profile-")
+    os.makedirs(dest, exist_ok=True)
+
+    if not _reflink_copy(golden_dir, dest):
+        # a failed reflink can leave part of the tree behind
+        shutil.rmtree(dest, ignore_errors=True)
+        shutil.copytree(
+            golden_dir,
+            dest,
+            symlinks=True,
+            dirs_exist_ok=True,
+            ignore=shutil.ignore_patterns(*_LOCK_FILES),
+        )
+    for name in _LOCK_FILES:
+        path = os.path.join(dest, name)
+        if os.path.lexists(path):
+            os.remove(path)
+    return dest
+
+
+def _reflink_copy(source: str, dest: str) -> bool:
+    if shutil.which("cp") is None:
+        return False
+    result = subprocess.run(
+        ["cp", "-a", "--reflink=always", os.path.join(source, "."), dest],
+        capture_output=True,
+        check=False,
+    )
+    return result.returncode == 0
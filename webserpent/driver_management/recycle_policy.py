@@ -0,0 +1,141 @@
+"""Module for deciding when pooled webdrivers should be retired"""
+
+import os
+from typing import Dict, List, Optional
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class RecyclePolicy:
+    """Retire a driver after a number of uses, after an age limit or when the
+    resident memory of the browser process tree crosses a threshold. Past the
+    soft share of that threshold a driver gets one more lease, so its
+    replacement can launch while that lease runs."""
+
+    def __init__(
+        self,
+        max_uses: Optional[int] = None,
+        max_age_minutes: Optional[float] = None,
+        max_rss_mb: Optional[float] = None,
+        proc_root: str = "/proc",
+        soft_rss_ratio: float = 0.8,
+    ):
+        """
+        Args:
+            max_uses (Optional[int], optional): leases before retirement. Defaults to None.
+            max_age_minutes (Optional[float], optional): minutes since launch. Defaults to None.
+            max_rss_mb (Optional[float], optional): RSS of the driver process tree.
+                Defaults to None.
+            proc_root (str, optional): Defaults to "/proc".
+            soft_rss_ratio (float, optional): share of max_rss_mb from which the
+                next lease is the last one. Defaults to 0.8.
+        """
+        self.max_uses = max_uses
+        self.max_age_minutes = max_age_minutes
+        self.max_rss_mb = max_rss_mb
+        self.soft_rss_ratio = soft_rss_ratio
+        self._proc_root = proc_root
+
+    def due(self, uses: int, age_seconds: float) -> bool:
+        """Return if the use count or age of a driver calls for retirement
+
+        Args:
+            uses (int)
+            age_seconds (float)
+
+        Returns:
+            bool
+        """
+        if self.max_uses is not None and uses >= self.max_uses:
+            return True
+        if self.max_age_minutes is not None and age_seconds >= self.max_age_minutes * 60:
+            return True
+        return False
+
+    def over_memory(self, driver: WebDriver) -> bool:
+        """Return if the driver process tree uses more memory than allowed.
+        Drivers without a local service process never count as over.
+
+        Args:
+            driver (WebDriver)
+
+        Returns:
+            bool
+        """
+        ratio = self.rss_ratio(driver)
+        return ratio is not None and ratio > 1
+
+    def rss_ratio(self, driver: WebDriver) -> Optional[float]:
+        """Return the driver process tree memory as a share of max_rss_mb
+
+        Args:
+            driver (WebDriver)
+
+        Returns:
+            Optional[float]: None without a memory limit or a local service process
+        """
+        if self.max_rss_mb is None:
+            return None
+        rss = browser_rss_bytes(driver, self._proc_root)
+        if rss is None:
+            return None
+        return rss / (self.max_rss_mb * 1024 * 1024)
+
+
+def browser_rss_bytes(driver: WebDriver, proc_root: str = "/proc") -> Optional[int]:
+    """Sum the resident memory of the driver service process and every
+    browser process started below it, read from /proc.
+
+    Args:
+        driver (WebDriver)
+        proc_root (str, optional): Defaults to "/proc".
+
+    Returns:
+        Optional[int]: bytes, or None when the process tree can not be read
+    """
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    pid = getattr(process, "pid", None)
+    if pid is None or not os.path.isdir(proc_root):
+        return None
+
+    children = _children_by_pid(proc_root)
+    total = 0
+    found = False
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        rss = _rss_of(proc_root, current)
+        if rss is not None:
+            total += rss
+            found = True
+        pending.extend(children.get(current, []))
+    return total if found else None
+
+
+def _children_by_pid(proc_root: str) -> Dict[int, List[int]]:
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir(proc_root):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(os.path.join(proc_root, entry, "stat"), encoding="utf-8") as stat:
+                content = stat.read()
+        except OSError:
+            continue
+        # the command name may contain spaces, so split after its closing paren
+        fields = content[content.rfind(")") + 2 :].split()
+        if len(fields) > 1:
+            children.setdefault(int(fields[1]), []).append(int(entry))
+    return children
+
+
+def _rss_of(proc_root: str, pid: int) -> Optional[int]:
+    try:
+        with open(os.path.join(proc_root, str(pid), "status"), encoding="utf-8") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        return None
+    return 0
@@ -2,6 +2,8 @@ from typing import Union
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from webserpent.driver_management.session_reset import reset_session
+
 # TODO: add logging
 
 class Browser:
@@ -44,3 +46,12 @@ class Browser:
                 return self._driver.get_screenshot_as_base64()
             case 'png':
                 self._driver.get_screenshot_as_file(path)
+
+    def reset(self) -> float:
+        """Bring the session back to a fresh state without relaunching the browser,
+        see reset_session for what is cleared on each browser.
+
+        Returns:
+            float: seconds the reset took
+        """
+        return reset_session(self._driver)
@@ -0,0 +1,289 @@
+"""Module for declaring page object elements as class attributes"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, Generic, List, Optional, Tuple, Type, TypeVar
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from webserpent.selenium.element import Element
+from webserpent.selenium.element_collection import ElementCollection
+from webserpent.selenium.wait import (
+    WaitEngine,
+    wait_for_element_to_exist,
+    wait_for_elements_to_exist,
+)
+
+T = TypeVar("T")
+C = TypeVar("C", bound="Component")
+R = TypeVar("R")
+
+
+class _LazyProxy(Generic[T]):
+    """Stands in for a field value and resolves it on first use. Attribute
+    reads and writes are forwarded, but a proxy is not the value itself:
+    isinstance and == see the proxy, and a copy shares the resolved value.
+    Call resolve() where the Element or ElementCollection itself is needed."""
+
+    __slots__ = ("_owner", "_field", "_target")
+
+    def __init__(self, owner, field: "_Field"):
+        object.__setattr__(self, "_owner", owner)
+        object.__setattr__(self, "_field", field)
+        object.__setattr__(self, "_target", None)
+
+    def resolve(self) -> T:
+        """Get the resolved value, finding it on the first call
+
+        Returns:
+            the Element or ElementCollection
+        """
+        if self._target is None:
+            object.__setattr__(self, "_target", self._field.find(self._owner))
+        return self._target
+
+    def reset(self):
+        """Drop the resolved value so the next use finds it again"""
+        object.__setattr__(self, "_target", None)
+
+    def __getattr__(self, name: str):
+        # unset slots, as on a copy being built, must not resolve
+        if name in _LazyProxy.__slots__:
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name: str, value):
+        if name in _LazyProxy.__slots__:
+            object.__setattr__(self, name, value)
+            return
+        setattr(self.resolve(), name, value)
+
+    def __repr__(self) -> str:
+        state = "resolved" if self._target is not None else "unresolved"
+        return f"<{type(self).__name__} {self._field.locator} {state}>"
+
+
+class ElementProxy(_LazyProxy[Element]):
+    """Lazy stand in for an Element"""
+
+    __slots__ = ()
+
+
+class CollectionProxy(_LazyProxy[ElementCollection]):
+    """Lazy stand in for an ElementCollection"""
+
+    __slots__ = ()
+
+    def __len__(self) -> int:
+        return len(self.resolve())
+
+    def __iter__(self):
+        return iter(self.resolve())
+
+    def __getitem__(self, index):
+        return self.resolve()[index]
+
+
+class _Field(ABC):
+    """Non data descriptor: the proxy built on first access is stored in the
+    instance __dict__ and shadows the descriptor from then on."""
+
+    proxy_class: Type[_LazyProxy] = _LazyProxy
+
+    def __init__(self, locator: Tuple[By, str], name: Optional[str] = None, timeout: int = 5):
+        """
+        Args:
+            locator (Tuple[By, str])
+            name (Optional[str], optional): Defaults to the attribute name.
+            timeout (int, optional): Defaults to 5.
+        """
+        self.locator = locator
+        self.name = name
+        self.timeout = timeout
+        self._attribute = ""
+
+    def __set_name__(self, owner, name: str):
+        self._attribute = name
+        if self.name is None:
+            self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        proxy = self.proxy_class(instance, self)
+        instance.__dict__[self._attribute] = proxy
+        return proxy
+
+    @abstractmethod
+    def find(self, owner):
+        """Find the value of the field
+
+        Args:
+            owner (Union[page, Component])
+        """
+
+
+class ElementField(_Field):
+    """Declares an element of a page object or component, found with
+    find_element on first use"""
+
+    proxy_class = ElementProxy
+
+    def find(self, owner) -> Element:
+        return owner.find_element(self.locator, self.name, self.timeout)
+
+
+class ElementsField(_Field):
+    """Declares a collection of elements of a page object or component, found
+    with find_elements on first use"""
+
+    proxy_class = CollectionProxy
+
+    def find(self, owner) -> ElementCollection:
+        return owner.find_elements(self.locator, self.name, self.timeout)
+
+
+class _RootSearchContext:
+    """Search context handed to elements found below a component root, so
+    they are re-found below the current root after going stale"""
+
+    __slots__ = ("_search",)
+
+    def __init__(self, search: Callable[[Callable[[WebElement], R]], R]):
+        self._search = search
+
+    def find_element(self, by: By, value: str) -> WebElement:
+        return self._search(lambda root: root.find_element(by, value))
+
+    def find_elements(self, by: By, value: str) -> List[WebElement]:
+        return self._search(lambda root: root.find_elements(by, value))
+
+
+class Component:
+    """A part of a page that declares its own fields. With a root locator its
+    fields are searched below the root element, otherwise in the whole page.
+    A root that went stale is found again through the parent."""
+
+    def __init__(
+        self,
+        parent,
+        root_locator: Optional[Tuple[By, str]] = None,
+        name: str = "",
+        timeout: int = 5,
+    ):
+        """
+        Args:
+            parent (Union[page, Component]): page object or component holding this one
+            root_locator (Optional[Tuple[By, str]], optional): Defaults to None.
+            name (str, optional): Defaults to "".
+            timeout (int, optional): wait for the root element. Defaults to 5.
+        """
+        self._parent = parent
+        self._driver: WebDriver = parent._driver
+        self._root_locator = root_locator
+        self._name = name
+        self._timeout = timeout
+        self._root: Optional[Element] = None
+        self._search_context = _RootSearchContext(self._search_root)
+
+    @property
+    def root(self) -> Optional[Element]:
+        """Get the root element, found on first use
+
+        Returns:
+            Optional[Element]
+        """
+        if self._root is None and self._root_locator is not None:
+            self._root = self._parent.find_element(self._root_locator, self._name, self._timeout)
+        return self._root
+
+    def _search_root(self, search: Callable[[WebElement], R]) -> R:
+        """Run a search below the root, finding the root again once when it went stale"""
+        root = self.root
+        try:
+            return search(root.web_element)
+        except StaleElementReferenceException as e:
+            self._root = None
+            if self.root is root:
+                # a page caching elements hands back the same root, it re-finds itself
+                root._reresolve(e, 0)  # pylint: disable=protected-access
+            return search(self.root.web_element)
+
+    def invalidate_cache(self):
+        """Forget the root element and everything the fields resolved"""
+        self._root = None
+        reset_fields(self)
+
+    def find_element(self, locator: Tuple[By, str], name: str, timeout: int = 5) -> Element:
+        if self.root is None:
+            return self._parent.find_element(locator, name, timeout)
+        # the observer engine searches the whole document, so poll below the root
+        web_element = self._search_root(
+            lambda root: wait_for_element_to_exist(
+                root, locator, timeout, engine=WaitEngine.POLLING
+            )
+        )
+        return Element(web_element, name, locator=locator, search_context=self._search_context)
+
+    def find_elements(
+        self, locator: Tuple[By, str], name: str, timeout: int = 5
+    ) -> ElementCollection:
+        if self.root is None:
+            return self._parent.find_elements(locator, name, timeout)
+        try:
+            web_elements = self._search_root(
+                lambda root: wait_for_elements_to_exist(root, locator, timeout)
+            )
+        except TimeoutException:
+            web_elements = []
+        return ElementCollection(web_elements, name)
+
+
+def reset_fields(instance):
+    """Drop what the fields of a page object or component resolved, so they
+    are found again on next use. Nested components are reset too.
+
+    Args:
+        instance (Union[page, Component])
+    """
+    for value in vars(instance).values():
+        if isinstance(value, _LazyProxy):
+            value.reset()
+        elif isinstance(value, Component):
+            value.invalidate_cache()
+
+
+class ComponentField(Generic[C]):
+    """Declares a nested component. The component is built on first access
+    and cached on the instance, its root is only found when it is used."""
+
+    def __init__(
+        self,
+        component_class: Type[C],
+        root_locator: Optional[Tuple[By, str]] = None,
+        timeout: int = 5,
+    ):
+        """
+        Args:
+            component_class (Type[Component])
+            root_locator (Optional[Tuple[By, str]], optional): Defaults to None.
+            timeout (int, optional): wait for the root element. Defaults to 5.
+        """
+        self.component_class = component_class
+        self.root_locator = root_locator
+        self.timeout = timeout
+        self._attribute = ""
+
+    def __set_name__(self, owner, name: str):
+        self._attribute = name
+
+    def __get__(self, instance, owner=None) -> C:
+        if instance is None:
+            return self
+        component = self.component_class(
+            instance, self.root_locator, self._attribute, self.timeout
+        )
+        instance.__dict__[self._attribute] = component
+        return component
@@ -1,24 +1,209 @@
-from typing import Tuple
+from typing import Dict, Iterable, List, Mapping, Tuple, Union
 
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from webserpent.selenium.wait import wait_for_element_to_exist, wait_for_alert
+from webserpent.exceptions.exceptions import SelectFailureException, SendTextFailureException
+from webserpent.pom.fields import reset_fields
+from webserpent.selenium.batch import ActionBatch
+from webserpent.selenium.wait import (
+    wait_for_alert,
+    wait_for_element_to_exist,
+    wait_for_elements_to_exist,
+)
 from webserpent.selenium.element import Element
+from webserpent.selenium.element_collection import ElementCollection
+from webserpent.selenium.scripts import call_script, register_script
 
 # TODO: add configurations
 # TODO: add logging
 
+FieldKey = Union[Tuple[By, str], str]
+FieldValue = Union[str, bool, List[str]]
+
+register_script(
+    "fillForm",
+    """
+function (fields) {
+    function fire(el) {
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    return fields.map(function (field) {
+        var by = field[0], locator = field[1], value = field[2], nativeKeys = field[3];
+        var elements = ws.findAll(by, locator);
+        if (!elements.length) { return {status: 'missing'}; }
+        var el = elements[0];
+        var type = (el.type || '').toLowerCase();
+        var control = el.tagName === 'SELECT' ? 'select'
+            : type === 'checkbox' || type === 'radio' ? type : 'text';
+        if (control === 'radio') {
+            // the radio group shares the name, the value picks the button
+            el = elements.filter(function (item) {
+                return value === true || item.value === String(value);
+            })[0];
+            if (!el) { return {status: 'no option', control: control}; }
+        }
+        if (el.disabled || el.readOnly) { return {status: 'disabled', control: control}; }
+        if (nativeKeys) { return {status: 'native', element: el}; }
+        if (control === 'checkbox') {
+            if (typeof value !== 'boolean') { return {status: 'not a bool', control: control}; }
+            if (el.checked !== value) { el.click(); }
+        } else if (control === 'radio') {
+            if (!el.checked) { el.click(); }
+        } else if (control === 'select') {
+            var wanted = [].concat(value).map(String);
+            var options = Array.prototype.slice.call(el.options);
+            var hits = options.filter(function (option) {
+                return wanted.indexOf(option.value) !== -1
+                    || wanted.indexOf(ws.textOf(option)) !== -1;
+            });
+            if (!hits.length) { return {status: 'no option', control: control}; }
+            if (el.multiple) {
+                options.forEach(function (option) {
+                    option.selected = hits.indexOf(option) !== -1;
+                });
+            } else {
+                hits[0].selected = true;
+            }
+            fire(el);
+        } else if (el.tagName === 'INPUT' || el.tagName === 'TEXTAREA') {
+            el.focus();
+            ws.setNativeValue(el, String(value));
+            fire(el);
+            el.blur();
+        } else {
+            return {status: 'unsupported', control: control};
+        }
+        return {status: 'ok'};
+    });
+}
+""",
+)
+
+def _field_locator(key: FieldKey) -> Tuple[By, str]:
+    return (By.NAME, key) if isinstance(key, str) else key
+
 class page:
-    def __init__(self, driver: WebDriver):
+    def __init__(self, driver: WebDriver, cache_elements: bool = True):
+        """
+        Args:
+            driver (WebDriver)
+            cache_elements (bool, optional): serve elements found by find_element again
+                without a round trip. A cached element that went stale is re-found
+                through its locator on its next action, call invalidate_cache after
+                navigating to search the new document. Defaults to True.
+        """
         self._driver = driver
         self.title = 'None Set'
         self.url = 'None Set'
+        self._cache_elements = cache_elements
+        self._element_cache: Dict[Tuple[Tuple[By, str], str], Element] = {}
 
     def find_element(self, locator: Tuple[By, str], name: str, timeout :int = 5) -> Element:
-        wait_for_element_to_exist(self._driver, locator, timeout)
+        key = (tuple(locator), name)
+        cached = self._element_cache.get(key)
+        if cached is not None:
+            return cached
+
+        web_element = wait_for_element_to_exist(self._driver, locator, timeout)
+        element = Element(web_element, name, locator=locator, search_context=self._driver)
+        if self._cache_elements:
+            self._element_cache[key] = element
+        return element
+
+    def invalidate_cache(self):
+        """Forget every cached element, including what fields resolved"""
+        self._element_cache.clear()
+        reset_fields(self)
+
+    def find_elements(
+        self, locator: Tuple[By, str], name: str, timeout: int = 5
+    ) -> ElementCollection:
+        """Find every element matching the locator, waiting for the first one
+
+        Args:
+            locator (Tuple[By, str])
+            name (str)
+            timeout (int, optional): Defaults to 5.
+
+        Returns:
+            ElementCollection: empty when nothing matched within the timeout
+        """
+        try:
+            web_elements = wait_for_elements_to_exist(self._driver, locator, timeout)
+        except TimeoutException:
+            web_elements = []
+        return ElementCollection(web_elements, name)
+
+    def fill_form(
+        self,
+        fields: Mapping[FieldKey, FieldValue],
+        native_keys: Iterable[FieldKey] = (),
+        timeout: int = 5,
+    ):
+        """Fill text inputs, textareas, checkboxes, radios and selects in one
+        script, firing input and change events. A str key is the field name
+        attribute. Checkboxes take a bool, radios the value to pick, selects
+        the value or text of an option, or a list of them for multi selects.
+
+        Args:
+            fields (Mapping[FieldKey, FieldValue])
+            native_keys (Iterable[FieldKey], optional): fields typed with send_text
+                because they need real key events. Defaults to ().
+            timeout (int, optional): wait for fields missing on the first pass. Defaults to 5.
+
+        Raises:
+            TypeError: when a checkbox gets a value that is not a bool
+            SelectFailureException: when a select or radio group is disabled or
+                has no matching option
+            SendTextFailureException: when a text field is disabled or read only,
+                or the field is not a form control
+        """
+        native = {_field_locator(key) for key in native_keys}
+        pending = [(_field_locator(key), value) for key, value in fields.items()]
+        waited = False
+        while pending:
+            results = call_script(
+                self._driver,
+                "fillForm",
+                [[locator[0], locator[1], value, locator in native] for locator, value in pending],
+            )
+            missing = []
+            for (locator, value), result in zip(pending, results):
+                if result["status"] == "native":
+                    element = Element(
+                        result["element"], locator[1], locator=locator, search_context=self._driver
+                    )
+                    element.clear()
+                    element.send_text(value, timeout, native_keys=True)
+                elif result["status"] == "missing" and not waited:
+                    missing.append((locator, value))
+                elif result["status"] == "not a bool":
+                    raise TypeError(f"Checkbox {locator[1]} takes a bool, got {value!r}")
+                elif result["status"] != "ok":
+                    if result.get("control") in ("select", "radio"):
+                        raise SelectFailureException(
+                            f"Failure to select on {locator[1]}: {result['status']}"
+                        )
+                    raise SendTextFailureException(
+                        f"Failure to fill {locator[1]}: {result['status']}"
+                    )
+            for locator, _ in missing:
+                wait_for_element_to_exist(self._driver, locator, timeout)
+            pending = missing
+            waited = True
+
+    def batch(self) -> ActionBatch:
+        """Record Element clicks, send_text, clear, select, js and scroll calls
+        made inside a with block and flush them on exit in as few round trips as
+        possible. Reads are recorded on the batch and return futures, reading an
+        Element directly inside the block raises RuntimeError.
 
-        element = self._driver.find_element(*locator)
-        return Element(element, name)
+        Returns:
+            ActionBatch
+        """
+        return ActionBatch(self._driver)
 
     def dismiss_alert(self, timeout: int=5):
         alert = wait_for_alert(self._driver, timeout)
@@ -0,0 +1,322 @@
+"""Module for recording element commands and flushing them in few round trips"""
+
+import itertools
+from concurrent.futures import Future
+from contextvars import ContextVar
+from typing import Callable, Iterable, List, NamedTuple, Optional, Union
+
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from webserpent.exceptions.exceptions import SelectFailureException, SendTextFailureException
+from webserpent.selenium.scripts import call_script, register_script
+
+register_script(
+    "batch",
+    """
+function (calls, failing) {
+    var results = [];
+    for (var i = 0; i < calls.length; i++) {
+        var result = ws[calls[i][0]].apply(null, calls[i][1]);
+        results.push(result);
+        // a helper that reported a failure stops the commands after it
+        if (result && failing.indexOf(calls[i][0]) !== -1) { break; }
+    }
+    return results;
+}
+""",
+)
+
+register_script(
+    "clearValue",
+    """
+function (el) {
+    if (el.tagName === 'INPUT' || el.tagName === 'TEXTAREA') {
+        ws.setNativeValue(el, '');
+    } else if (el.isContentEditable) {
+        el.textContent = '';
+    } else {
+        return 'not a text field';
+    }
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    return null;
+}
+""",
+)
+
+register_script(
+    "readText",
+    "function (el) { return ws.displayed(el) ? el.innerText : ''; }",
+)
+
+register_script("readAttribute", "function (el, name) { return el.getAttribute(name); }")
+
+register_script("readProperty", "function (el, name) { return el[name]; }")
+
+_current_batch: ContextVar[Optional["ActionBatch"]] = ContextVar(
+    "webserpent_batch", default=None
+)
+
+_ACTIONS = "actions"
+_SCRIPT = "script"
+
+# helpers that report a failure by returning an error message
+_FAILURES = {
+    "selectOptions": (SelectFailureException, "Failure to select"),
+    "clearValue": (SendTextFailureException, "Failure to clear"),
+}
+
+
+class _Command(NamedTuple):
+    kind: str
+    # ActionChains step for actions, helper name and arguments for scripts
+    step: Optional[Callable[[ActionChains], None]]
+    helper: str
+    args: list
+    future: Future
+
+
+def current_batch(driver: WebDriver) -> Optional["ActionBatch"]:
+    """Get the batch recording commands for the given driver, if any
+
+    Args:
+        driver (WebDriver)
+
+    Returns:
+        Optional[ActionBatch]
+    """
+    batch = _current_batch.get()
+    if batch is not None and batch.driver is driver:
+        return batch
+    return None
+
+
+class ActionBatch:
+    """Records element commands and reads, and flushes them on exit: runs of
+    clicks and typing become one W3C Actions call, runs of clears, selects,
+    script clicks, scrolls and reads one script call. Reads return futures
+    resolved by the flush, reading an Element directly inside the batch raises.
+    Commands skip the waits and retries Element performs, a failing command
+    raises on flush and cancels the commands after it."""
+
+    def __init__(self, driver: WebDriver):
+        """
+        Args:
+            driver (WebDriver)
+        """
+        self.driver = driver
+        self._queue: List[_Command] = []
+        self._token = None
+
+    def __enter__(self) -> "ActionBatch":
+        self._token = _current_batch.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _current_batch.reset(self._token)
+        if exc_type is not None:
+            for command in self._queue:
+                command.future.cancel()
+            self._queue = []
+            return
+        self.flush()
+
+    def click(self, element) -> Future:
+        """Record a click
+
+        Args:
+            element (Union[Element, WebElement])
+
+        Returns:
+            Future
+        """
+        web_element = _web_element(element)
+        return self._record(_ACTIONS, step=lambda chain: chain.click(web_element))
+
+    def send_text(self, element, text: str) -> Future:
+        """Record clicking into the element and typing the text
+
+        Args:
+            element (Union[Element, WebElement])
+            text (str)
+
+        Returns:
+            Future
+        """
+        web_element = _web_element(element)
+        return self._record(
+            _ACTIONS, step=lambda chain: chain.send_keys_to_element(web_element, text)
+        )
+
+    def clear(self, element) -> Future:
+        """Record clearing a text field
+
+        Args:
+            element (Union[Element, WebElement])
+
+        Returns:
+            Future
+        """
+        return self._record(_SCRIPT, "clearValue", [_web_element(element)])
+
+    def select(
+        self,
+        element,
+        select_by,
+        values: Iterable[Union[str, int]],
+        select: bool = True,
+        exclusive: bool = False,
+    ) -> Future:
+        """Record selecting or deselecting options, see Element.select_options
+
+        Args:
+            element (Union[Element, WebElement])
+            select_by (SelectBy)
+            values (Iterable[Union[str, int]])
+            select (bool, optional): False to deselect. Defaults to True.
+            exclusive (bool, optional): Defaults to False.
+
+        Returns:
+            Future
+        """
+        return self._record(
+            _SCRIPT,
+            "selectOptions",
+            [_web_element(element), select_by.value, list(values), select, exclusive],
+        )
+
+    def js_click(self, element) -> Future:
+        """Record a click through script
+
+        Args:
+            element (Union[Element, WebElement])
+
+        Returns:
+            Future
+        """
+        return self._record(_SCRIPT, "jsClick", [_web_element(element)])
+
+    def js_send_text(self, element, text: str) -> Future:
+        """Record setting the value through script
+
+        Args:
+            element (Union[Element, WebElement])
+            text (str)
+
+        Returns:
+            Future
+        """
+        return self._record(_SCRIPT, "jsSendText", [_web_element(element), text])
+
+    def scroll_to(self, element) -> Future:
+        """Record scrolling the element into view
+
+        Args:
+            element (Union[Element, WebElement])
+
+        Returns:
+            Future
+        """
+        return self._record(_SCRIPT, "scrollTo", [_web_element(element)])
+
+    def get_text(self, element) -> Future:
+        """Record reading the element text
+
+        Args:
+            element (Union[Element, WebElement])
+
+        Returns:
+            Future: resolves to str
+        """
+        return self._record(_SCRIPT, "readText", [_web_element(element)])
+
+    def get_attribute(self, element, name: str) -> Future:
+        """Record reading an attribute
+
+        Args:
+            element (Union[Element, WebElement])
+            name (str)
+
+        Returns:
+            Future: resolves to Optional[str]
+        """
+        return self._record(_SCRIPT, "readAttribute", [_web_element(element), name])
+
+    def get_property(self, element, name: str) -> Future:
+        """Record reading a property
+
+        Args:
+            element (Union[Element, WebElement])
+            name (str)
+
+        Returns:
+            Future
+        """
+        return self._record(_SCRIPT, "readProperty", [_web_element(element), name])
+
+    def flush(self):
+        """Run every recorded command and resolve their futures
+
+        Raises:
+            SelectFailureException: when a recorded select fails
+            SendTextFailureException: when a recorded clear hits no text field
+            WebDriverException: when an actions or script call fails
+        """
+        queue, self._queue = self._queue, []
+        groups = [list(group) for _, group in itertools.groupby(queue, key=lambda c: c.kind)]
+        for index, group in enumerate(groups):
+            try:
+                if group[0].kind == _ACTIONS:
+                    self._perform(group)
+                else:
+                    self._run_scripts(group)
+            except Exception as e:
+                for later in itertools.chain.from_iterable(groups[index + 1 :]):
+                    later.future.cancel()
+                for command in group:
+                    if not command.future.done():
+                        command.future.set_exception(e)
+                raise
+
+    def _record(
+        self,
+        kind: str,
+        helper: str = "",
+        args: Optional[list] = None,
+        step: Optional[Callable[[ActionChains], None]] = None,
+    ) -> Future:
+        future: Future = Future()
+        self._queue.append(_Command(kind, step, helper, args or [], future))
+        return future
+
+    def _perform(self, group: List[_Command]):
+        chain = ActionChains(self.driver)
+        for command in group:
+            command.step(chain)
+        chain.perform()
+        for command in group:
+            command.future.set_result(None)
+
+    def _run_scripts(self, group: List[_Command]):
+        results = call_script(
+            self.driver,
+            "batch",
+            [[command.helper, command.args] for command in group],
+            sorted(_FAILURES),
+        )
+        for command, result in zip(group, results):
+            if command.helper in _FAILURES and result:
+                exception_class, message = _FAILURES[command.helper]
+                error = exception_class(f"{message}: {result}")
+                command.future.set_exception(error)
+                # the script stopped here, later commands in the group did not run
+                for later in group[len(results) :]:
+                    later.future.cancel()
+                raise error
+            command.future.set_result(result)
+
+
+def _web_element(element) -> WebElement:
+    return getattr(element, "web_element", element)
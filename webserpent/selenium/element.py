@@ -1,14 +1,21 @@
 """Module for holding selenium element wrappings"""
 
+import time
 from enum import Enum
+from types import MappingProxyType
+from typing import Callable, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
 
 from selenium.common.exceptions import (
     ElementClickInterceptedException,
     ElementNotInteractableException,
     InvalidElementStateException,
+    NoSuchElementException,
     StaleElementReferenceException,
     TimeoutException,
+    WebDriverException,
 )
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.select import Select
 
@@ -23,6 +30,8 @@ from webserpent.exceptions.exceptions import (
     FlakySelectException,
     UnexpectedSelectException,
 )
+from webserpent.selenium.batch import current_batch
+from webserpent.selenium.scripts import call_script, register_script
 from webserpent.selenium.wait import (
     wait_for_element_to_be_clickable,
     wait_for_element_to_be_in_viewport,
@@ -31,6 +40,160 @@ from webserpent.selenium.wait import (
 # TODO: Add test logger
 # TODO: Add configuration values
 
+register_script(
+    "snapshot",
+    """
+function (el, attributeNames, propertyNames) {
+    var rect = el.getBoundingClientRect();
+    var displayed = ws.displayed(el);
+    var attributes = {}, properties = {};
+    attributeNames.forEach(function (name) { attributes[name] = el.getAttribute(name); });
+    propertyNames.forEach(function (name) { properties[name] = el[name]; });
+    return {
+        tag_name: el.tagName.toLowerCase(),
+        text: displayed ? el.innerText : '',
+        rect: {x: rect.left + window.scrollX, y: rect.top + window.scrollY,
+               width: rect.width, height: rect.height},
+        enabled: !(el.matches && el.matches(':disabled')),
+        displayed: displayed,
+        selected: !!(el.checked || el.selected),
+        attributes: attributes,
+        properties: properties
+    };
+}
+""",
+)
+
+register_script(
+    "actionable",
+    """
+function (el) {
+    if (!el.isConnected) { return 'detached'; }
+    var style = window.getComputedStyle(el);
+    if (style.display === 'none' || style.visibility !== 'visible'
+            || parseFloat(style.opacity) === 0 || el.getClientRects().length === 0) {
+        return 'hidden';
+    }
+    if (el.matches && el.matches(':disabled')) { return 'disabled'; }
+    var rect = el.getBoundingClientRect();
+    var viewWidth = window.innerWidth || document.documentElement.clientWidth;
+    var viewHeight = window.innerHeight || document.documentElement.clientHeight;
+    if (rect.top < 0 || rect.left < 0 || rect.bottom > viewHeight || rect.right > viewWidth) {
+        el.scrollIntoView({block: 'center', inline: 'center'});
+        rect = el.getBoundingClientRect();
+    }
+    var hit = document.elementFromPoint(rect.left + rect.width / 2, rect.top + rect.height / 2);
+    return hit && (hit === el || el.contains(hit)) ? 'ready' : 'obscured';
+}
+""",
+)
+
+register_script("scrollTo", "function (el) { el.scrollIntoView(true); }")
+
+register_script("jsClick", "function (el) { el.click(); }")
+
+register_script(
+    "jsSendText",
+    """
+function (input, value) {
+    input.value = value;
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+}
+""",
+)
+
+register_script(
+    "selectOptions",
+    """
+function (el, by, values, select, exclusive) {
+    if (el.tagName !== 'SELECT') { return 'not a select element'; }
+    if (el.disabled) { return 'select is disabled'; }
+    if (!el.multiple && (!select || values.length > 1)) {
+        return 'only one option of a single select can be selected and none deselected';
+    }
+    var options = Array.prototype.slice.call(el.options);
+    var targets = [];
+    for (var i = 0; i < values.length; i++) {
+        var value = values[i];
+        var matched = by === 'index' ? [options[value]].filter(Boolean)
+            : options.filter(function (option) {
+                return by === 'value' ? option.value === String(value)
+                    : ws.textOf(option) === String(value);
+            });
+        if (!matched.length) { return 'no option with ' + by + ' ' + value; }
+        if (select && matched.some(function (option) { return option.disabled; })) {
+            return 'option with ' + by + ' ' + value + ' is disabled';
+        }
+        targets = targets.concat(el.multiple ? matched : matched.slice(0, 1));
+    }
+    var changed = false;
+    options.forEach(function (option) {
+        var wanted = targets.indexOf(option) !== -1
+            ? select : (exclusive ? false : option.selected);
+        if (option.selected !== wanted) { option.selected = wanted; changed = true; }
+    });
+    if (changed) {
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    return null;
+}
+""",
+)
+
+register_script(
+    "readOptions",
+    """
+function (el) {
+    return {
+        multiple: el.multiple,
+        options: Array.prototype.map.call(el.options, function (option) {
+            return [option.index, option.value, ws.textOf(option), option.selected,
+                    option.disabled];
+        })
+    };
+}
+""",
+)
+
+register_script(
+    "insertText",
+    """
+function (el, chunk, last) {
+    if (!el.isContentEditable && el.tagName !== 'INPUT' && el.tagName !== 'TEXTAREA') {
+        return {error: 'not a text field'};
+    }
+    if (el.isContentEditable) {
+        el.focus();
+        // append like send_keys does, focus alone may leave the caret at the start
+        var range = document.createRange();
+        range.selectNodeContents(el);
+        range.collapse(false);
+        var selection = window.getSelection();
+        selection.removeAllRanges();
+        selection.addRange(range);
+        // insertText fires beforeinput and input like a paste would
+        document.execCommand('insertText', false, chunk);
+    } else {
+        ws.setNativeValue(el, el.value + chunk);
+        if (last) {
+            el.dispatchEvent(new Event('input', {bubbles: true}));
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+    }
+    if (last) {
+        var editable = el.isContentEditable;
+        return {editable: editable, value: editable ? el.innerText : el.value};
+    }
+}
+""",
+)
+
+# text at or above this length is inserted through script instead of typed
+LARGE_TEXT_THRESHOLD = 4096
+# characters sent per script call when inserting large text
+_TEXT_CHUNK_SIZE = 64 * 1024
+
 
 class SelectBy(Enum):
     INDEX = "index"
@@ -38,12 +201,208 @@ class SelectBy(Enum):
     VISIBLE_TEXT = "visible_text"
 
 
+class SelectOption(NamedTuple):
+    """An option of a select element"""
+
+    index: int
+    value: str
+    text: str
+    selected: bool
+    disabled: bool
+
+
+class SelectState(NamedTuple):
+    """All options of a select element, read in a single script call"""
+
+    multiple: bool
+    options: List[SelectOption]
+
+    @property
+    def selected(self) -> List[SelectOption]:
+        """Get the selected options
+
+        Returns:
+            List[SelectOption]
+        """
+        return [option for option in self.options if option.selected]
+
+
+class ElementSnapshot(NamedTuple):
+    """State of an element read in a single script call"""
+
+    tag_name: str
+    text: str
+    rect: Mapping[str, float]
+    enabled: bool
+    displayed: bool
+    selected: bool
+    attributes: Mapping[str, Optional[str]]
+    properties: Mapping[str, object]
+
+
 class Element:
     """Class tow rap selenium WebElement"""
 
-    def __init__(self, web_element: WebElement, name: str):
+    def __init__(
+        self,
+        web_element: WebElement,
+        name: str,
+        snapshot_ttl: float = 0,
+        locator: Optional[Tuple[By, str]] = None,
+        search_context: Optional[Union[WebDriver, WebElement]] = None,
+        max_reresolve: int = 2,
+        smart_click: bool = False,
+    ):
+        """
+        Args:
+            web_element (WebElement)
+            name (str)
+            snapshot_ttl (float, optional): seconds the state properties may be
+                served from a snapshot instead of one command each. Defaults to 0,
+                which always asks the driver.
+            locator (Optional[Tuple[By, str]], optional): locator the element was
+                found with. Defaults to None.
+            search_context (Optional[Union[WebDriver, WebElement]], optional): driver
+                or parent element the locator is relative to. Defaults to None.
+            max_reresolve (int, optional): times a single command may re-find a stale
+                element before the staleness is raised. Defaults to 2.
+            smart_click (bool, optional): check actionability and scroll in one
+                script before clicking, see click. Defaults to False.
+        """
         self._element = web_element
         self._name = name
+        self.snapshot_ttl = snapshot_ttl
+        self._snapshot: Optional[ElementSnapshot] = None
+        self._snapshot_time = 0.0
+        self._locator = locator
+        self._search_context = search_context
+        self.max_reresolve = max_reresolve
+        self._stale_recoveries = 0
+        self.smart_click = smart_click
+
+    def snapshot(
+        self, attributes: Iterable[str] = (), properties: Iterable[str] = ()
+    ) -> ElementSnapshot:
+        """Read tag name, text, rect, enabled, displayed and selected, plus the
+        given attributes and properties, in one script call. Displayed and text
+        follow the computed style and may differ from the WebDriver atoms for
+        unusual markup.
+
+        Args:
+            attributes (Iterable[str], optional): Defaults to ().
+            properties (Iterable[str], optional): Defaults to ().
+
+        Returns:
+            ElementSnapshot
+
+        Raises:
+            RuntimeError: inside an ActionBatch, record reads on the batch instead
+        """
+        self._refuse_read_in_batch()
+        state = call_script(
+            self._element.parent, "snapshot", self._element, list(attributes), list(properties)
+        )
+        self._snapshot = ElementSnapshot(
+            tag_name=state["tag_name"],
+            text=state["text"],
+            rect=MappingProxyType(state["rect"]),
+            enabled=state["enabled"],
+            displayed=state["displayed"],
+            selected=state["selected"],
+            attributes=MappingProxyType(state["attributes"]),
+            properties=MappingProxyType(state["properties"]),
+        )
+        self._snapshot_time = time.monotonic()
+        return self._snapshot
+
+    def invalidate_snapshot(self):
+        """Drop the cached snapshot so the next read goes to the driver"""
+        self._snapshot = None
+
+    def _cached_state(self) -> Optional[ElementSnapshot]:
+        """Snapshot to serve property reads from, when a ttl is set"""
+        self._refuse_read_in_batch()
+        if self.snapshot_ttl <= 0:
+            return None
+        if self._snapshot is None or time.monotonic() - self._snapshot_time > self.snapshot_ttl:
+            return self.snapshot()
+        return self._snapshot
+
+    def _refuse_read_in_batch(self):
+        """Reads inside an ActionBatch would run before the recorded commands"""
+        if current_batch(self._element.parent) is not None:
+            raise RuntimeError(
+                f"Can not read {self._name} inside an ActionBatch, "
+                "use the batch get_text, get_attribute or get_property instead"
+            )
+
+    @property
+    def stale_recoveries(self) -> int:
+        """Get how often the element was re-found after going stale
+
+        Returns:
+            int
+        """
+        return self._stale_recoveries
+
+    def _can_reresolve(self) -> bool:
+        return self._locator is not None and self._search_context is not None
+
+    def _reresolve(self, error: StaleElementReferenceException, attempt: int):
+        """Re-find the element after a StaleElementReferenceException. The error is
+        raised again when there is no locator or the attempts are used up."""
+        if not self._can_reresolve() or attempt >= self.max_reresolve:
+            raise error
+        try:
+            self._element = self._search_context.find_element(*self._locator)
+        except NoSuchElementException:
+            raise error from None
+        self._stale_recoveries += 1
+        self.invalidate_snapshot()
+
+    def _wait_to_be_clickable(self, timeout: int) -> int:
+        """Wait for the element to be clickable, re-finding it when it goes stale.
+
+        Returns:
+            int: re-find attempts used
+        """
+        stale_attempts = 0
+        while True:
+            try:
+                wait_for_element_to_be_clickable(
+                    self._element, timeout, raise_on_stale=self._can_reresolve()
+                )
+                return stale_attempts
+            except StaleElementReferenceException as e:
+                self._reresolve(e, stale_attempts)
+                stale_attempts += 1
+
+    @property
+    def name(self) -> str:
+        """Get the name the element was registered with
+
+        Returns:
+            str
+        """
+        return self._name
+
+    @property
+    def locator(self) -> Optional[Tuple[By, str]]:
+        """Get the locator the element was found with, if known
+
+        Returns:
+            Optional[Tuple[By, str]]
+        """
+        return self._locator
+
+    @property
+    def web_element(self) -> WebElement:
+        """Get the wrapped selenium WebElement
+
+        Returns:
+            WebElement
+        """
+        return self._element
 
     @property
     def tag_name(self) -> str:
@@ -52,6 +411,9 @@ class Element:
         Returns:
             str
         """
+        state = self._cached_state()
+        if state:
+            return state.tag_name
         return self._element.tag_name
 
     @property
@@ -61,6 +423,9 @@ class Element:
         Returns:
             str
         """
+        state = self._cached_state()
+        if state:
+            return state.text
         return self._element.text
 
     @property
@@ -79,6 +444,9 @@ class Element:
         Returns:
             dict: {'width': <int>, 'height': <int>}
         """
+        state = self._cached_state()
+        if state:
+            return {"height": state.rect["height"], "width": state.rect["width"]}
         return self._element.size
 
     @property
@@ -88,6 +456,9 @@ class Element:
         Returns:
             dict:
         """
+        state = self._cached_state()
+        if state:
+            return {"x": round(state.rect["x"]), "y": round(state.rect["y"])}
         return self._element.location
 
     @property
@@ -97,6 +468,9 @@ class Element:
         Returns:
             dict
         """
+        state = self._cached_state()
+        if state:
+            return dict(state.rect)
         return self._element.rect
 
     @property
@@ -106,6 +480,9 @@ class Element:
         Returns:
             bool:
         """
+        state = self._cached_state()
+        if state:
+            return state.enabled
         return self._element.is_enabled()
 
     @property
@@ -115,6 +492,9 @@ class Element:
         Returns:
             bool: 
         """
+        state = self._cached_state()
+        if state:
+            return state.selected
         return self._element.is_selected()
 
     @property
@@ -124,35 +504,16 @@ class Element:
         Returns:
             bool: 
         """
+        state = self._cached_state()
+        if state:
+            return state.displayed
         return self._element.is_displayed()
 
     @property
     def in_viewport(self) -> bool:
         """Returns if element is in viewport"""
-        # Use JavaScript to check if the element is in the viewport
-        element_rect = self._element.parent.execute_script(
-            """
-            var rect = arguments[0].getBoundingClientRect();
-            var viewWidth = window.innerWidth || document.documentElement.clientWidth;
-            var viewHeight = window.innerHeight || document.documentElement.clientHeight;
-            return {
-                top: rect.top >= 0 && rect.top < viewHeight,
-                bottom: rect.bottom <= viewHeight,
-                left: rect.left >= 0 && rect.left < viewWidth,
-                right: rect.right <= viewWidth
-            };
-        """,
-            self._element,
-        )
-
-        # Return True if all four sides of the element are within the viewport
-        is_true = (
-            element_rect["top"]
-            and element_rect["bottom"]
-            and element_rect["left"]
-            and element_rect["right"]
-        )
-        return is_true
+        self._refuse_read_in_batch()
+        return call_script(self._element.parent, "inViewport", self._element)
 
     def get_attribute(self, name: str) -> str:
         """Get a given attribute value
@@ -163,6 +524,7 @@ class Element:
         Returns:
             str:
         """
+        self._refuse_read_in_batch()
         return self._element.get_attribute(name)
 
     def get_property(self, name: str) -> str:
@@ -174,25 +536,40 @@ class Element:
         Returns:
             str: 
         """
+        self._refuse_read_in_batch()
         return self._element.get_property(name)
 
-    def click(self, timeout: int = 5, force: bool = True):
+    def click(self, timeout: int = 5, force: bool = True, smart: Optional[bool] = None):
         """Click the element. If ElementClickInterceptedException or
         ElementNotInteractableException is raised a scroll to element action is performed
         and a second click attempt is made. With force = True, if the second attempt also
-        raises one of thsoe errors a js click is performed.
+        raises one of thsoe errors a js click is performed. A stale element is
+        re-found with its locator, when it has one.
+
+        With smart = True, a single script checks the element is attached, displayed,
+        enabled and not covered, scrolling it into view when needed, and the element
+        is clicked right away. The steps above only run when that check or click fails.
 
         Args:
             timeout (int, optional): Defaults to 5.
             force (bool, optional): Defaults to True.
+            smart (Optional[bool], optional): Defaults to the smart_click attribute.
 
         Raises:
             ClickFailureException:
             FlakyClickException:
             UnexpectedClickException:
+            StaleElementReferenceException: when the element can not be re-found
         """
+        self.invalidate_snapshot()
+        batch = current_batch(self._element.parent)
+        if batch is not None:
+            batch.click(self)
+            return
+        if (self.smart_click if smart is None else smart) and self._smart_click():
+            return
         try:
-            wait_for_element_to_be_clickable(self._element, timeout)
+            stale_attempts = self._wait_to_be_clickable(timeout)
         except TimeoutException as e:
             raise ClickFailureException(
                 "Failure to click on {self._name} due to timeout"
@@ -217,37 +594,90 @@ class Element:
                     raise FlakyClickException(
                         f"Issues with clicking {self._name}"
                     ) from e
-            except StaleElementReferenceException:
-                raise
+            except StaleElementReferenceException as e:
+                self._reresolve(e, stale_attempts)
+                stale_attempts += 1
             except InvalidElementStateException as e:
                 raise ClickFailureException(f"Failure to click on {self._name}") from e
             except Exception as e:
                 raise UnexpectedClickException("Unknown Error") from e
 
-    def send_text(self, text: str, timeout: int = 3, force=True):
+    def _smart_click(self) -> bool:
+        """Check actionability in one script and click when ready.
+
+        Returns:
+            bool: if the element was clicked
+        """
+        stale_attempts = 0
+        while True:
+            try:
+                status = call_script(self._element.parent, "actionable", self._element)
+            except StaleElementReferenceException as e:
+                self._reresolve(e, stale_attempts)
+                stale_attempts += 1
+                continue
+            except WebDriverException:
+                # nothing was clicked yet, the full path can take over
+                return False
+            if status != "ready":
+                return False
+            try:
+                self._element.click()
+                return True
+            except (
+                ElementClickInterceptedException,
+                ElementNotInteractableException,
+            ):
+                return False
+            except StaleElementReferenceException as e:
+                self._reresolve(e, stale_attempts)
+                stale_attempts += 1
+            except InvalidElementStateException as e:
+                raise ClickFailureException(f"Failure to click on {self._name}") from e
+            except Exception as e:
+                raise UnexpectedClickException("Unknown Error") from e
+
+    def send_text(self, text: str, timeout: int = 3, force=True, native_keys: bool = False):
         """send text to an element. If ElementClickInterceptedException or
         ElementNotInteractableException is raised a scroll to element action is performed
         and a second send text attempt is made. With force = True, if the second attempt also
-        raises one of thsoe errors a js send text is performed.
+        raises one of thsoe errors a js send text is performed. A stale element is
+        re-found with its locator, when it has one.
+
+        Text of LARGE_TEXT_THRESHOLD characters or more is appended through script in
+        chunks, or with insertText for contenteditable elements, instead of being typed,
+        and the value is checked afterwards. No key events are fired on that path.
 
         Args:
             text (str)
             timeout (int, optional):  Defaults to 3.
             force (bool, optional):  Defaults to True.
+            native_keys (bool, optional): always type the text, for fields that
+                need real key events. Defaults to False.
 
         Raises:
             SendTextFailureException:
             FlakySendTetxException:
             SendTextFailureException:
             UnexptedSendTextException:
+            StaleElementReferenceException: when the element can not be re-found
         """
+        self.invalidate_snapshot()
+        batch = current_batch(self._element.parent)
+        if batch is not None:
+            batch.send_text(self, text)
+            return
         try:
-            wait_for_element_to_be_clickable(self._element, timeout)
+            stale_attempts = self._wait_to_be_clickable(timeout)
         except TimeoutException as e:
             raise SendTextFailureException(
                 "Failure to send text to {self._name} due to timeout"
             ) from e
 
+        if not native_keys and len(text) >= LARGE_TEXT_THRESHOLD:
+            self._insert_text(text, stale_attempts)
+            return
+
         attempts = 1
         while attempts <= 2:
             try:
@@ -267,8 +697,9 @@ class Element:
                     raise FlakySendTetxException(
                         f"Issues with sending text to {self._name}"
                     ) from e
-            except StaleElementReferenceException:
-                raise
+            except StaleElementReferenceException as e:
+                self._reresolve(e, stale_attempts)
+                stale_attempts += 1
             except InvalidElementStateException as e:
                 raise SendTextFailureException(
                     f"Failure to send text to {self._name}"
@@ -276,9 +707,50 @@ class Element:
             except Exception as e:
                 raise UnexptedSendTextException("Unknown Error") from e
 
+    def _insert_text(self, text: str, stale_attempts: int):
+        """Append large text through script and check the value took"""
+        chunks = [
+            text[start : start + _TEXT_CHUNK_SIZE]
+            for start in range(0, len(text), _TEXT_CHUNK_SIZE)
+        ]
+        while True:
+            try:
+                for index, chunk in enumerate(chunks):
+                    result = call_script(
+                        self._element.parent,
+                        "insertText",
+                        self._element,
+                        chunk,
+                        index == len(chunks) - 1,
+                    )
+                    if result and result.get("error"):
+                        raise SendTextFailureException(
+                            f"Failure to send text to {self._name}: {result['error']}"
+                        )
+                break
+            except StaleElementReferenceException as e:
+                # the new element has none of the chunks, so start over
+                self._reresolve(e, stale_attempts)
+                stale_attempts += 1
+
+        value = result["value"] or ""
+        expected = text.replace("\r\n", "\n").replace("\r", "\n")
+        if result["editable"]:
+            # rendered text of an editable element may lay out whitespace differently
+            value, expected = "".join(value.split()), "".join(expected.split())
+        if not value.endswith(expected):
+            raise SendTextFailureException(
+                f"Failure to send text to {self._name}: value did not take"
+            )
+
     def clear(self):
         """Clear text from text field"""
-        self._element.clear()
+        self.invalidate_snapshot()
+        batch = current_batch(self._element.parent)
+        if batch is not None:
+            batch.clear(self)
+            return
+        self._with_stale_recovery(lambda: self._element.clear())
 
     def select_from_dropdown_by(self, select_by: SelectBy, value: str):
         """Select from a dropdown by type and value
@@ -292,6 +764,11 @@ class Element:
             SelectFailureException:
             UnexpectedSelectException:
         """
+        self.invalidate_snapshot()
+        batch = current_batch(self._element.parent)
+        if batch is not None:
+            batch.select(self, select_by, [value])
+            return
         select = Select(self._element)
         try:
             match select_by:
@@ -324,6 +801,11 @@ class Element:
             SelectFailureException:
             UnexpectedSelectException:
         """
+        self.invalidate_snapshot()
+        batch = current_batch(self._element.parent)
+        if batch is not None:
+            batch.select(self, select_by, [value], select=False)
+            return
         select = Select(self._element)
         try:
             match select_by:
@@ -352,6 +834,12 @@ class Element:
             SelectFailureException:
             UnexpectedSelectException:
         """
+        self.invalidate_snapshot()
+        batch = current_batch(self._element.parent)
+        if batch is not None:
+            # no targets and exclusive deselects every option
+            batch.select(self, SelectBy.VALUE, [], select=False, exclusive=True)
+            return
         select = Select(self._element)
         try:
             select.deselect_all()
@@ -366,24 +854,106 @@ class Element:
         except Exception as e:
             raise UnexpectedSelectException("Unexpected error occured") from e
 
-    def scroll_to(self, timeout=3):
-        """Scroll to element and wait for it to be in viewport"""
-        self._element.parent.execute_script(
-            "arguments[0].scrollIntoView(true);", self._element
+    def select_options(
+        self, select_by: SelectBy, values: Iterable[Union[str, int]], exclusive: bool = False
+    ):
+        """Select every given option in one script call, firing input and change
+        events once. A single select takes one value.
+
+        Args:
+            select_by (SelectBy)
+            values (Iterable[Union[str, int]])
+            exclusive (bool, optional): deselect all other options. Defaults to False.
+
+        Raises:
+            SelectFailureException: when an option is missing or disabled, or the
+                element is not a select that allows it
+        """
+        self._run_select(select_by, values, True, exclusive)
+
+    def deselect_options(self, select_by: SelectBy, values: Iterable[Union[str, int]]):
+        """Deselect every given option of a multi select in one script call
+
+        Args:
+            select_by (SelectBy)
+            values (Iterable[Union[str, int]])
+
+        Raises:
+            SelectFailureException: when an option is missing or the element is
+                not a multi select
+        """
+        self._run_select(select_by, values, False, False)
+
+    def read_options(self) -> SelectState:
+        """Read every option and the current selection in one script call
+
+        Returns:
+            SelectState
+        """
+        self._refuse_read_in_batch()
+        state = self._with_stale_recovery(
+            lambda: call_script(self._element.parent, "readOptions", self._element)
+        )
+        options = [SelectOption(*option) for option in state["options"]]
+        return SelectState(state["multiple"], options)
+
+    def _run_select(
+        self, select_by: SelectBy, values: Iterable[Union[str, int]], select: bool, exclusive: bool
+    ):
+        self.invalidate_snapshot()
+        batch = current_batch(self._element.parent)
+        if batch is not None:
+            batch.select(self, select_by, values, select, exclusive)
+            return
+        values = list(values)
+        error = self._with_stale_recovery(
+            lambda: call_script(
+                self._element.parent,
+                "selectOptions",
+                self._element,
+                select_by.value,
+                values,
+                select,
+                exclusive,
+            )
         )
+        if error:
+            raise SelectFailureException(f"Failure to select on {self._name}: {error}")
+
+    def _with_stale_recovery(self, action: Callable):
+        stale_attempts = 0
+        while True:
+            try:
+                return action()
+            except StaleElementReferenceException as e:
+                self._reresolve(e, stale_attempts)
+                stale_attempts += 1
+
+    def scroll_to(self, timeout=3):
+        """Scroll to element and wait for it to be in viewport. Inside an
+        ActionBatch the scroll is recorded and not waited for."""
+        self.invalidate_snapshot()
+        batch = current_batch(self._element.parent)
+        if batch is not None:
+            batch.scroll_to(self)
+            return
+        call_script(self._element.parent, "scrollTo", self._element)
         wait_for_element_to_be_in_viewport(self._element, timeout)
 
     def js_click(self):
         """click with js"""
-        self._element.parent.execute_script("arguments[0].click();", self._element)
+        self.invalidate_snapshot()
+        batch = current_batch(self._element.parent)
+        if batch is not None:
+            batch.js_click(self)
+            return
+        call_script(self._element.parent, "jsClick", self._element)
 
     def js_send_text(self, text: str):
         """send text via js"""
-        js_code = """
-        var input = arguments[0];
-        var value = arguments[1];
-        input.value = value;
-        var event = new Event('input', { bubbles: true });
-        input.dispatchEvent(event);
-        """
-        self._element.parent.execute_script(js_code, self._element, text)
+        self.invalidate_snapshot()
+        batch = current_batch(self._element.parent)
+        if batch is not None:
+            batch.js_send_text(self, text)
+            return
+        call_script(self._element.parent, "jsSendText", self._element, text)
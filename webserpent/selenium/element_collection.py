@@ -0,0 +1,132 @@
+"""Module for holding a collection of elements with vectorized reads"""
+
+from typing import Iterator, List, Optional, Sequence, Union, overload
+
+from selenium.webdriver.remote.webelement import WebElement
+
+from webserpent.selenium.element import Element
+from webserpent.selenium.scripts import call_script, register_script
+
+register_script(
+    "texts",
+    """
+function (els) {
+    return els.map(function (el) { return ws.displayed(el) ? el.innerText : ''; });
+}
+""",
+)
+
+register_script(
+    "attributes",
+    "function (els, name) { return els.map(function (el) { return el.getAttribute(name); }); }",
+)
+
+register_script(
+    "properties",
+    "function (els, name) { return els.map(function (el) { return el[name]; }); }",
+)
+
+register_script(
+    "rects",
+    """
+function (els) {
+    return els.map(function (el) {
+        var rect = el.getBoundingClientRect();
+        return {x: rect.left + window.scrollX, y: rect.top + window.scrollY,
+                width: rect.width, height: rect.height};
+    });
+}
+""",
+)
+
+register_script("visibleMask", "function (els) { return els.map(ws.displayed); }")
+
+
+class ElementCollection:
+    """Class to wrap a list of selenium WebElements. Reads over the whole
+    collection cost one script call, and Element wrappers are only built for
+    the items that are accessed."""
+
+    def __init__(
+        self, web_elements: List[WebElement], name: str, indexes: Optional[Sequence[int]] = None
+    ):
+        """
+        Args:
+            web_elements (List[WebElement])
+            name (str)
+            indexes (Optional[Sequence[int]], optional): positions the elements had in
+                the collection a slice was taken from, used in item names.
+                Defaults to their own positions.
+        """
+        self._elements = list(web_elements)
+        self._name = name
+        self._indexes = range(len(self._elements)) if indexes is None else indexes
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __iter__(self) -> Iterator[Element]:
+        for index in range(len(self._elements)):
+            yield self[index]
+
+    @overload
+    def __getitem__(self, index: int) -> Element: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ElementCollection": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Element, "ElementCollection"]:
+        if isinstance(index, slice):
+            return ElementCollection(self._elements[index], self._name, self._indexes[index])
+        return Element(self._elements[index], f"{self._name}[{self._indexes[index]}]")
+
+    def texts(self) -> List[str]:
+        """Get the visible text of every element
+
+        Returns:
+            List[str]
+        """
+        return self._run("texts")
+
+    def attributes(self, name: str) -> List[Optional[str]]:
+        """Get an attribute value of every element
+
+        Args:
+            name (str)
+
+        Returns:
+            List[Optional[str]]
+        """
+        return self._run("attributes", name)
+
+    def properties(self, name: str) -> list:
+        """Get a property value of every element
+
+        Args:
+            name (str)
+
+        Returns:
+            list
+        """
+        return self._run("properties", name)
+
+    def rects(self) -> List[dict]:
+        """Get the size and location of every element
+
+        Returns:
+            List[dict]
+        """
+        return self._run("rects")
+
+    def visible_mask(self) -> List[bool]:
+        """Get whether each element is displayed
+
+        Returns:
+            List[bool]
+        """
+        return self._run("visibleMask")
+
+    def _run(self, helper: str, *args) -> list:
+        if not self._elements:
+            return []
+        return call_script(self._elements[0].parent, helper, self._elements, *args)
@@ -0,0 +1,231 @@
+"""Module for the registry of JS helpers installed once per document
+
+Helpers are installed as a `window.__webserpent` namespace. A call only sends a
+short stub naming the helper, and when the namespace is missing, as after a
+navigation, the full bundle is sent once together with the call.
+"""
+
+import hashlib
+from typing import Dict, Optional
+
+from selenium.webdriver.chromium.webdriver import ChromiumDriver
+from selenium.webdriver.remote.webdriver import WebDriver
+
+_NAMESPACE = "__webserpent"
+
+_registry: Dict[str, str] = {}
+_bundle: Optional[str] = None
+_version = ""
+
+_MISSING = "__webserpent_missing__"
+
+_CALL_JS = """
+var ns = window.%(namespace)s;
+if (!ns || ns.version !== arguments[0]) { return '%(missing)s'; }
+return ns[arguments[1]].apply(null, Array.prototype.slice.call(arguments, 2));
+""" % {"namespace": _NAMESPACE, "missing": _MISSING}
+
+_CALL_ASYNC_JS = """
+var ns = window.%(namespace)s;
+var done = arguments[arguments.length - 1];
+if (!ns || ns.version !== arguments[0]) { return done('%(missing)s'); }
+ns[arguments[1]].apply(null, Array.prototype.slice.call(arguments, 2));
+""" % {"namespace": _NAMESPACE, "missing": _MISSING}
+
+
+def register_script(name: str, source: str):
+    """Add a helper to the bundle. The source is a JS expression, usually a
+    function, and may use the other helpers through the `ws` namespace object.
+    Registering a new or changed helper makes pages install the bundle again.
+
+    Args:
+        name (str): key of the helper in the namespace
+        source (str): JS expression
+    """
+    global _bundle  # pylint: disable=global-statement
+    if _registry.get(name) != source:
+        _registry[name] = source
+        _bundle = None
+
+
+def bundle() -> str:
+    """Get the script that installs every registered helper
+
+    Returns:
+        str
+    """
+    global _bundle, _version  # pylint: disable=global-statement
+    if _bundle is None:
+        helpers = "".join(
+            f"ws[{name!r}] = {source.strip()};\n" for name, source in sorted(_registry.items())
+        )
+        _version = hashlib.sha1(helpers.encode("utf-8")).hexdigest()[:12]
+        _bundle = (
+            f"(function () {{\nvar ws = {{version: {_version!r}}};\n{helpers}"
+            f"window.{_NAMESPACE} = ws;\n}})();\n"
+        )
+    return _bundle
+
+
+def call_script(driver: WebDriver, name: str, *args):
+    """Call a registered helper, installing the bundle when the page lacks it
+
+    Args:
+        driver (WebDriver)
+        name (str)
+
+    Returns:
+        the helper result
+    """
+    install = bundle()
+    result = driver.execute_script(_CALL_JS, _version, name, *args)
+    if result == _MISSING:
+        result = driver.execute_script(install + _CALL_JS, _version, name, *args)
+    return result
+
+
+def call_async_script(driver: WebDriver, name: str, *args):
+    """Call a registered helper that reports through the callback passed as its
+    last argument, installing the bundle when the page lacks it
+
+    Args:
+        driver (WebDriver)
+        name (str)
+
+    Returns:
+        the value passed to the callback
+    """
+    install = bundle()
+    result = driver.execute_async_script(_CALL_ASYNC_JS, _version, name, *args)
+    if result == _MISSING:
+        result = driver.execute_async_script(install + _CALL_ASYNC_JS, _version, name, *args)
+    return result
+
+
+def install_on_new_document(driver: WebDriver) -> Optional[str]:
+    """Have Chromium install the bundle in every new document before its own
+    scripts run, so calls after a navigation need no second round trip.
+    Helpers registered later are still installed on demand.
+
+    Args:
+        driver (WebDriver)
+
+    Returns:
+        Optional[str]: CDP script identifier, None for non Chromium drivers
+    """
+    if not isinstance(driver, ChromiumDriver):
+        return None
+    result = driver.execute_cdp_cmd(
+        "Page.addScriptToEvaluateOnNewDocument", {"source": bundle()}
+    )
+    return result.get("identifier")
+
+
+register_script(
+    "displayed",
+    """
+function (el) {
+    var style = window.getComputedStyle(el);
+    return style.display !== 'none' && style.visibility !== 'hidden'
+        && style.visibility !== 'collapse' && parseFloat(style.opacity) !== 0
+        && el.getClientRects().length > 0;
+}
+""",
+)
+
+register_script(
+    "inViewport",
+    """
+function (el) {
+    var rect = el.getBoundingClientRect();
+    var viewWidth = window.innerWidth || document.documentElement.clientWidth;
+    var viewHeight = window.innerHeight || document.documentElement.clientHeight;
+    // every side of the element lies within the viewport
+    return rect.top >= 0 && rect.top < viewHeight && rect.bottom <= viewHeight
+        && rect.left >= 0 && rect.left < viewWidth && rect.right <= viewWidth;
+}
+""",
+)
+
+register_script(
+    "setNativeValue",
+    """
+function (el, value) {
+    var proto = el.tagName === 'TEXTAREA'
+        ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    // the prototype setter bypasses value trackers frameworks put on the instance
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+}
+""",
+)
+
+register_script(
+    "textOf",
+    "function (node) { return node.textContent.replace(/\\s+/g, ' ').trim(); }",
+)
+
+register_script(
+    "find",
+    """
+function (by, value, root) {
+    root = root || document;
+    switch (by) {
+        case 'css selector': return root.querySelector(value);
+        case 'tag name': return root.querySelector(value);
+        case 'id': return root.querySelector('[id="' + CSS.escape(value) + '"]');
+        case 'name': return root.querySelector('[name="' + CSS.escape(value) + '"]');
+        case 'class name': return root.querySelector('.' + CSS.escape(value));
+        case 'xpath':
+            return document.evaluate(value, root, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'link text':
+        case 'partial link text':
+            var links = root.querySelectorAll('a');
+            for (var i = 0; i < links.length; i++) {
+                var text = links[i].innerText.trim();
+                if (by === 'link text' ? text === value : text.indexOf(value) !== -1) {
+                    return links[i];
+                }
+            }
+            return null;
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+""",
+)
+
+register_script(
+    "findAll",
+    """
+function (by, value, root) {
+    root = root || document;
+    switch (by) {
+        case 'css selector':
+        case 'tag name': return Array.prototype.slice.call(root.querySelectorAll(value));
+        case 'id':
+            return Array.prototype.slice.call(
+                root.querySelectorAll('[id="' + CSS.escape(value) + '"]'));
+        case 'name':
+            return Array.prototype.slice.call(
+                root.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+        case 'class name':
+            return Array.prototype.slice.call(root.querySelectorAll('.' + CSS.escape(value)));
+        case 'xpath':
+            var snapshot = document.evaluate(value, root, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) {
+                nodes.push(snapshot.snapshotItem(i));
+            }
+            return nodes;
+        case 'link text':
+        case 'partial link text':
+            return Array.prototype.slice.call(root.querySelectorAll('a')).filter(function (a) {
+                var text = a.innerText.trim();
+                return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+            });
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+""",
+)
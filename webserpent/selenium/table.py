@@ -0,0 +1,233 @@
+"""Module for reading HTML tables and ARIA grids in large chunks"""
+
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from webserpent.selenium.element import Element
+from webserpent.selenium.scripts import call_script, register_script
+from webserpent.selenium.wait import AdaptiveWait, PollStrategy
+
+register_script(
+    "table",
+    """
+(function () {
+    function isHeaderRow(row) {
+        if (row.parentNode && row.parentNode.tagName === 'THEAD') { return true; }
+        var cells = cellsOf(row);
+        if (!cells.length) { return false; }
+        for (var i = 0; i < cells.length; i++) {
+            var role = cells[i].getAttribute('role');
+            if (cells[i].tagName !== 'TH' && role !== 'columnheader') { return false; }
+        }
+        return true;
+    }
+    function rowsOf(table) {
+        var rows = table.tagName === 'TABLE'
+            ? Array.prototype.slice.call(table.rows)
+            : Array.prototype.slice.call(table.querySelectorAll('[role="row"]'));
+        return rows;
+    }
+    function cellsOf(row) {
+        if (row.tagName === 'TR') { return Array.prototype.slice.call(row.cells); }
+        return Array.prototype.slice.call(row.querySelectorAll(
+            '[role="gridcell"],[role="cell"],[role="rowheader"],[role="columnheader"]'));
+    }
+    function split(table) {
+        var headers = [], body = [];
+        rowsOf(table).forEach(function (row) {
+            if (isHeaderRow(row)) {
+                headers = cellsOf(row).map(ws.textOf);
+            } else {
+                body.push(row);
+            }
+        });
+        return {headers: headers, body: body};
+    }
+    function fingerprint(body) {
+        if (!body.length) { return '0'; }
+        return body.length + '|' + body[0].textContent + '|' + body[body.length - 1].textContent;
+    }
+    return {split: split, fingerprint: fingerprint, cellsOf: cellsOf};
+})()
+""",
+)
+
+register_script(
+    "readTableChunk",
+    """
+function (table, start, count) {
+    // split once when a read starts, later chunks slice the rows kept on the element
+    var parts = start === 0 || !table.__webserpentTable
+        ? ws.table.split(table) : table.__webserpentTable;
+    table.__webserpentTable = parts;
+    return {
+        headers: parts.headers,
+        total: parts.body.length,
+        fingerprint: ws.table.fingerprint(parts.body),
+        rows: parts.body.slice(start, start + count).map(function (row) {
+            return ws.table.cellsOf(row).map(ws.textOf);
+        })
+    };
+}
+""",
+)
+
+register_script(
+    "tableFingerprint",
+    "function (table) { return ws.table.fingerprint(ws.table.split(table).body); }",
+)
+
+register_script(
+    "clickNextPage",
+    """
+function (next) {
+    if (next.disabled || next.getAttribute('aria-disabled') === 'true'
+            || next.classList.contains('disabled')) {
+        return false;
+    }
+    next.click();
+    return true;
+}
+""",
+)
+
+
+class TableData(NamedTuple):
+    """Header and body cell text of a table"""
+
+    headers: List[str]
+    rows: List[List[str]]
+
+
+class TableReader:
+    """Reads a <table> or an ARIA grid/table in chunks of rows per script call.
+    Cell text is the whitespace collapsed textContent of each cell. The rows
+    are listed once when a read starts, so rows added during the read are left
+    for the next one."""
+
+    def __init__(self, element: Element, batch_size: int = 1000):
+        """
+        Args:
+            element (Element): the table or grid element
+            batch_size (int, optional): rows read per script call. Defaults to 1000.
+        """
+        self._element = element
+        self._batch_size = batch_size
+        self._headers: Optional[List[str]] = None
+        self._fingerprint = ""
+
+    @property
+    def headers(self) -> List[str]:
+        """Get the column header text, read with the first chunk
+
+        Returns:
+            List[str]
+        """
+        if self._headers is None:
+            self._read_chunk(0, 0)
+        return self._headers
+
+    def read(self) -> TableData:
+        """Read the whole table into memory
+
+        Returns:
+            TableData
+        """
+        rows = [row for batch in self.iter_rows() for row in batch]
+        return TableData(self.headers, rows)
+
+    def iter_rows(self, batch_size: Optional[int] = None) -> Iterator[List[List[str]]]:
+        """Stream the body rows of the current page in batches
+
+        Args:
+            batch_size (Optional[int], optional): Defaults to the reader batch size.
+
+        Yields:
+            List[List[str]]: a batch of rows
+        """
+        batch_size = batch_size or self._batch_size
+        start = 0
+        while True:
+            chunk = self._read_chunk(start, batch_size)
+            if chunk["rows"]:
+                yield chunk["rows"]
+            start += len(chunk["rows"])
+            if not chunk["rows"] or start >= chunk["total"]:
+                return
+
+    def iter_pages(
+        self,
+        next_locator: Tuple[By, str],
+        max_pages: Optional[int] = None,
+        timeout: int = 5,
+        table_locator: Optional[Tuple[By, str]] = None,
+        poll: Optional[PollStrategy] = None,
+    ) -> Iterator[List[List[str]]]:
+        """Stream row batches across pages, clicking the pagination control
+        after each page until it is missing or disabled.
+
+        Args:
+            next_locator (Tuple[By, str]): the "next page" control
+            max_pages (Optional[int], optional): Defaults to no limit.
+            timeout (int, optional): seconds to wait for a page to change. Defaults to 5.
+            table_locator (Optional[Tuple[By, str]], optional): to find the table
+                again when a page change replaces the table element. Defaults to
+                the locator the element was found with.
+            poll (Optional[PollStrategy], optional): Defaults to the global strategy.
+
+        Yields:
+            List[List[str]]: a batch of rows
+
+        Raises:
+            TimeoutException: when the table did not change after turning the page
+            StaleElementReferenceException: when a page change replaced a table
+                that has no locator to find it again
+        """
+        driver = self._element.web_element.parent
+        table_locator = table_locator or self._element.locator
+        page_number = 0
+        while True:
+            yield from self.iter_rows()
+            page_number += 1
+            if max_pages is not None and page_number >= max_pages:
+                return
+
+            before = self._fingerprint
+            next_controls = driver.find_elements(*next_locator)
+            if not next_controls or not call_script(driver, "clickNextPage", next_controls[0]):
+                return
+
+            wait = AdaptiveWait(driver, timeout, poll)
+            wait.until(
+                lambda _: self._page_changed(before, table_locator), "Table page did not change"
+            )
+
+    def _page_changed(self, before: str, table_locator: Optional[Tuple[By, str]]) -> bool:
+        driver = self._element.web_element.parent
+        if table_locator:
+            tables = driver.find_elements(*table_locator)
+            if not tables:
+                return False
+            if tables[0] != self._element.web_element:
+                self._element = Element(
+                    tables[0], self._element.name, locator=table_locator, search_context=driver
+                )
+        try:
+            return call_script(driver, "tableFingerprint", self._element.web_element) != before
+        except StaleElementReferenceException as e:
+            if table_locator:
+                # replaced between the lookup and the script, look again on the next poll
+                return False
+            raise StaleElementReferenceException(
+                f"{self._element.name} was replaced by the page change, "
+                "pass table_locator to find it again"
+            ) from e
+
+    def _read_chunk(self, start: int, count: int) -> dict:
+        web_element = self._element.web_element
+        chunk = call_script(web_element.parent, "readTableChunk", web_element, start, count)
+        self._headers = chunk["headers"]
+        self._fingerprint = chunk["fingerprint"]
+        return chunk
@@ -1,66 +1,496 @@
 """Module for holding wait fuctions"""
 
-from typing import Tuple
+import time
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple, Type, Union
 
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    JavascriptException,
+    TimeoutException,
+)
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.wait import WebDriverWait
+from selenium.webdriver.support.wait import POLL_FREQUENCY, WebDriverWait
 
-def wait_for_element_to_be_clickable(web_element: WebElement, timeout: int):
+from webserpent.selenium.scripts import call_async_script, call_script, register_script
+
+IgnoredExceptions = Optional[Iterable[Type[Exception]]]
+
+# longest single async script call, kept below the default 30s script timeout
+_OBSERVER_SLICE = 10
+# script errors drivers report when the document goes away during an async script
+_NAVIGATION_ERROR_MARKERS = ("unload", "context was destroyed", "navigat", "document was replaced")
+_NAVIGATION_RETRY_DELAY = 0.05
+# script errors of the find helper for locators the polling engine rejects up front
+_INVALID_LOCATOR_MARKERS = ("valid selector", "valid xpath", "unsupported locator")
+
+register_script(
+    "matchLocators",
+    """
+function (locators, mode) {
+    var matches = [];
+    for (var i = 0; i < locators.length; i++) {
+        var elements = ws.findAll(locators[i][0], locators[i][1]);
+        var matched = locators[i][2] ? elements.length === 0 : elements.length > 0;
+        if (mode === 'any' && matched) { return [i, elements]; }
+        if (mode === 'all' && !matched) { return null; }
+        matches.push(elements);
+    }
+    return mode === 'all' ? matches : null;
+}
+""",
+)
+
+register_script(
+    "observeElement",
+    """
+function (by, value, timeoutMs, done) {
+    var found = ws.find(by, value);
+    if (found) { return done(found); }
+    var finished = false;
+    var timer = null;
+    var observer = new MutationObserver(function () {
+        var element = ws.find(by, value);
+        if (element) { finish(element); }
+    });
+    function finish(result) {
+        if (finished) { return; }
+        finished = true;
+        observer.disconnect();
+        clearTimeout(timer);
+        done(result);
+    }
+    observer.observe(document, {childList: true, subtree: true, attributes: true});
+    timer = setTimeout(function () { finish(null); }, timeoutMs);
+}
+""",
+)
+
+
+class Absent(NamedTuple):
+    """Wraps a locator for wait_for_any/wait_for_all to match once no element
+    matches it anymore"""
+
+    locator: Tuple[By, str]
+
+
+class LocatorMatch(NamedTuple):
+    """A locator matched by wait_for_any/wait_for_all"""
+
+    index: int
+    locator: Union[Tuple[By, str], Absent]
+    elements: list
+
+
+class WaitEngine(Enum):
+    """How existence waits detect an element"""
+
+    POLLING = "polling"
+    MUTATION_OBSERVER = "mutation_observer"
+
+
+class PollStrategy(ABC):
+    """Decides how long a wait sleeps between two polls"""
+
+    @abstractmethod
+    def next_interval(self, attempt: int, elapsed: float, timeout: float) -> float:
+        """Seconds to sleep after the given poll
+
+        Args:
+            attempt (int): 0 for the first poll
+            elapsed (float): seconds since the wait started
+            timeout (float)
+
+        Returns:
+            float
+        """
+
+
+class FixedPoll(PollStrategy):
+    """Sleep the same interval between every poll"""
+
+    def __init__(self, interval: float = POLL_FREQUENCY):
+        self.interval = interval
+
+    def next_interval(self, attempt: int, elapsed: float, timeout: float) -> float:
+        return self.interval
+
+
+class ExponentialBackoffPoll(PollStrategy):
+    """Start with a few milliseconds and multiply the interval after every
+    poll, up to a maximum"""
+
+    def __init__(self, initial: float = 0.005, factor: float = 2.0, maximum: float = 0.5):
+        self.initial = initial
+        self.factor = factor
+        self.maximum = maximum
+
+    def next_interval(self, attempt: int, elapsed: float, timeout: float) -> float:
+        return min(self.initial * self.factor**attempt, self.maximum)
+
+
+class BudgetPoll(PollStrategy):
+    """Back off exponentially from a few milliseconds, but never poll more than
+    max_polls times over the whole timeout"""
+
+    def __init__(self, max_polls: int = 20, initial: float = 0.005, factor: float = 2.0):
+        self.max_polls = max_polls
+        self.initial = initial
+        self.factor = factor
+
+    def next_interval(self, attempt: int, elapsed: float, timeout: float) -> float:
+        polls_left = max(self.max_polls - attempt - 1, 1)
+        spread = max(timeout - elapsed, 0) / polls_left
+        return max(self.initial * self.factor**attempt, spread)
+
+
+_default_poll: PollStrategy = FixedPoll()
+_default_engine: WaitEngine = WaitEngine.POLLING
+_default_ignored_exceptions: Tuple[Type[Exception], ...] = ()
+
+
+def set_default_poll_strategy(poll: PollStrategy):
+    """Use the given strategy for every wait that does not pass its own
+
+    Args:
+        poll (PollStrategy)
+    """
+    global _default_poll  # pylint: disable=global-statement
+    _default_poll = poll
+
+
+def get_default_poll_strategy() -> PollStrategy:
+    """Strategy used by waits that do not pass their own
+
+    Returns:
+        PollStrategy
+    """
+    return _default_poll
+
+
+def set_default_ignored_exceptions(ignored_exceptions: IgnoredExceptions):
+    """Exceptions ignored while polling by every wait that does not pass its own
+
+    Args:
+        ignored_exceptions (Optional[Iterable[Type[Exception]]])
+    """
+    global _default_ignored_exceptions  # pylint: disable=global-statement
+    _default_ignored_exceptions = tuple(ignored_exceptions or ())
+
+
+def set_default_wait_engine(engine: WaitEngine):
+    """Use the given engine for every existence wait that does not pass its own
+
+    Args:
+        engine (WaitEngine)
+    """
+    global _default_engine  # pylint: disable=global-statement
+    _default_engine = engine
+
+
+class AdaptiveWait(WebDriverWait):
+    """WebDriverWait that sleeps according to a PollStrategy"""
+
+    def __init__(
+        self,
+        driver,
+        timeout: float,
+        poll: Optional[PollStrategy] = None,
+        ignored_exceptions: IgnoredExceptions = None,
+    ):
+        """
+        Args:
+            driver (Union[WebDriver, WebElement])
+            timeout (float)
+            poll (Optional[PollStrategy], optional): Defaults to the global strategy.
+            ignored_exceptions (IgnoredExceptions, optional): Defaults to the
+                global set, NoSuchElementException is always ignored.
+        """
+        if ignored_exceptions is None:
+            ignored_exceptions = _default_ignored_exceptions
+        super().__init__(driver, timeout, ignored_exceptions=ignored_exceptions)
+        self._strategy = poll or _default_poll
+
+    def until(self, method: Callable, message: str = ""):
+        return self._poll_until(method, message, expected=True)
+
+    def until_not(self, method: Callable, message: str = ""):
+        return self._poll_until(method, message, expected=False)
+
+    def _poll_until(self, method: Callable, message: str, expected: bool):
+        screen = None
+        stacktrace = None
+        start = time.monotonic()
+        end_time = start + self._timeout
+        attempt = 0
+        while True:
+            try:
+                value = method(self._driver)
+                if bool(value) is expected:
+                    return value
+            except self._ignored_exceptions as exc:
+                if not expected:
+                    return True
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            now = time.monotonic()
+            if now >= end_time:
+                break
+            interval = self._strategy.next_interval(attempt, now - start, self._timeout)
+            time.sleep(min(interval, end_time - now))
+            attempt += 1
+        raise TimeoutException(message, screen, stacktrace)
+
+
+def wait_for_element_to_be_clickable(
+    web_element: WebElement,
+    timeout: int,
+    poll: Optional[PollStrategy] = None,
+    ignored_exceptions: IgnoredExceptions = None,
+    raise_on_stale: bool = False,
+):
     """wait for an element to be clickable
 
     Args:
         web_element (WebElement)
         timeout (int)
+        poll (Optional[PollStrategy], optional): Defaults to the global strategy.
+        ignored_exceptions (IgnoredExceptions, optional): Defaults to the global set.
+        raise_on_stale (bool, optional): raise StaleElementReferenceException at once
+            instead of waiting out the timeout on a detached element. Defaults to False.
+
+    Raises:
+        StaleElementReferenceException: when raise_on_stale and the element is detached
     """
-    wait = WebDriverWait(web_element, timeout)
-    wait.until(EC.element_to_be_clickable(web_element))
+    wait = AdaptiveWait(web_element, timeout, poll, ignored_exceptions)
+    if raise_on_stale:
+        wait.until(_clickable_or_stale(web_element))
+    else:
+        wait.until(EC.element_to_be_clickable(web_element))
 
-def wait_for_element_to_be_in_viewport(web_element: WebElement, timeout: int):
+def wait_for_element_to_be_in_viewport(
+    web_element: WebElement,
+    timeout: int,
+    poll: Optional[PollStrategy] = None,
+    ignored_exceptions: IgnoredExceptions = None,
+):
     """wait for an element to be in the viewport
 
     Args:
         web_element (WebElement)
         timeout (int)
+        poll (Optional[PollStrategy], optional): Defaults to the global strategy.
+        ignored_exceptions (IgnoredExceptions, optional): Defaults to the global set.
     """
-    wait = WebDriverWait(web_element, timeout)
+    wait = AdaptiveWait(web_element, timeout, poll, ignored_exceptions)
     wait.until(_in_viewport(web_element))
 
-def wait_for_element_to_exist(driver: WebDriver, locator :Tuple[By, str], timeout: int):
-    wait = WebDriverWait(driver, timeout)
-    wait.until(EC.presence_of_element_located(locator))
+def wait_for_element_to_exist(
+    driver: WebDriver,
+    locator: Tuple[By, str],
+    timeout: int,
+    poll: Optional[PollStrategy] = None,
+    ignored_exceptions: IgnoredExceptions = None,
+    engine: Optional[WaitEngine] = None,
+) -> WebElement:
+    """wait for an element matching the locator to be in the DOM. The
+    mutation observer engine waits inside the page and costs one round trip
+    instead of one per poll.
 
-def wait_for_alert(driver: WebDriver, timeout: int):
-    wait = WebDriverWait(driver, timeout)
+    Args:
+        driver (WebDriver)
+        locator (Tuple[By, str])
+        timeout (int)
+        poll (Optional[PollStrategy], optional): Defaults to the global strategy.
+        ignored_exceptions (IgnoredExceptions, optional): Defaults to the global set.
+        engine (Optional[WaitEngine], optional): Defaults to the global engine.
+
+    Raises:
+        TimeoutException:
+
+    Returns:
+        WebElement: the first matching element
+    """
+    if (engine or _default_engine) is WaitEngine.MUTATION_OBSERVER:
+        return _observe_element(driver, locator, timeout)
+    wait = AdaptiveWait(driver, timeout, poll, ignored_exceptions)
+    return wait.until(EC.presence_of_element_located(locator))
+
+def wait_for_elements_to_exist(
+    driver: WebDriver,
+    locator: Tuple[By, str],
+    timeout: int,
+    poll: Optional[PollStrategy] = None,
+    ignored_exceptions: IgnoredExceptions = None,
+) -> List[WebElement]:
+    """wait for at least one element matching the locator to be in the DOM.
+    Each poll finds every match, so the result needs no second lookup.
+
+    Args:
+        driver (WebDriver)
+        locator (Tuple[By, str])
+        timeout (int)
+        poll (Optional[PollStrategy], optional): Defaults to the global strategy.
+        ignored_exceptions (IgnoredExceptions, optional): Defaults to the global set.
+
+    Raises:
+        TimeoutException:
+
+    Returns:
+        List[WebElement]: every matching element
+    """
+    wait = AdaptiveWait(driver, timeout, poll, ignored_exceptions)
+    return wait.until(EC.presence_of_all_elements_located(locator))
+
+def wait_for_alert(
+    driver: WebDriver,
+    timeout: int,
+    poll: Optional[PollStrategy] = None,
+    ignored_exceptions: IgnoredExceptions = None,
+):
+    wait = AdaptiveWait(driver, timeout, poll, ignored_exceptions)
     return wait.until(EC.alert_is_present())
 
+def wait_for_any(
+    driver: WebDriver,
+    locators: List[Union[Tuple[By, str], Absent]],
+    timeout: int,
+    poll: Optional[PollStrategy] = None,
+    ignored_exceptions: IgnoredExceptions = None,
+) -> LocatorMatch:
+    """wait until one of the locators matches, checking all of them in a
+    single script per poll. Locators wrapped in Absent match when nothing
+    on the page matches them.
+
+    Args:
+        driver (WebDriver)
+        locators (List[Union[Tuple[By, str], Absent]])
+        timeout (int)
+        poll (Optional[PollStrategy], optional): Defaults to the global strategy.
+        ignored_exceptions (IgnoredExceptions, optional): Defaults to the global set.
+
+    Raises:
+        ValueError: when no locators are given, nothing could ever match
+        TimeoutException:
+
+    Returns:
+        LocatorMatch: the first locator in list order that matched, with its
+            elements wrapped as Element
+    """
+    if not locators:
+        raise ValueError("wait_for_any needs at least one locator")
+    wait = AdaptiveWait(driver, timeout, poll, ignored_exceptions)
+    index, elements = wait.until(
+        _match_locators(locators, "any"), f"None of {locators} matched"
+    )
+    return _locator_match(locators, index, elements)
+
+def wait_for_all(
+    driver: WebDriver,
+    locators: List[Union[Tuple[By, str], Absent]],
+    timeout: int,
+    poll: Optional[PollStrategy] = None,
+    ignored_exceptions: IgnoredExceptions = None,
+) -> List[LocatorMatch]:
+    """wait until every locator matches at the same time, checking all of them
+    in a single script per poll. Locators wrapped in Absent match when nothing
+    on the page matches them.
+
+    Args:
+        driver (WebDriver)
+        locators (List[Union[Tuple[By, str], Absent]])
+        timeout (int)
+        poll (Optional[PollStrategy], optional): Defaults to the global strategy.
+        ignored_exceptions (IgnoredExceptions, optional): Defaults to the global set.
+
+    Raises:
+        TimeoutException:
+
+    Returns:
+        List[LocatorMatch]: one match per locator, in list order, empty right
+            away when no locators are given
+    """
+    if not locators:
+        return []
+    wait = AdaptiveWait(driver, timeout, poll, ignored_exceptions)
+    matches = wait.until(_match_locators(locators, "all"), f"Not all of {locators} matched")
+    return [
+        _locator_match(locators, index, elements) for index, elements in enumerate(matches)
+    ]
+
+def _match_locators(locators: List[Union[Tuple[By, str], Absent]], mode: str):
+    payload = [
+        [locator.locator[0], locator.locator[1], True]
+        if isinstance(locator, Absent)
+        else [locator[0], locator[1], False]
+        for locator in locators
+    ]
+
+    def _predicate(driver: WebDriver):
+        return call_script(driver, "matchLocators", payload, mode)
+    return _predicate
+
+def _locator_match(
+    locators: List[Union[Tuple[By, str], Absent]], index: int, elements: List[WebElement]
+) -> LocatorMatch:
+    # imported here, element imports this module
+    from webserpent.selenium.element import Element  # pylint: disable=import-outside-toplevel
+
+    locator = locators[index]
+    name = locator.locator[1] if isinstance(locator, Absent) else locator[1]
+    return LocatorMatch(
+        index,
+        locator,
+        [Element(element, f"{name}[{i}]") for i, element in enumerate(elements)],
+    )
+
+def _observe_element(driver: WebDriver, locator: Tuple[By, str], timeout: float) -> WebElement:
+    """Wait for the locator with an in-page MutationObserver. Long waits are
+    split into slices, and a slice interrupted by a navigation is retried."""
+    end_time = time.monotonic() + timeout
+    while True:
+        remaining = max(end_time - time.monotonic(), 0)
+        try:
+            element = call_async_script(
+                driver,
+                "observeElement",
+                locator[0],
+                locator[1],
+                int(min(remaining, _OBSERVER_SLICE) * 1000),
+            )
+            if element:
+                return element
+        except TimeoutException:
+            # the driver script timeout cut the slice short
+            pass
+        except JavascriptException as e:
+            if not _is_navigation_error(e):
+                if any(marker in str(e).lower() for marker in _INVALID_LOCATOR_MARKERS):
+                    raise InvalidSelectorException(str(e)) from e
+                raise
+            # the document was replaced while the slice was waiting, wait in the new one
+            time.sleep(min(_NAVIGATION_RETRY_DELAY, max(end_time - time.monotonic(), 0)))
+        if time.monotonic() >= end_time:
+            raise TimeoutException(f"No element found for locator {locator}")
+
+def _is_navigation_error(error: JavascriptException) -> bool:
+    message = str(error).lower()
+    return any(marker in message for marker in _NAVIGATION_ERROR_MARKERS)
+
+def _clickable_or_stale(web_element: WebElement):
+    """Same check as EC.element_to_be_clickable, but lets staleness propagate"""
+    def _predicate(_):
+        if web_element.is_displayed() and web_element.is_enabled():
+            return web_element
+        return False
+    return _predicate
+
 def _in_viewport(web_element: WebElement):
     """Returns if element is in viewport"""
     def _predicate(web_element: WebElement):
-        # Use JavaScript to check if the element is in the viewport
-        element_rect = web_element.parent.execute_script(
-            """
-            var rect = arguments[0].getBoundingClientRect();
-            var viewWidth = window.innerWidth || document.documentElement.clientWidth;
-            var viewHeight = window.innerHeight || document.documentElement.clientHeight;
-            return {
-                top: rect.top >= 0 && rect.top < viewHeight,
-                bottom: rect.bottom <= viewHeight,
-                left: rect.left >= 0 && rect.left < viewWidth,
-                right: rect.right <= viewWidth
-            };
-        """,
-            web_element,
-        )
-
-        # Return True if all four sides of the element are within the viewport
-        is_true = (
-            element_rect["top"]
-            and element_rect["bottom"]
-            and element_rect["left"]
-            and element_rect["right"]
-        )
-        return is_true
+        return call_script(web_element.parent, "inViewport", web_element)
     return _predicate